@@ -0,0 +1,122 @@
+"""
+Equivalence check for the Q&A answer matcher
+
+AnswerMatcher.matches tries word overlap before sequence matching and gates
+SequenceMatcher.ratio() behind real_quick_ratio() and quick_ratio(). This script
+compares it with the ungated check it replaced, applied to the same normalized
+answers, over a seeded random corpus weighted towards guesses near the 0.7
+similarity threshold. It exits non-zero on any differing decision.
+
+Usage: python check_answer_matcher.py [pairs]
+"""
+
+import random
+import string
+import sys
+import time
+from difflib import SequenceMatcher
+
+from railway_bot import (
+    ANSWER_SIMILARITY_THRESHOLD, ANSWER_WORD_OVERLAP, WORD_PATTERN, AnswerMatcher, normalize_answer
+)
+
+WORDS = [
+    'paris', 'the', 'capital', 'of', 'france', 'blue', 'whale', 'mount', 'everest', 'seven',
+    'shakespeare', 'water', 'h2o', 'einstein', 'python', 'apple', 'banana', 'twenty', 'one', 'hundred'
+]
+
+# Length pairs that put real_quick_ratio() exactly on the threshold, plus a few hand-picked guesses
+EDGE_CASES = [
+    ('abcdefg', 'abcdefgxyzuvw'),
+    ('abcdefg', 'abcdefgxyzuvwq'),
+    ('mount everest', 'mt everest'),
+    ('shakespeare', 'shakespear'),
+    ('h2o', 'water'),
+    ('twenty one', '21'),
+    ('the blue whale', 'a whale'),
+    ('!!!', '???')
+]
+
+
+def ungated_matches(correct_answer, user_answer):
+    """The check AnswerMatcher replaced: always compute ratio(), then word overlap"""
+    correct = normalize_answer(correct_answer)
+    guess = normalize_answer(user_answer)
+
+    if correct == guess:
+        return True
+
+    if guess in correct or correct in guess:
+        return True
+
+    if SequenceMatcher(None, correct, guess).ratio() >= ANSWER_SIMILARITY_THRESHOLD:
+        return True
+
+    correct_words = set(WORD_PATTERN.findall(correct))
+    common_words = correct_words.intersection(WORD_PATTERN.findall(guess))
+    return len(common_words) > 0 and len(common_words) >= len(correct_words) * ANSWER_WORD_OVERLAP
+
+
+def phrase(rng, max_words):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, max_words)))
+
+
+def mutate(rng, text):
+    """Random character deletions, insertions and substitutions, roughly a quarter of the length"""
+    chars = list(text)
+    for _ in range(rng.randint(0, max(1, len(chars) // 4))):
+        operation = rng.random()
+        position = rng.randrange(len(chars) + 1)
+        if operation < 0.4 and chars:
+            chars.pop(min(position, len(chars) - 1))
+        elif operation < 0.8:
+            chars.insert(position, rng.choice(string.ascii_lowercase + ' '))
+        elif chars:
+            chars[min(position, len(chars) - 1)] = rng.choice(string.ascii_lowercase)
+    return ''.join(chars)
+
+
+def build_corpus(size, seed=1):
+    """Half random pairs, half guesses whose normalized ratio lands within 0.1 of the threshold"""
+    rng = random.Random(seed)
+    corpus = list(EDGE_CASES)
+    near_threshold = 0
+
+    while len(corpus) < size:
+        correct = phrase(rng, 30)
+        guess = mutate(rng, correct) if rng.random() < 0.5 else phrase(rng, 30)
+        if rng.random() < 0.2:
+            guess = guess.upper()
+
+        ratio = SequenceMatcher(None, normalize_answer(correct), normalize_answer(guess)).ratio()
+        if abs(ratio - ANSWER_SIMILARITY_THRESHOLD) <= 0.1:
+            near_threshold += 1
+        elif near_threshold < len(corpus) // 2:
+            continue  # Keep the corpus weighted towards the threshold
+        corpus.append((correct, guess))
+    return corpus, near_threshold
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    corpus, near_threshold = build_corpus(size)
+
+    start = time.perf_counter()
+    expected = [ungated_matches(correct, guess) for correct, guess in corpus]
+    ungated_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [AnswerMatcher(correct).matches(guess) for correct, guess in corpus]
+    gated_seconds = time.perf_counter() - start
+
+    mismatches = [pair for pair, old, new in zip(corpus, expected, actual) if old != new]
+    print(f"{len(corpus)} pairs ({near_threshold} within 0.1 of the threshold), {sum(expected)} accepted")
+    print(f"ungated {ungated_seconds:.2f}s, gated {gated_seconds:.2f}s")
+    for correct, guess in mismatches[:10]:
+        print(f"MISMATCH: {correct!r} vs {guess!r}")
+    print(f"{len(mismatches)} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
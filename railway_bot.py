@@ -4,7 +4,10 @@ Based on tested simple_local_bot.py with all your fixes
 Includes health server for Railway deployment
 """
 
+import heapq
+import html
 import logging
+import mmap
 import os
 import random
 import time
@@ -12,63 +15,595 @@ import requests
 import re
 import threading
 import asyncio
+import unicodedata
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
 from aiohttp import web
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+class TelegramAPIError(Exception):
+    """Bot API request rejected by Telegram (ok=false response)"""
+
+    def __init__(self, method, error_code, description, retry_after=None):
+        super().__init__(f"{method} failed with {error_code}: {description}")
+        self.method = method
+        self.error_code = error_code
+        self.description = description or ''
+        self.retry_after = retry_after
+
+    @property
+    def is_blocked(self):
+        """403: bot blocked, kicked, or the user account was deactivated"""
+        return self.error_code == 403
+
+    @property
+    def is_chat_not_found(self):
+        return self.error_code == 400 and 'chat not found' in self.description.lower()
+
+    @property
+    def is_dead_chat(self):
+        return self.is_blocked or self.is_chat_not_found
+
+    @property
+    def is_rate_limited(self):
+        return self.error_code == 429
+
 def generate_session_id():
     """Generate unique session ID"""
-    return f"session_{int(time.time())}_{random.randint(1000, 9999)}"
+    # Tournament rounds create many sessions within the same second, so re-roll on collision
+    while True:
+        session_id = f"session_{int(time.time())}_{random.randint(1000, 9999)}"
+        if all(session_id not in registry for registry in (multiplayer_sessions, finished_sessions, tournaments, royale_games)):
+            return session_id
 
-def determine_rps_winner(choice1, choice2):
-    """Determine Rock Paper Scissors winner with Gun/Judo rules"""
-    if choice1 == choice2:
-        return "tie"
-    
-    winning_combinations = {
-        ("rock", "scissors"): "choice1",
-        ("rock", "judo"): "choice1",
-        ("paper", "rock"): "choice1", 
-        ("paper", "gun"): "choice1",
-        ("scissors", "paper"): "choice1",
-        ("scissors", "judo"): "choice1",
-        ("gun", "rock"): "choice1",
-        ("gun", "scissors"): "choice1",
-        ("judo", "paper"): "choice1",
-        ("judo", "gun"): "choice1"
+# Rock Paper Scissors rule sets, defined once as data. 'weapons' lists (name, emoji) in order;
+# 'beats' names what each weapon defeats, or is left out for a balanced cycle in which
+# every weapon beats the next half of the list. Everything else is compiled from this.
+RPS_VARIANTS = {
+    'classic': {
+        'name': 'Classic',
+        'weapons': [('rock', '🪨'), ('scissors', '✂️'), ('paper', '📄')]
+    },
+    'gunjudo': {
+        'name': 'Gun & Judo',
+        'weapons': [('rock', '🪨'), ('paper', '📄'), ('scissors', '✂️'), ('gun', '🔫'), ('judo', '🥋')],
+        'beats': {
+            'rock': ['scissors', 'judo'],
+            'paper': ['rock', 'gun'],
+            'scissors': ['paper', 'judo'],
+            'gun': ['rock', 'scissors'],
+            'judo': ['paper', 'gun']
+        }
+    },
+    'rps7': {
+        'name': 'RPS-7',
+        'weapons': [('rock', '🪨'), ('fire', '🔥'), ('scissors', '✂️'), ('sponge', '🧽'),
+                    ('paper', '📄'), ('air', '💨'), ('water', '💧')]
+    },
+    'rps15': {
+        'name': 'RPS-15',
+        'weapons': [('rock', '🪨'), ('fire', '🔥'), ('scissors', '✂️'), ('snake', '🐍'), ('human', '🧍'),
+                    ('tree', '🌳'), ('wolf', '🐺'), ('sponge', '🧽'), ('paper', '📄'), ('air', '💨'),
+                    ('water', '💧'), ('dragon', '🐉'), ('devil', '😈'), ('lightning', '⚡'), ('gun', '🔫')]
     }
-    
-    result = winning_combinations.get((choice1, choice2))
-    if result:
-        return result
-    else:
-        return "choice2"
+}
+RPS_DEFAULT_VARIANT = 'gunjudo'
 
-def check_answer_similarity(correct_answer, user_answer):
-    """Check if user answer is similar to correct answer"""
-    correct_lower = correct_answer.lower().strip()
-    user_lower = user_answer.lower().strip()
+def compile_rps_variant(variant):
+    """Compile a rule set into an integer outcome table plus its rules text and keyboard layout"""
+    weapons = [name for name, _ in variant['weapons']]
+    emojis = dict(variant['weapons'])
+    size = len(weapons)
+    position = {name: index for index, name in enumerate(weapons)}
+    beats = variant.get('beats') or {
+        name: [weapons[(index + step) % size] for step in range(1, size // 2 + 1)]
+        for index, name in enumerate(weapons)
+    }
     
-    if correct_lower == user_lower:
-        return True
+    # outcomes[a][b]: 1 if weapon a beats weapon b, -1 if it loses, 0 on a tie
+    outcomes = [[0] * size for _ in range(size)]
+    for winner, losers in beats.items():
+        for loser in losers:
+            if winner == loser or outcomes[position[winner]][position[loser]]:
+                raise ValueError(f"{variant['name']}: conflicting rule {winner} beats {loser}")
+            outcomes[position[winner]][position[loser]] = 1
+            outcomes[position[loser]][position[winner]] = -1
+    for a in range(size):
+        for b in range(size):
+            if a != b and not outcomes[a][b]:
+                raise ValueError(f"{variant['name']}: no rule for {weapons[a]} vs {weapons[b]}")
+    if any('_' in name for name in weapons):
+        raise ValueError(f"{variant['name']}: weapon names go into callback data and can't contain '_'")
     
-    if user_lower in correct_lower or correct_lower in user_lower:
-        return True
+    def and_join(names):
+        return names[0] if len(names) == 1 else f"{', '.join(names[:-1])} & {names[-1]}"
     
-    similarity = SequenceMatcher(None, correct_lower, user_lower).ratio()
-    if similarity >= 0.7:
-        return True
+    rules_text = "📋 <b>Game Rules:</b>\n" + "".join(
+        f"{emojis[name]} {name.title()} beats {and_join([loser.title() for loser in beats[name]])}\n"
+        for name in weapons
+    ) + "\n"
+    row_size = 2 if size <= 5 else 3
+    button_rows = [weapons[start:start + row_size] for start in range(0, size, row_size)]
     
-    correct_words = set(re.findall(r'\b\w+\b', correct_lower))
-    user_words = set(re.findall(r'\b\w+\b', user_lower))
+    return {
+        'name': variant['name'],
+        'weapons': weapons,
+        'emojis': emojis,
+        'position': position,
+        'outcomes': outcomes,
+        'rules_text': rules_text,
+        'button_rows': button_rows
+    }
+
+RPS_RULES = {key: compile_rps_variant(variant) for key, variant in RPS_VARIANTS.items()}
+RPS_EMOJIS = {name: emoji for rules in RPS_RULES.values() for name, emoji in rules['emojis'].items()}
+
+def determine_rps_winner(choice1, choice2, variant=RPS_DEFAULT_VARIANT):
+    """Determine Rock Paper Scissors winner under the given rule set"""
+    rules = RPS_RULES[variant]
+    outcome = rules['outcomes'][rules['position'][choice1]][rules['position'][choice2]]
+    if outcome == 0:
+        return "tie"
+    return "choice1" if outcome > 0 else "choice2"
+
+def resolve_royale_round(choices, outcomes):
+    """Resolve an all-vs-all RPS round from {user_id: weapon index}; returns (survivors, weapon counts)"""
+    # Every player meets every other player, so only the weapon histogram matters:
+    # a weapon's net score is its outcome row dotted with the counts, O(players + weapons^2)
+    counts = [0] * len(outcomes)
+    for weapon in choices.values():
+        counts[weapon] += 1
+    net = [sum(outcome * count for outcome, count in zip(row, counts)) for row in outcomes]
     
-    common_words = correct_words.intersection(user_words)
-    if len(common_words) > 0 and len(common_words) >= len(correct_words) * 0.6:
-        return True
+    best = max(net[weapon] for weapon in set(choices.values()))
+    survivors = [user_id for user_id, weapon in choices.items() if net[weapon] == best]
+    return survivors, counts
+
+def reaction_points(reaction_time):
+    """Points for a green-round tap, from 100 at 0.5s down to a floor of 10"""
+    if reaction_time <= 0.5:
+        points = 100
+    elif reaction_time <= 1.0:
+        points = 100 - (reaction_time - 0.5) * 50
+    elif reaction_time <= 2.0:
+        points = 75 - (reaction_time - 1.0) * 45
+    elif reaction_time <= 3.0:
+        points = 30 - (reaction_time - 2.0) * 20
+    else:
+        points = 10
+    return max(10, int(points))
+
+ANSWER_SIMILARITY_THRESHOLD = 0.7
+ANSWER_WORD_OVERLAP = 0.6
+WORD_PATTERN = re.compile(r'\b\w+\b')
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]|_')
+
+ANSWER_STOP_WORDS = {
+    'a', 'an', 'the', 'of', 'and', 'or', 'is', 'are', 'was', 'were',
+    'it', 'its', 'in', 'on', 'at', 'to', 'for', 'by', 'my', 'your'
+}
+NUMBER_WORDS = {
+    'zero': 0, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6,
+    'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10, 'eleven': 11, 'twelve': 12,
+    'thirteen': 13, 'fourteen': 14, 'fifteen': 15, 'sixteen': 16, 'seventeen': 17,
+    'eighteen': 18, 'nineteen': 19, 'twenty': 20, 'thirty': 30, 'forty': 40,
+    'fifty': 50, 'sixty': 60, 'seventy': 70, 'eighty': 80, 'ninety': 90
+}
+NUMBER_SCALES = {'hundred': 100, 'thousand': 1000, 'million': 1000000}
+
+def canonicalize_numbers(tokens):
+    """Replace number phrases ("twenty one", "two hundred and five") with digits ("21", "205")
+
+    Words only combine as tens + units or around scale words; "one two" stays "1 2".
+    """
+    canonical = []
+    total = current = 0
+    last = None  # 'unit', 'teen', 'tens', 'zero' or 'scale' while inside a number phrase
     
-    return False
+    for token in tokens:
+        value = NUMBER_WORDS.get(token)
+        scale = NUMBER_SCALES.get(token)
+        if value is not None:
+            kind = 'zero' if value == 0 else 'unit' if value < 10 else 'teen' if value < 20 else 'tens'
+            joins = (kind == 'unit' and last in ('tens', 'scale')) or (kind in ('teen', 'tens') and last == 'scale')
+            if last is not None and not joins:
+                canonical.append(str(total + current))
+                total = current = 0
+            current += value
+            last = kind
+        elif scale == 100 and last in ('unit', 'teen', 'tens') and current < 100:
+            current *= scale
+            last = 'scale'
+        elif scale and scale > 100 and last not in (None, 'zero') and current:
+            total += current * scale
+            current = 0
+            last = 'scale'
+        elif token == 'and' and last == 'scale':
+            continue  # "two hundred and five"
+        else:
+            if last is not None:
+                canonical.append(str(total + current))
+                total = current = 0
+                last = None
+            canonical.append(token)
+    
+    if last is not None:
+        canonical.append(str(total + current))
+    return canonical
+
+def normalize_answer(text):
+    """Casefold, strip accents/width variants and punctuation, canonicalize numbers, drop stop words"""
+    folded = fold_text(text)
+    tokens = canonicalize_numbers(PUNCTUATION_PATTERN.sub(' ', folded).split())
+    
+    content_tokens = [token for token in tokens if token not in ANSWER_STOP_WORDS]
+    normalized = ' '.join(content_tokens or tokens)
+    # Answers made only of punctuation still need something to compare
+    return normalized or text.casefold().strip()
+
+class AnswerMatcher:
+    """Fuzzy matcher for one correct answer, normalized once per round"""
+
+    def __init__(self, correct_answer):
+        self.correct = normalize_answer(correct_answer)
+        self.correct_words = set(WORD_PATTERN.findall(self.correct))
+        self.required_common_words = len(self.correct_words) * ANSWER_WORD_OVERLAP
+
+    def matches(self, user_answer):
+        """Check if a guess is similar to the correct answer"""
+        correct = self.correct
+        guess = normalize_answer(user_answer)
+        
+        # Most correct guesses resolve here once both sides are normalized
+        if correct == guess:
+            return True
+        
+        if guess in correct or correct in guess:
+            return True
+        
+        # Word overlap is a cheap set check, so try it before any sequence matching
+        common_words = self.correct_words.intersection(WORD_PATTERN.findall(guess))
+        if len(common_words) > 0 and len(common_words) >= self.required_common_words:
+            return True
+        
+        # real_quick_ratio (lengths only) and quick_ratio (character counts) are upper
+        # bounds of ratio(), so the O(n*m) ratio only runs when 0.7 is still reachable
+        sequence_matcher = SequenceMatcher(None, correct, guess)
+        return (
+            sequence_matcher.real_quick_ratio() >= ANSWER_SIMILARITY_THRESHOLD
+            and sequence_matcher.quick_ratio() >= ANSWER_SIMILARITY_THRESHOLD
+            and sequence_matcher.ratio() >= ANSWER_SIMILARITY_THRESHOLD
+        )
+
+def check_answer_similarity(correct_answer, user_answer):
+    """Check if user answer is similar to correct answer"""
+    return AnswerMatcher(correct_answer).matches(user_answer)
+
+def fold_text(text):
+    """Casefold and strip accents so filters see one canonical spelling"""
+    folded = unicodedata.normalize('NFKD', text.casefold())
+    return ''.join(char for char in folded if not unicodedata.combining(char))
+
+class AhoCorasickFilter:
+    """Precompiled Aho-Corasick automaton matching whole words/phrases in linear time"""
+
+    def __init__(self, patterns):
+        self.transitions = [{}]  # node -> {char: next node}
+        self.fail = [0]
+        self.outputs = [()]  # node -> lengths of patterns ending here (incl. via fail links)
+        
+        for pattern in patterns:
+            node = 0
+            for char in pattern:
+                next_node = self.transitions[node].get(char)
+                if next_node is None:
+                    next_node = len(self.transitions)
+                    self.transitions[node][char] = next_node
+                    self.transitions.append({})
+                    self.fail.append(0)
+                    self.outputs.append(())
+                node = next_node
+            self.outputs[node] += (len(pattern),)
+        
+        # Breadth-first fail links; outputs inherit from the fail target
+        queue = list(self.transitions[0].values())
+        for node in queue:
+            for char, next_node in self.transitions[node].items():
+                fallback = self.fail[node]
+                while fallback and char not in self.transitions[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.transitions[fallback].get(char, 0)
+                self.fail[next_node] = target if target != next_node else 0
+                self.outputs[next_node] += self.outputs[self.fail[next_node]]
+                queue.append(next_node)
+
+    def contains_match(self, text):
+        """Check folded text for any pattern that starts and ends on a word boundary"""
+        transitions, fail, outputs = self.transitions, self.fail, self.outputs
+        text_length = len(text)
+        node = 0
+        
+        for position, char in enumerate(text):
+            while node and char not in transitions[node]:
+                node = fail[node]
+            node = transitions[node].get(char, 0)
+            
+            for length in outputs[node]:
+                start = position - length + 1
+                if (start == 0 or not text[start - 1].isalnum()) and \
+                        (position + 1 == text_length or not text[position + 1].isalnum()):
+                    return True
+        return False
+
+class ContentFilter:
+    """Blocklist filter that rebuilds its automaton only when the list file changes"""
+
+    def __init__(self, path, reload_interval):
+        self.path = path
+        self.reload_interval = reload_interval
+        self.automaton = AhoCorasickFilter([])
+        self.loaded_mtime = None
+        self.next_check = 0
+        self.lock = threading.Lock()
+
+    def reload_if_changed(self):
+        now = time.monotonic()
+        if now < self.next_check:
+            return
+        
+        with self.lock:
+            if now < self.next_check:
+                return
+            self.next_check = now + self.reload_interval
+            try:
+                mtime = os.stat(self.path).st_mtime
+                if mtime == self.loaded_mtime:
+                    return
+                with open(self.path, encoding='utf-8') as blocklist_file:
+                    patterns = {
+                        fold_text(line.strip()) for line in blocklist_file
+                        if line.strip() and not line.startswith('#')
+                    }
+            except OSError as e:
+                logger.error(f"Error loading blocklist {self.path}: {e}")
+                return
+            
+            # Swap in the new automaton; in-flight checks keep using the old one
+            self.automaton = AhoCorasickFilter(sorted(patterns))
+            self.loaded_mtime = mtime
+            logger.info(f"Loaded {len(patterns)} blocked words from {self.path}")
+
+    def is_blocked(self, text):
+        self.reload_if_changed()
+        return self.automaton.contains_match(fold_text(text))
+
+class TurnScheduler:
+    """Single background thread running deadline callbacks from a heap"""
+
+    def __init__(self):
+        self.heap = []  # (deadline, handle, callback)
+        self.pending = set()  # handles not yet run or cancelled
+        self.next_handle = 0
+        self.condition = threading.Condition()
+        self.worker = None
+
+    def schedule(self, delay, callback):
+        """Run callback after delay seconds; returns a handle for cancel()"""
+        with self.condition:
+            if self.worker is None:
+                self.worker = threading.Thread(target=self.run, name='turn-scheduler', daemon=True)
+                self.worker.start()
+            self.next_handle += 1
+            self.pending.add(self.next_handle)
+            heapq.heappush(self.heap, (time.monotonic() + delay, self.next_handle, callback))
+            self.condition.notify()
+            return self.next_handle
+
+    def cancel(self, handle):
+        # Cancelled entries stay in the heap and are skipped when they come due
+        with self.condition:
+            self.pending.discard(handle)
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.heap or self.heap[0][0] > time.monotonic():
+                    self.condition.wait(self.heap[0][0] - time.monotonic() if self.heap else None)
+                _, handle, callback = heapq.heappop(self.heap)
+                if handle not in self.pending:
+                    continue
+                self.pending.discard(handle)
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error in scheduled callback: {e}")
+
+class SpectatorFeed:
+    """Background fan-out of shared spectator views, paced under one global edit budget"""
+
+    def __init__(self, edits_per_second):
+        self.interval = 1.0 / edits_per_second
+        self.pending = OrderedDict()  # session_id -> (text, keyboard, [(chat_id, message_id), ...])
+        self.condition = threading.Condition()
+        self.worker = None
+        self.deliver = None  # callable(chat_id, message_id, text, keyboard), set by the bot
+
+    def publish(self, session_id, text, keyboard, targets):
+        """Queue a rendered view; a newer view of the same session replaces an undelivered one"""
+        with self.condition:
+            if self.worker is None:
+                self.worker = threading.Thread(target=self.run, name='spectator-feed', daemon=True)
+                self.worker.start()
+            self.pending[session_id] = (text, keyboard, targets)
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                session_id, (text, keyboard, targets) = self.pending.popitem(last=False)
+            
+            for chat_id, message_id in targets:
+                if session_id in self.pending:
+                    break  # Superseded mid fan-out; the remaining viewers get the newer view instead
+                try:
+                    self.deliver(chat_id, message_id, text, keyboard)
+                except Exception as e:
+                    logger.error(f"Spectator update failed for {chat_id}: {e}")
+                time.sleep(self.interval)
+
+class RequestRttEstimator:
+    """Per-player round-trip time of the bot's own Bot API requests to that player's chat
+
+    An EWMA of how long the send/edit requests for a player took to return. That is the
+    bot -> api.telegram.org request, not delivery to the player's device, so it is only
+    ever used relative to the other players of the same round.
+    """
+
+    def __init__(self, alpha, max_compensation_seconds, min_samples, capacity):
+        self.alpha = alpha
+        self.max_compensation_ns = int(max_compensation_seconds * 1e9)
+        self.min_samples = min_samples
+        self.capacity = capacity
+        self.estimates = OrderedDict()  # user_id -> [smoothed round trip ns, samples], least recently seen first
+        self.lock = threading.Lock()
+
+    def observe(self, user_id, round_trip_ns):
+        round_trip_ns = max(0, round_trip_ns)
+        with self.lock:
+            entry = self.estimates.pop(user_id, None)
+            if entry is None:
+                entry = [round_trip_ns, 1]
+            else:
+                entry[0] += int(self.alpha * (round_trip_ns - entry[0]))
+                entry[1] += 1
+            self.estimates[user_id] = entry
+            if len(self.estimates) > self.capacity:
+                self.estimates.popitem(last=False)
+
+    def round_compensations(self, user_ids):
+        """Allowance per player for one round: their RTT above the round's median, and none unless all are trusted"""
+        with self.lock:
+            entries = [tuple(self.estimates.get(user_id) or (0, 0)) for user_id in user_ids]
+        if not entries or any(samples < self.min_samples for _, samples in entries):
+            return dict.fromkeys(user_ids, 0)
+        rtts = sorted(smoothed for smoothed, _ in entries)
+        median = rtts[(len(rtts) - 1) // 2]
+        return {
+            user_id: min(smoothed - median, self.max_compensation_ns) if smoothed > median else 0
+            for user_id, (smoothed, _) in zip(user_ids, entries)
+        }
+
+    def snapshot(self):
+        with self.lock:
+            rtts = sorted(smoothed for smoothed, samples in self.estimates.values() if samples >= self.min_samples)
+            players = len(self.estimates)
+        if not rtts:
+            return {'players': players, 'trusted': 0}
+        return {
+            'players': players,
+            'trusted': len(rtts),
+            'median_rtt_ms': round(rtts[len(rtts) // 2] / 1e6, 1),
+            'p90_rtt_ms': round(rtts[int(len(rtts) * 0.9)] / 1e6, 1)
+        }
+
+class QuestionBank:
+    """Memory-mapped question bank (category<TAB>difficulty<TAB>question<TAB>answer per line)
+
+    Only line offsets are kept in RAM, indexed by (category, difficulty) with 'any'
+    wildcards, so a question is read from the mapped file only when drawn.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.mapped = None
+        self.pools = {}  # (category, difficulty) -> array of line offsets
+        self.lock = threading.Lock()
+
+    def load(self):
+        """Map the file and index line offsets on first use"""
+        with self.lock:
+            if self.mapped is not None:
+                return
+            with open(self.path, 'rb') as bank_file:
+                if os.fstat(bank_file.fileno()).st_size == 0:
+                    mapped = b''  # mmap refuses empty files; an empty bank just has no questions
+                else:
+                    mapped = mmap.mmap(bank_file.fileno(), 0, access=mmap.ACCESS_READ)
+            
+            offset = 0
+            line_number = 0
+            skipped = []  # line numbers of malformed lines, which read_question could not parse
+            while offset < len(mapped):
+                end = mapped.find(b'\n', offset)
+                if end == -1:
+                    end = len(mapped)
+                line_number += 1
+                line = mapped[offset:end].rstrip(b'\r')
+                if line.strip() and not line.startswith(b'#'):
+                    try:
+                        fields = line.decode('utf-8').split('\t')
+                    except UnicodeDecodeError:
+                        fields = []
+                    if len(fields) == 4 and all(field.strip() for field in fields):
+                        category = fields[0].strip()
+                        difficulty = fields[1].strip()
+                        for key in ((category, difficulty), (category, 'any'), ('any', difficulty), ('any', 'any')):
+                            self.pools.setdefault(key, array('Q')).append(offset)
+                    else:
+                        skipped.append(line_number)
+                offset = end + 1
+            
+            self.mapped = mapped
+            if skipped:
+                logger.warning(
+                    f"Question bank: skipped {len(skipped)} line(s) without 4 non-empty tab-separated fields "
+                    f"(lines {', '.join(map(str, skipped[:10]))}{', ...' if len(skipped) > 10 else ''})"
+                )
+            logger.info(f"Question bank indexed: {len(self.pools.get(('any', 'any'), []))} questions")
+
+    def categories(self):
+        self.load()
+        return sorted({category for category, _ in self.pools if category != 'any'})
+
+    def pool_size(self, category='any', difficulty='any'):
+        self.load()
+        return len(self.pools.get((category, difficulty), ()))
+
+    def read_question(self, offset):
+        end = self.mapped.find(b'\n', offset)
+        line = self.mapped[offset:end if end != -1 else len(self.mapped)].decode('utf-8')
+        category, difficulty, question, answer = line.rstrip('\r').split('\t')
+        return {'category': category, 'difficulty': difficulty, 'question': question, 'answer': answer}
+
+    def draw_unseen(self, unseen_state, category='any', difficulty='any'):
+        """Draw a random question not yet seen by this player, in O(1)
+
+        unseen_state is a per-player dict; it holds a lazy Fisher-Yates shuffle per pool
+        (only swapped positions are stored), so memory grows with questions drawn.
+        All questions are eligible again once a pool is exhausted.
+        """
+        self.load()
+        pool = self.pools.get((category, difficulty))
+        if not pool:
+            return None
+        
+        state = unseen_state.get((category, difficulty))
+        if state is None or state['remaining'] == 0:
+            state = unseen_state[(category, difficulty)] = {'remaining': len(pool), 'swaps': {}}
+        
+        swaps = state['swaps']
+        pick = random.randrange(state['remaining'])
+        last = state['remaining'] - 1
+        index = swaps.get(pick, pick)
+        swaps[pick] = swaps.pop(last, last)
+        state['remaining'] = last
+        return self.read_question(pool[index])
 
 def create_memory_board():
     """Create a shuffled memory board with 6 pairs"""
@@ -112,6 +647,19 @@ def check_winner(board):
     
     return None
 
+def get_player_tier(total_wins):
+    """Get scoreboard tier for a win count"""
+    if total_wins == 0:
+        return "🎯 Ready to Play"
+    elif total_wins < 3:
+        return "🌟 Getting Started"
+    elif total_wins < 10:
+        return "⭐ Rising Star"
+    elif total_wins < 25:
+        return "🏆 Skilled Player"
+    else:
+        return "👑 Legend Status"
+
 def format_board(board):
     """Format Tic-Tac-Toe board for display"""
     formatted = ""
@@ -119,11 +667,192 @@ def format_board(board):
         formatted += " ".join(row) + "\n"
     return formatted.strip()
 
+class RollingLeaderboard:
+    """Time-bucketed win counters for one leaderboard period (daily, weekly, ...)"""
+
+    def __init__(self, period_seconds, capacity, retained_buckets=2):
+        self.period_seconds = period_seconds
+        self.capacity = capacity
+        self.retained_buckets = retained_buckets
+        self.buckets = {}  # bucket index -> {game_type: {user_id: wins}}
+        self.rankings = {}  # (bucket index, game_type) -> (ordered entries, rank by user)
+        self.lock = threading.Lock()
+
+    def current_bucket(self, now=None):
+        return int((now if now is not None else time.time()) // self.period_seconds)
+
+    def _bucket(self, index):
+        bucket = self.buckets.get(index)
+        if bucket is None:
+            # Period rollover: start an empty bucket and drop the expired ones
+            bucket = self.buckets[index] = {}
+            for old_index in [i for i in self.buckets if i <= index - self.retained_buckets]:
+                del self.buckets[old_index]
+                for key in [k for k in self.rankings if k[0] == old_index]:
+                    del self.rankings[key]
+        return bucket
+
+    def record_win(self, user_id, game_type, now=None):
+        """Count a win in the current bucket, evicting the weakest entry when full"""
+        with self.lock:
+            index = self.current_bucket(now)
+            counters = self._bucket(index).setdefault(game_type, {})
+            if user_id not in counters and len(counters) >= self.capacity:
+                weakest = min(counters, key=counters.get)
+                del counters[weakest]
+            counters[user_id] = counters.get(user_id, 0) + 1
+            self.rankings.pop((index, game_type), None)
+
+    def _ranking(self, index, game_type):
+        key = (index, game_type)
+        ranking = self.rankings.get(key)
+        if ranking is None:
+            counters = self.buckets.get(index, {}).get(game_type, {})
+            entries = sorted(counters.items(), key=lambda item: -item[1])
+            ranks = {uid: position + 1 for position, (uid, _) in enumerate(entries)}
+            ranking = self.rankings[key] = (entries, ranks)
+        return ranking
+
+    def top(self, game_type, limit=3, now=None):
+        """Return [(user_id, wins), ...] for the current period"""
+        with self.lock:
+            entries, _ = self._ranking(self.current_bucket(now), game_type)
+            return entries[:limit]
+
+    def rank(self, user_id, game_type, now=None):
+        """Return (rank, wins) for the current period, or (None, 0) if unranked"""
+        with self.lock:
+            index = self.current_bucket(now)
+            _, ranks = self._ranking(index, game_type)
+            position = ranks.get(user_id)
+            wins = self.buckets.get(index, {}).get(game_type, {}).get(user_id, 0)
+            return position, wins
+
+class Tournament:
+    """Bracket state for a single elimination, double elimination or Swiss tournament"""
+
+    def __init__(self, tournament_id, game_type, bracket, host_id):
+        self.tournament_id = tournament_id
+        self.game_type = game_type
+        self.bracket = bracket  # 'single', 'double' or 'swiss'
+        self.host_id = host_id
+        self.players = []  # join order doubles as seeding
+        self.names = {}
+        self.seeds = {}
+        self.losses = {}
+        self.points = {}  # wins plus byes
+        self.opponents = {}  # user_id -> set of user_ids already played
+        self.byes = set()
+        self.round = 0
+        self.total_rounds = None  # fixed up front for Swiss only
+        self.open_matches = {}  # session_id -> (player1_id, player2_id) still being played this round
+        self.round_results = []  # (winner_id, loser_id) of the current round, for the batched summary
+        self.status = 'open'
+        self.last_activity = time.time()  # creation or latest join, for expiring idle sign-ups
+        self.lock = threading.Lock()
+
+    def add_player(self, user_id, name):
+        if user_id in self.seeds:
+            return False
+        self.seeds[user_id] = len(self.players)
+        self.players.append(user_id)
+        self.names[user_id] = name
+        self.losses[user_id] = 0
+        self.points[user_id] = 0
+        self.opponents[user_id] = set()
+        self.last_activity = time.time()
+        return True
+
+    def start(self):
+        self.status = 'running'
+        if self.bracket == 'swiss':
+            self.total_rounds = max(1, (len(self.players) - 1).bit_length())
+
+    def alive(self):
+        """Players still in contention, in seed order"""
+        if self.bracket == 'swiss':
+            return list(self.players)
+        max_losses = 2 if self.bracket == 'double' else 1
+        return [uid for uid in self.players if self.losses[uid] < max_losses]
+
+    def is_finished(self):
+        if self.bracket == 'swiss':
+            return self.round >= self.total_rounds
+        return len(self.alive()) <= 1
+
+    def pair_next_round(self):
+        """Pair the next round; returns ([(player1_id, player2_id), ...], bye player or None)"""
+        self.round += 1
+        self.round_results = []
+        
+        if self.bracket == 'swiss':
+            pairs, bye = self._pair_swiss()
+        elif self.bracket == 'double':
+            # Winners (no loss) and losers (one loss) brackets pair separately; odd ones out meet
+            pairs, leftovers = [], []
+            for losses in (0, 1):
+                group_pairs, leftover = self._fold_pairs([uid for uid in self.alive() if self.losses[uid] == losses])
+                pairs += group_pairs
+                if leftover is not None:
+                    leftovers.append(leftover)
+            if len(leftovers) == 2:
+                pairs.append(tuple(leftovers))
+                leftovers = []
+            bye = leftovers[0] if leftovers else None
+        else:
+            pairs, bye = self._fold_pairs(self.alive())
+        
+        if bye is not None:
+            self.byes.add(bye)
+            self.points[bye] += 1
+        return pairs, bye
+
+    def _fold_pairs(self, group):
+        """Pair top seeds against bottom seeds; with an odd count the best seed without a bye sits out"""
+        group = sorted(group, key=self.seeds.get)
+        bye = None
+        if len(group) % 2:
+            bye = next((uid for uid in group if uid not in self.byes), group[0])
+            group.remove(bye)
+        half = len(group) // 2
+        return list(zip(group[:half], reversed(group[half:]))), bye
+
+    def _pair_swiss(self):
+        """Pair players on equal points, avoiding repeat opponents where possible"""
+        ranked = self.standings()
+        bye = None
+        if len(ranked) % 2:
+            bye = next((uid for uid in reversed(ranked) if uid not in self.byes), ranked[-1])
+            ranked.remove(bye)
+        
+        pairs = []
+        while ranked:
+            player_id = ranked.pop(0)
+            opponent_id = next((uid for uid in ranked if uid not in self.opponents[player_id]), ranked[0])
+            ranked.remove(opponent_id)
+            pairs.append((player_id, opponent_id))
+        return pairs, bye
+
+    def record_result(self, winner_id, loser_id):
+        self.points[winner_id] += 1
+        self.losses[loser_id] += 1
+        self.opponents[winner_id].add(loser_id)
+        self.opponents[loser_id].add(winner_id)
+        self.round_results.append((winner_id, loser_id))
+
+    def standings(self):
+        """Players ordered best first"""
+        if self.bracket == 'swiss':
+            return sorted(self.players, key=lambda uid: (-self.points[uid], self.seeds[uid]))
+        return sorted(self.players, key=lambda uid: (self.losses[uid], -self.points[uid], self.seeds[uid]))
+
 # Global storage
 game_scores = {}
-user_data_cache = {}
+user_data_cache = {}  # user_id -> {'first_name', 'username'}, the only profile fields we read
+scoreboard_cache = {}  # user_id -> rendered scoreboard text, dropped on stats change
 multiplayer_sessions = {}
-active_users = set()
+finished_sessions = {}  # session_id -> session kept briefly after game over for a rematch
+active_users = OrderedDict()  # presence table: user_id -> time.monotonic() last seen, oldest first
 
 # Game configurations
 GAMES = {
@@ -134,48 +863,319 @@ GAMES = {
     'memory': {'name': '🧩 Memory Match', 'description': 'Concentration tile matching'}
 }
 
+# Inline mode: the answer never varies, so it is built once and cached by Telegram for a day
+INLINE_CACHE_SECONDS = 24 * 60 * 60
+INLINE_QUERY_RESULTS = [
+    {
+        'type': 'article',
+        'id': game_type,
+        'title': game['name'],
+        'description': game['description'],
+        'input_message_content': {
+            'message_text': f"🎮 <b>{game['name']}</b> 🎮\n\n{game['description']}\n\nTap Play to host the game!",
+            'parse_mode': 'HTML'
+        },
+        'reply_markup': {'inline_keyboard': [[{'text': '🎮 Play', 'callback_data': f'group_new_{game_type}'}]]}
+    }
+    for game_type, game in GAMES.items()
+]
+
+# Bot API delivery
+RATE_LIMIT_MAX_WAIT = 5  # longest retry_after on a 429 that still gets the request resent once
+
+delivery_stats = {
+    'sent': 0,
+    'failed': 0,
+    'blocked': 0,
+    'chat_not_found': 0,
+    'rate_limited': 0,
+    'rate_limit_resends': 0,
+    'chats_pruned': 0,
+    'sends_avoided': 0,
+    'audience_trimmed': 0,
+    'digests_queued': 0,
+    'spectator_renders': 0,
+    'spectator_edits': 0
+}
+dead_chats = OrderedDict()  # chat_id -> last seen (monotonic) when the chat was pruned
+
+# Digest-mode lobby notifications (opt-in per user)
+DIGEST_WINDOW_SECONDS = 60  # new games are collected this long before one digest is sent
+DIGEST_LOBBY_REUSE_SECONDS = 5 * 60  # edit the previous lobby message if it is this recent
+
+digest_subscribers = set()
+pending_digests = {}  # user_id -> session_ids created since the last digest
+lobby_messages = OrderedDict()  # user_id -> (message_id, time.monotonic() sent, session_ids listed) of the last digest, oldest first
+digest_lock = threading.Lock()
+
+# Presence tracking - bounds active_users/user_data_cache and broadcast targets
+PRESENCE_MAX_USERS = 10000
+PRESENCE_TTL_SECONDS = 7 * 24 * 60 * 60
+BROADCAST_RECENCY_MINUTES = 30
+BROADCAST_AUDIENCE_SIZE = 50  # top-K likely joiners notified per new game
+AUDIENCE_HALF_LIFE_SECONDS = 10 * 60  # recency decay of a user's join likelihood
+
+# Solo Q&A practice
+QUESTION_BANK_PATH = os.environ.get(
+    'QUESTION_BANK_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'qa_question_bank.tsv')
+)
+QUESTION_DIFFICULTIES = ['easy', 'medium', 'hard']
+
+question_bank = QuestionBank(QUESTION_BANK_PATH)
+solo_qa_sessions = {}  # user_id -> solo practice state
+
+# Content filter for user-submitted Q&A text
+QA_BLOCKLIST_PATH = os.environ.get(
+    'QA_BLOCKLIST_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'qa_blocklist.txt')
+)
+BLOCKLIST_RELOAD_SECONDS = 30  # how often the blocklist file is checked for changes
+
+qa_content_filter = ContentFilter(QA_BLOCKLIST_PATH, BLOCKLIST_RELOAD_SECONDS)
+
+# Turn timers for turn-based games
+TURN_TIMEOUT_SECONDS = {'tictactoe': 90, 'memory': 90, 'qa': 180}
+TURN_TIMEOUT_FORFEIT_AFTER = 2  # consecutive missed turns before the player forfeits
+
+turn_scheduler = TurnScheduler()
+session_stats = {'forfeits_quit': 0, 'forfeits_timeout': 0, 'forfeits_deadline': 0, 'rematches': 0}  # session lifecycle counters
+REMATCH_WINDOW_SECONDS = 120  # how long a finished session can be restarted in place
+SERIES_OPTIONS = (3, 5)  # best-of-N formats a host can pick while waiting for an opponent
+SERIES_NEXT_GAME_DELAY = 3  # seconds between games of a series
+GROUP_GAMES = ('tictactoe', 'memory')  # games with fully public state, playable on one shared group message
+
+# Spectators
+SPECTATOR_MAX_PER_SESSION = 500
+SPECTATOR_EDITS_PER_SECOND = 20  # shared budget for all spectator edits, below the Bot API's ~30 msg/s
+
+spectator_feed = SpectatorFeed(SPECTATOR_EDITS_PER_SECOND)
+
+# Rolling leaderboards (per game, per period)
+LEADERBOARD_PERIODS = {
+    'daily': {'name': '📅 Daily', 'seconds': 24 * 60 * 60},
+    'weekly': {'name': '🗓️ Weekly', 'seconds': 7 * 24 * 60 * 60}
+}
+LEADERBOARD_CAPACITY = 500  # max tracked players per game per period bucket
+
+rolling_leaderboards = {
+    period: RollingLeaderboard(config['seconds'], LEADERBOARD_CAPACITY)
+    for period, config in LEADERBOARD_PERIODS.items()
+}
+
+# Tournaments
+TOURNAMENT_FORMATS = {
+    'single': '🏆 Single Elimination',
+    'double': '🥈 Double Elimination',
+    'swiss': '♟️ Swiss'
+}
+TOURNAMENT_MIN_PLAYERS = 4
+TOURNAMENT_MAX_PLAYERS = 256
+TOURNAMENT_ROUND_DELAY = 5  # seconds between the round summary and the next round's games
+TOURNAMENT_MATCH_SECONDS = 10 * 60  # limit for bracket matches of games without turn timers
+TOURNAMENT_STANDINGS_SHOWN = 10  # rows of the standings table in round summaries
+TOURNAMENT_LOBBY_IDLE_SECONDS = 10 * 60  # open sign-ups without a join for this long are dropped
+
+tournaments = {}  # tournament_id -> Tournament
+tournament_by_session = {}  # session_id -> tournament_id for every bracket match being played
+
+# RPS battle royale
+ROYALE_MIN_PLAYERS = 3
+ROYALE_MAX_PLAYERS = 500
+ROYALE_ROUND_SECONDS = 30  # players who haven't picked a weapon by then are knocked out
+ROYALE_LOBBY_IDLE_SECONDS = 10 * 60  # open sign-ups without a join or rule change for this long are dropped
+
+royale_games = {}  # royale_id -> battle state
+
+# Reaction party (N-player Reaction Game)
+REACTION_PARTY_MIN_PLAYERS = 2
+REACTION_PARTY_MAX_PLAYERS = 100
+REACTION_STANDINGS_SHOWN = 10  # rows of the shared standings block in reaction round messages
+
+# Reaction request RTT compensation
+REACTION_RTT_ALPHA = 0.125  # weight of the newest request round trip in a player's estimate
+REACTION_MAX_COMPENSATION_SECONDS = 0.5
+REACTION_RTT_MIN_SAMPLES = 3  # round trips seen before a player's estimate is trusted
+
+request_rtt = RequestRttEstimator(
+    REACTION_RTT_ALPHA, REACTION_MAX_COMPENSATION_SECONDS, REACTION_RTT_MIN_SAMPLES, PRESENCE_MAX_USERS
+)
+
+# Reaction target reveal
+REACTION_REVEAL_WORKERS = 16  # concurrent sends when revealing a target
+REVEAL_SKEW_WINDOW = 200  # recent rounds kept for the /metrics skew summary
+
+reveal_pool = ThreadPoolExecutor(max_workers=REACTION_REVEAL_WORKERS, thread_name_prefix='reaction-reveal')
+reveal_skews = deque(maxlen=REVEAL_SKEW_WINDOW)  # ms between the first and last player's reveal landing
+reveal_skews_lock = threading.Lock()  # reveals append from game threads while /metrics reads
+
+# Per-player fan-outs (round results, countdowns, summaries)
+NOTIFY_WORKERS = 8  # concurrent sends, kept apart from the reveal workers so results never delay a reveal
+
+notify_pool = ThreadPoolExecutor(max_workers=NOTIFY_WORKERS, thread_name_prefix='notify')
+
 class SimpleLocalBot:
     def __init__(self, bot_token):
         self.bot_token = bot_token
         self.api_url = f"https://api.telegram.org/bot{bot_token}"
+        spectator_feed.deliver = self.deliver_spectator_view
         logger.info("🚀 Starting SIMPLE LOCAL Bot with updated prize messages...")
 
+    def api_request(self, method, data, timeout=10, retry=True):
+        """Call a Bot API method, raising TelegramAPIError on ok=false responses"""
+        response = requests.post(f"{self.api_url}/{method}", json=data, timeout=timeout).json()
+        if response.get('ok', False):
+            return response
+        
+        retry_after = response.get('parameters', {}).get('retry_after')
+        error = TelegramAPIError(method, response.get('error_code'), response.get('description'), retry_after)
+        if error.is_rate_limited:
+            delivery_stats['rate_limited'] += 1
+            if retry and retry_after is not None and retry_after <= RATE_LIMIT_MAX_WAIT:
+                # Sleeping here would stall the polling or scheduler thread; resend from the notify pool instead
+                logger.warning(f"Rate limited on {method}, resending in {retry_after}s")
+                turn_scheduler.schedule(retry_after, lambda: notify_pool.submit(self.resend_request, method, data, timeout))
+        raise error
+
+    def resend_request(self, method, data, timeout):
+        """The single delayed resend of a rate-limited request; nobody is left waiting on its result"""
+        try:
+            self.api_request(method, data, timeout, retry=False)
+            delivery_stats['rate_limit_resends'] += 1
+        except Exception as e:
+            logger.error(f"Resend of {method} failed: {e}")
+
     def send_message(self, chat_id, text, keyboard=None):
         try:
             data = {'chat_id': chat_id, 'text': text, 'parse_mode': 'HTML'}
             if keyboard:
                 data['reply_markup'] = keyboard
-            response = requests.post(f"{self.api_url}/sendMessage", json=data, timeout=10)
-            return response.json()
+            response = self.api_request('sendMessage', data)
+            delivery_stats['sent'] += 1
+            return response
+        except TelegramAPIError as e:
+            delivery_stats['failed'] += 1
+            if e.is_dead_chat:
+                self.prune_dead_chat(chat_id, e)
+            else:
+                logger.error(f"Error sending message: {e}")
+            return None
         except Exception as e:
+            delivery_stats['failed'] += 1
             logger.error(f"Error sending message: {e}")
             return None
 
+    def send_batch(self, messages):
+        """Queue (chat_id, text, keyboard) sends on the notify pool, returning their futures without waiting"""
+        return [notify_pool.submit(self.send_message, chat_id, text, keyboard) for chat_id, text, keyboard in messages]
+
     def edit_message(self, chat_id, message_id, text, keyboard=None):
+        """Edit a chat message, or an inline message when chat_id is None and message_id is its inline_message_id"""
         try:
-            data = {'chat_id': chat_id, 'message_id': message_id, 'text': text, 'parse_mode': 'HTML'}
+            if chat_id is None:
+                data = {'inline_message_id': message_id, 'text': text, 'parse_mode': 'HTML'}
+            else:
+                data = {'chat_id': chat_id, 'message_id': message_id, 'text': text, 'parse_mode': 'HTML'}
             if keyboard:
                 data['reply_markup'] = keyboard
-            response = requests.post(f"{self.api_url}/editMessageText", json=data, timeout=10)
-            return response.json()
+            return self.api_request('editMessageText', data)
+        except TelegramAPIError as e:
+            if e.is_dead_chat:
+                self.prune_dead_chat(chat_id, e)
+            else:
+                logger.error(f"Error editing message: {e}")
+            return None
         except Exception as e:
             logger.error(f"Error editing message: {e}")
             return None
 
+    def edit_message_markup(self, chat_id, message_id, keyboard):
+        """Swap only a message's buttons, the smallest edit the Bot API offers"""
+        try:
+            return self.api_request('editMessageReplyMarkup', {'chat_id': chat_id, 'message_id': message_id, 'reply_markup': keyboard})
+        except TelegramAPIError as e:
+            if e.is_dead_chat:
+                self.prune_dead_chat(chat_id, e)
+            else:
+                logger.error(f"Error editing message markup: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error editing message markup: {e}")
+            return None
+
+    def prune_dead_chat(self, chat_id, error):
+        """Stop targeting a chat that blocked the bot or no longer exists"""
+        if error.is_blocked:
+            delivery_stats['blocked'] += 1
+        else:
+            delivery_stats['chat_not_found'] += 1
+        
+        last_seen = active_users.pop(chat_id, None)
+        if last_seen is not None:
+            dead_chats[chat_id] = last_seen
+            delivery_stats['chats_pruned'] += 1
+            logger.info(f"Pruned dead chat {chat_id}: {error.description}")
+
+    def count_avoided_sends(self, minutes):
+        """Count pruned chats a recency broadcast would otherwise still have targeted"""
+        cutoff = time.monotonic() - minutes * 60
+        for chat_id in [cid for cid, last_seen in dead_chats.items() if last_seen < cutoff]:
+            del dead_chats[chat_id]
+        return len(dead_chats)
+
     def answer_callback_query(self, callback_query_id, text=""):
         try:
             data = {'callback_query_id': callback_query_id, 'text': text}
-            response = requests.post(f"{self.api_url}/answerCallbackQuery", json=data, timeout=5)
-            return response.json()
+            return self.api_request('answerCallbackQuery', data, timeout=5)
         except Exception as e:
             logger.error(f"Error answering callback: {e}")
             return None
 
+    def touch_user(self, user_id):
+        """Hot path for every update: mark user as seen, registering on first sight"""
+        now = time.monotonic()
+        if user_id in active_users:
+            active_users.move_to_end(user_id)
+            active_users[user_id] = now
+            return
+        
+        active_users[user_id] = now
+        dead_chats.pop(user_id, None)
+        self.init_user_scores(user_id)
+        self.evict_stale_users(now)
+
+    def evict_stale_users(self, now):
+        """Drop least recently seen users past the TTL or over the presence cap"""
+        while active_users:
+            oldest_id, last_seen = next(iter(active_users.items()))
+            if len(active_users) <= PRESENCE_MAX_USERS and now - last_seen <= PRESENCE_TTL_SECONDS:
+                break
+            active_users.popitem(last=False)
+            user_data_cache.pop(oldest_id, None)
+
+    def get_recent_users(self, minutes):
+        """Return user IDs seen in the last N minutes, most recent first"""
+        cutoff = time.monotonic() - minutes * 60
+        recent_users = []
+        for user_id in reversed(active_users):
+            if active_users[user_id] < cutoff:
+                break
+            recent_users.append(user_id)
+        return recent_users
+
     def register_user(self, user_data):
+        """Touch user and refresh cached profile fields only when they changed"""
         user_id = user_data['id']
-        user_data_cache[user_id] = user_data
-        active_users.add(user_id)
+        self.touch_user(user_id)
         
+        profile = user_data_cache.get(user_id)
+        first_name = user_data.get('first_name', 'Player')
+        username = user_data.get('username')
+        if profile is None or profile['first_name'] != first_name or profile['username'] != username:
+            user_data_cache[user_id] = {'first_name': first_name, 'username': username}
+
+    def init_user_scores(self, user_id):
+        """Create empty stats for a new user"""
         if user_id not in game_scores:
             game_scores[user_id] = {
                 'tictactoe': {'wins': 0, 'games': 0},
@@ -184,6 +1184,8 @@ class SimpleLocalBot:
                 'qa': {'wins': 0, 'games': 0},
                 'memory': {'wins': 0, 'games': 0},
                 'total_wins': 0,
+                'total_games': 0,
+                'tier': get_player_tier(0),
                 'prize_claimed': False,
                 'real_prize_claimed': False
             }
@@ -191,20 +1193,27 @@ class SimpleLocalBot:
     def update_user_game_result(self, user_id, game_type, won, score=None):
         """Update user game result"""
         if user_id not in game_scores:
-            self.register_user({'id': user_id, 'first_name': 'Player'})
+            self.init_user_scores(user_id)
         
-        if game_type not in game_scores[user_id]:
-            game_scores[user_id][game_type] = {'wins': 0, 'games': 0}
+        user_stats = game_scores[user_id]
+        if game_type not in user_stats:
+            user_stats[game_type] = {'wins': 0, 'games': 0}
+        game_stats = user_stats[game_type]
         
-        game_scores[user_id][game_type]['games'] += 1
+        game_stats['games'] += 1
+        user_stats['total_games'] += 1
         if won:
-            game_scores[user_id][game_type]['wins'] += 1
-            game_scores[user_id]['total_wins'] += 1
+            game_stats['wins'] += 1
+            user_stats['total_wins'] += 1
+            user_stats['tier'] = get_player_tier(user_stats['total_wins'])
+            for leaderboard in rolling_leaderboards.values():
+                leaderboard.record_win(user_id, game_type)
+        game_stats['win_rate'] = game_stats['wins'] / game_stats['games'] * 100
         
         if score is not None:
-            game_scores[user_id][game_type]['best_score'] = max(
-                game_scores[user_id][game_type].get('best_score', 0), score
-            )
+            game_stats['best_score'] = max(game_stats.get('best_score', 0), score)
+        
+        scoreboard_cache.pop(user_id, None)
 
     def handle_start(self, chat_id, user_data):
         self.register_user(user_data)
@@ -231,8 +1240,142 @@ class SimpleLocalBot:
         
         self.send_message(chat_id, start_text, keyboard)
 
+    def handle_play_command(self, chat_id, user_data, chat):
+        """/play: the game menu in private chats, a shared-board game picker in groups"""
+        self.register_user(user_data)
+        if chat.get('type') in ('group', 'supergroup'):
+            self.show_group_game_picker(chat_id, None)
+        else:
+            self.show_game_menu(chat_id, None, user_data['id'])
+
+    def show_group_game_picker(self, chat_id, message_id):
+        picker_text = (
+            "🎮 <b>Group Game</b> 🎮\n\n"
+            "Pick a game to play right here in the chat.\n"
+            "Everyone sees one shared board - the first player to join is the opponent!"
+        )
+        keyboard = {
+            'inline_keyboard': [
+                [{'text': GAMES[game_type]['name'], 'callback_data': f'group_new_{game_type}'}]
+                for game_type in GROUP_GAMES
+            ]
+        }
+        
+        if message_id:
+            self.edit_message(chat_id, message_id, picker_text, keyboard)
+        else:
+            self.send_message(chat_id, picker_text, keyboard)
+
+    def create_shared_game(self, chat_id, message_id, user_id, user_data, game_type):
+        """Open a game from a group or inline message; board games are then played on that message"""
+        inline = chat_id is None
+        if game_type not in GROUP_GAMES and not (inline and game_type in GAMES):
+            return
+        
+        self.register_user(user_data)
+        session_id = generate_session_id()
+        host_name = user_data.get('first_name', 'Player')
+        
+        session = multiplayer_sessions[session_id] = {
+            'game_type': game_type,
+            'host_id': user_id,
+            'host_name': host_name,
+            'players': [user_id],
+            'status': 'waiting',
+            'created_at': time.time()
+        }
+        if game_type in GROUP_GAMES:
+            session['shared_board'] = (chat_id, message_id)
+            where = "right here"
+        else:
+            # Hidden-information games only use the inline message as the invitation
+            session['invite_message'] = (chat_id, message_id)
+            where = "in your private chat with the bot"
+        
+        self.edit_message(chat_id, message_id, (
+            f"🎮 <b>{GAMES[game_type]['name']}</b> 🎮\n\n"
+            f"{host_name} is looking for an opponent.\n"
+            f"Tap Join to play {where}!"
+        ), {
+            'inline_keyboard': [
+                [{'text': '🎮 Join Game', 'callback_data': f'join_{session_id}'}],
+                [{'text': '❌ Cancel Game', 'callback_data': f'cancel_{session_id}'}]
+            ]
+        })
+
+    def update_shared_board(self, session_id, result=None, keyboard=None):
+        """Render a board game onto its one shared group or inline message with a single edit"""
+        session = multiplayer_sessions[session_id]
+        game_state = session['game_state']
+        names = session['player_names']
+        player1_id, player2_id = session['players']
+        keyboard_buttons = []
+        
+        if session['game_type'] == 'tictactoe':
+            symbols = game_state['player_symbols']
+            current_player_id = session['players'][game_state['current_turn']]
+            header = f"{symbols[player1_id]} {names[player1_id]} vs {symbols[player2_id]} {names[player2_id]}"
+            turn_text = f"{symbols[current_player_id]} {names[current_player_id]}"
+            for i, row in enumerate(game_state['board']):
+                keyboard_buttons.append([
+                    {'text': cell, 'callback_data': f'ttt_{i}_{j}_{session_id}' if cell == '⬜' and not result else 'noop'}
+                    for j, cell in enumerate(row)
+                ])
+        else:
+            scores = game_state['scores']
+            header = (
+                f"{names[player1_id]} {scores[player1_id]} - {scores[player2_id]} {names[player2_id]}\n"
+                f"Pairs found: {game_state['matched_pairs']}/{game_state['total_pairs']}"
+            )
+            turn_text = names[game_state['current_player']]
+            for i, row in enumerate(game_state['board']):
+                button_row = []
+                for j, tile in enumerate(row):
+                    position = i * 4 + j
+                    if tile['matched'] or tile['revealed']:
+                        button_row.append({'text': tile['symbol'], 'callback_data': 'noop'})
+                    else:
+                        button_row.append({
+                            'text': f'📍 {position + 1}',
+                            'callback_data': 'noop' if result else f'memory_select_{session_id}_{position}'
+                        })
+                keyboard_buttons.append(button_row)
+        
+        board_text = f"<b>{GAMES[session['game_type']]['name']}</b>\n\n{header}\n\n"
+        if result:
+            board_text += result
+            keyboard_buttons += (keyboard or self.game_over_keyboard(session_id))['inline_keyboard']
+        else:
+            board_text += f"🎮 <b>Turn: {turn_text}</b>"
+            keyboard_buttons.append([{'text': '🏳️ Quit Game', 'callback_data': f'quit_{session_id}'}])
+        
+        self.edit_message(*session['shared_board'], board_text, {'inline_keyboard': keyboard_buttons})
+
+    def end_shared_board_game(self, session_id, winner_id):
+        """Record a finished shared-board game and show the result on the board"""
+        session = multiplayer_sessions[session_id]
+        self.record_match_result(session_id, winner_id)
+        if winner_id:
+            result = f"🎉 <b>{session['player_names'][winner_id]} wins!</b> 🎉"
+        else:
+            result = "🤝 <b>It's a tie!</b> 🤝"
+        self.update_shared_board(session_id, result)
+        self.finish_match(session_id, winner_id)
+
+    def handle_inline_query(self, inline_query):
+        """Answer every inline query with the same precomputed game list"""
+        try:
+            self.api_request('answerInlineQuery', {
+                'inline_query_id': inline_query['id'],
+                'results': INLINE_QUERY_RESULTS,
+                'cache_time': INLINE_CACHE_SECONDS,
+                'is_personal': False
+            })
+        except Exception as e:
+            logger.error(f"Error answering inline query: {e}")
+
     def show_game_menu(self, chat_id, message_id, user_id):
-        self.register_user({'id': user_id, 'first_name': 'Player'})
+        self.touch_user(user_id)
         
         menu_text = (
             "🎮 <b>Choose Your Battle!</b> 🎮\n\n"
@@ -251,17 +1394,26 @@ class SimpleLocalBot:
             [{'text': '⚡ Reaction Game (vs Player)', 'callback_data': 'invite_reaction'}],
             [{'text': '🧠 Q&A Duel (vs Player)', 'callback_data': 'invite_qa'}],
             [{'text': '🧩 Memory Match (vs Player)', 'callback_data': 'invite_memory'}],
+            [{'text': '📚 Solo Q&A Practice', 'callback_data': 'solo_qa'}],
+            [{'text': '🏟️ Tournaments', 'callback_data': 'tourney_menu'}],
+            [{'text': '⚔️ RPS Battle Royale', 'callback_data': 'royale_menu'}],
+            [{'text': '⚡ Reaction Party', 'callback_data': 'party_new'}],
             [{'text': '🔍 Find Active Games', 'callback_data': 'find_games'}],
             [{'text': '🏆 View Scoreboard', 'callback_data': 'show_scoreboard'}]
         ]
         
+        if user_id in digest_subscribers:
+            keyboard_buttons.append([{'text': '📬 New Game Alerts: Digest', 'callback_data': 'toggle_digest'}])
+        else:
+            keyboard_buttons.append([{'text': '🔔 New Game Alerts: Instant', 'callback_data': 'toggle_digest'}])
+        
         # Check for prize eligibility
         total_wins = game_scores.get(user_id, {}).get('total_wins', 0)
         if total_wins >= 3:
             if game_scores.get(user_id, {}).get('prize_claimed', False):
-                keyboard_buttons.insert(-1, [{'text': '🎁 View Prize Message', 'callback_data': 'view_prize'}])
+                keyboard_buttons.insert(-2, [{'text': '🎁 View Prize Message', 'callback_data': 'view_prize'}])
             else:
-                keyboard_buttons.insert(-1, [{'text': '🎁 Claim Your Prize!', 'callback_data': 'reveal_prize'}])
+                keyboard_buttons.insert(-2, [{'text': '🎁 Claim Your Prize!', 'callback_data': 'reveal_prize'}])
         
         keyboard = {'inline_keyboard': keyboard_buttons}
         
@@ -274,7 +1426,7 @@ class SimpleLocalBot:
 
     def handle_prize_reveal(self, chat_id, message_id, user_id):
         """Show UPDATED fake prize message"""
-        self.register_user({'id': user_id, 'first_name': 'Player'})
+        self.touch_user(user_id)
         game_scores[user_id]['prize_claimed'] = True
         
         # UPDATED fake prize message
@@ -294,7 +1446,7 @@ class SimpleLocalBot:
 
     def handle_real_prize_reveal(self, chat_id, message_id, user_id):
         """Show UPDATED real prize message"""
-        self.register_user({'id': user_id, 'first_name': 'Player'})
+        self.touch_user(user_id)
         game_scores[user_id]['real_prize_claimed'] = True
         
         # UPDATED real prize message with your refinements
@@ -360,27 +1512,88 @@ class SimpleLocalBot:
         
         game_name = GAMES.get(game_type, {}).get('name', 'Game')
         
+        self.show_invitation(chat_id, message_id, session_id)
+        
+        # Send notification to other active users
+        self.broadcast_game_notification(user_id, user_data.get('first_name', 'Player'), game_name, session_id)
+
+    def show_invitation(self, chat_id, message_id, session_id):
+        """Show the host's waiting screen for a multiplayer invitation"""
+        session = multiplayer_sessions[session_id]
+        game_name = GAMES.get(session['game_type'], {}).get('name', 'Game')
+        series = session.get('series')
+        format_label = f"Best of {series['best_of']} series" if series else "Single game"
+        if session['game_type'] == 'rps':
+            format_label += f", {RPS_RULES[session.get('rps_variant', RPS_DEFAULT_VARIANT)]['name']} rules"
+        
         invitation_text = (
             f"🎮 <b>Multiplayer Game Created!</b> 🎮\n\n"
             f"Game: {game_name}\n"
-            f"Host: {user_data.get('first_name', 'Player')}\n"
+            f"Host: {session['host_name']}\n"
+            f"Format: {format_label}\n"
             f"Status: Waiting for opponent...\n\n"
             f"Share this message with anyone who might want to play!\n"
             f"Game ID: <code>{session_id}</code>"
         )
         
-        keyboard = {
-            'inline_keyboard': [
-                [{'text': '⏳ Waiting for player...', 'callback_data': 'noop'}],
-                [{'text': '❌ Cancel Game', 'callback_data': f'cancel_{session_id}'}],
-                [{'text': '🎮 Back to Games', 'callback_data': 'show_games'}]
-            ]
-        }
+        series_buttons = [
+            {'text': f'🏅 Best of {best_of}', 'callback_data': f'series_{best_of}_{session_id}'}
+            for best_of in SERIES_OPTIONS if not series or series['best_of'] != best_of
+        ]
+        if series:
+            series_buttons.append({'text': '1️⃣ Single Game', 'callback_data': f'series_1_{session_id}'})
+        
+        keyboard_buttons = [
+            [{'text': '⏳ Waiting for player...', 'callback_data': 'noop'}],
+            series_buttons
+        ]
+        if session['game_type'] == 'rps':
+            keyboard_buttons.append([
+                {'text': f"📜 {rules['name']}", 'callback_data': f'rpsvar_{variant}_{session_id}'}
+                for variant, rules in RPS_RULES.items() if variant != session.get('rps_variant', RPS_DEFAULT_VARIANT)
+            ])
+        keyboard_buttons.append([{'text': '❌ Cancel Game', 'callback_data': f'cancel_{session_id}'}])
+        keyboard_buttons.append([{'text': '🎮 Back to Games', 'callback_data': 'show_games'}])
+        keyboard = {'inline_keyboard': keyboard_buttons}
         
         self.edit_message(chat_id, message_id, invitation_text, keyboard)
+
+    def handle_series_selection(self, chat_id, message_id, user_id, best_of, session_id):
+        """Let the host turn a waiting game into a best-of-N series"""
+        session = multiplayer_sessions.get(session_id)
+        if not session or session['host_id'] != user_id or session['status'] != 'waiting':
+            return
         
-        # Send notification to other active users
-        self.broadcast_game_notification(user_id, user_data.get('first_name', 'Player'), game_name, session_id)
+        if best_of in SERIES_OPTIONS:
+            session['series'] = {'best_of': best_of, 'wins': {}, 'games_played': 0, 'decided': False}
+        else:
+            session.pop('series', None)
+        self.show_invitation(chat_id, message_id, session_id)
+
+    def handle_rps_variant_selection(self, chat_id, message_id, user_id, variant, session_id):
+        """Let the host pick the Rock Paper Scissors rule set while waiting for an opponent"""
+        session = multiplayer_sessions.get(session_id)
+        if not session or session['host_id'] != user_id or session['status'] != 'waiting' or variant not in RPS_RULES:
+            return
+        
+        session['rps_variant'] = variant
+        self.show_invitation(chat_id, message_id, session_id)
+
+    def select_broadcast_audience(self, host_id, game_type):
+        """Pick the top-K recent users most likely to join a game of this type"""
+        now = time.monotonic()
+        candidates = [uid for uid in self.get_recent_users(BROADCAST_RECENCY_MINUTES) if uid != host_id]
+        
+        def join_likelihood(uid):
+            # Play count for this game, decayed by how long ago the user was last seen
+            plays = game_scores.get(uid, {}).get(game_type, {}).get('games', 0)
+            return (1 + plays) * 0.5 ** ((now - active_users[uid]) / AUDIENCE_HALF_LIFE_SECONDS)
+        
+        if len(candidates) <= BROADCAST_AUDIENCE_SIZE:
+            return candidates
+        
+        delivery_stats['audience_trimmed'] += len(candidates) - BROADCAST_AUDIENCE_SIZE
+        return heapq.nlargest(BROADCAST_AUDIENCE_SIZE, candidates, key=join_likelihood)
 
     def broadcast_game_notification(self, host_id, host_username, game_name, session_id):
         """Send notification to other active users with DIRECT JOIN BUTTON"""
@@ -398,28 +1611,112 @@ class SimpleLocalBot:
             ]
         }
         
-        for user_id in active_users:
-            if user_id != host_id:
-                try:
-                    self.send_message(user_id, notification_text, keyboard)
-                except Exception as e:
-                    logger.error(f"Error sending notification to {user_id}: {e}")
-                    active_users.discard(user_id)
+        # Dead chats were pruned from active_users by send_message, so these sends never happen
+        delivery_stats['sends_avoided'] += self.count_avoided_sends(BROADCAST_RECENCY_MINUTES)
+        
+        game_type = multiplayer_sessions.get(session_id, {}).get('game_type')
+        for user_id in self.select_broadcast_audience(host_id, game_type):
+            if user_id in digest_subscribers:
+                self.queue_digest(user_id, session_id)
+            else:
+                self.send_message(user_id, notification_text, keyboard)
+
+    def toggle_digest_mode(self, chat_id, message_id, user_id):
+        """Switch new-game alerts between instant messages and a periodic digest"""
+        if user_id in digest_subscribers:
+            digest_subscribers.discard(user_id)
+        else:
+            digest_subscribers.add(user_id)
+        self.show_game_menu(chat_id, message_id, user_id)
+
+    def queue_digest(self, user_id, session_id):
+        """Collect a new game for the user's next digest, starting the window if needed"""
+        with digest_lock:
+            pending = pending_digests.get(user_id)
+            if pending is None:
+                pending = pending_digests[user_id] = []
+                turn_scheduler.schedule(DIGEST_WINDOW_SECONDS, lambda: notify_pool.submit(self.flush_digest, user_id))
+            pending.append(session_id)
+        delivery_stats['digests_queued'] += 1
+
+    def flush_digest(self, user_id):
+        """Send (or edit) one lobby message listing the still-joinable games"""
+        with digest_lock:
+            session_ids = pending_digests.pop(user_id, [])
+        
+        now = time.monotonic()
+        lobby_message = lobby_messages.get(user_id)
+        reuse_lobby = lobby_message is not None and now - lobby_message[1] < DIGEST_LOBBY_REUSE_SECONDS
+        if reuse_lobby:
+            # Keep listing games from the previous digest that are still joinable
+            session_ids = lobby_message[2] + [sid for sid in session_ids if sid not in lobby_message[2]]
+        
+        joinable = [
+            (sid, multiplayer_sessions[sid]) for sid in session_ids
+            if multiplayer_sessions.get(sid, {}).get('status') == 'waiting'
+        ]
+        if not joinable:
+            return
+        
+        digest_text = "📬 <b>New Games Available!</b> 📬\n\n"
+        keyboard_buttons = []
+        
+        for session_id, session in joinable[:5]:
+            game_name = GAMES.get(session['game_type'], {}).get('name', 'Game')
+            host_name = session.get('host_name', 'Player')
+            
+            digest_text += f"• {game_name} by {host_name}\n"
+            keyboard_buttons.append([{
+                'text': f'🎮 Join {game_name}',
+                'callback_data': f'join_{session_id}'
+            }])
+        
+        if len(joinable) > 5:
+            digest_text += f"...and {len(joinable) - 5} more\n"
+        digest_text += "\nWant to play? Join now!"
+        
+        keyboard_buttons.append([{'text': '🔍 Find Active Games', 'callback_data': 'find_games'}])
+        keyboard = {'inline_keyboard': keyboard_buttons}
+        
+        joinable_ids = [sid for sid, _ in joinable]
+        if reuse_lobby and self.edit_message(user_id, lobby_message[0], digest_text, keyboard):
+            self.remember_lobby_message(user_id, (lobby_message[0], lobby_message[1], joinable_ids))
+            return
+        
+        response = self.send_message(user_id, digest_text, keyboard)
+        if response:
+            self.remember_lobby_message(user_id, (response['result']['message_id'], now, joinable_ids))
+
+    def remember_lobby_message(self, user_id, lobby_message):
+        """Record a user's digest message, dropping the oldest ones past the reuse window or the presence cap"""
+        now = time.monotonic()
+        with digest_lock:
+            lobby_messages[user_id] = lobby_message
+            lobby_messages.move_to_end(user_id)
+            while lobby_messages:
+                oldest = next(iter(lobby_messages.values()))
+                if len(lobby_messages) <= PRESENCE_MAX_USERS and now - oldest[1] < DIGEST_LOBBY_REUSE_SECONDS:
+                    break
+                lobby_messages.popitem(last=False)
 
     def show_active_games(self, chat_id, message_id):
         """Show active games waiting for players"""
         current_time = time.time()
         active_games = []
+        live_games = []
         
         for session_id, session in list(multiplayer_sessions.items()):
-            if current_time - session.get('created_at', 0) > 600:
-                del multiplayer_sessions[session_id]
+            last_activity = session.get('last_activity', session.get('created_at', 0))
+            if current_time - last_activity > 600 and session_id not in tournament_by_session:
+                self.release_session(session_id)
                 continue
             
-            if session.get('status') == 'waiting':
+            if session.get('status') == 'waiting' and not session.get('shared_board'):
                 active_games.append((session_id, session))
+            elif session.get('status') == 'active' and session.get('game_state'):
+                live_games.append((session_id, session))
         
-        if not active_games:
+        if not active_games and not live_games:
             no_games_text = (
                 "🔍 <b>No Active Games</b> 🔍\n\n"
                 "There are no games waiting for players right now.\n\n"
@@ -442,12 +1739,32 @@ class SimpleLocalBot:
             game_name = GAMES.get(session['game_type'], {}).get('name', 'Game')
             host_name = session.get('host_name', 'Player')
             
-            games_text += f"• {game_name} by {host_name}\n"
+            if session.get('party'):
+                games_text += f"• ⚡ Reaction Party by {host_name} ({len(session['players'])} players)\n"
+                keyboard_buttons.append([{'text': '⚡ Join Reaction Party', 'callback_data': f'party_view_{session_id}'}])
+                continue
+            series_label = f" (Bo{session['series']['best_of']})" if session.get('series') else ""
+            games_text += f"• {game_name} by {host_name}{series_label}\n"
             keyboard_buttons.append([{
                 'text': f'🎮 Join {game_name}',
                 'callback_data': f'join_{session_id}'
             }])
         
+        if live_games:
+            games_text += ("\n" if active_games else "") + "👀 <b>Live now</b>\n"
+        for session_id, session in live_games[:5]:
+            game_name = GAMES.get(session['game_type'], {}).get('name', 'Game')
+            if session.get('party'):
+                player_names = f"Reaction Party ({len(session['players'])} players)"
+                games_text += f"• ⚡ {player_names}\n"
+            else:
+                player_names = " vs ".join(session.get('player_names', {}).get(pid, 'Player') for pid in session['players'])
+                games_text += f"• {game_name}: {player_names}\n"
+            keyboard_buttons.append([{
+                'text': f'👀 Watch {player_names}',
+                'callback_data': f'watch_{session_id}'
+            }])
+        
         keyboard_buttons.append([{'text': '🎮 Create New Game', 'callback_data': 'show_games'}])
         keyboard = {'inline_keyboard': keyboard_buttons}
         
@@ -465,6 +1782,9 @@ class SimpleLocalBot:
         
         session = multiplayer_sessions[session_id]
         
+        if (session.get('shared_board') or session.get('invite_message')) and (user_id == session['host_id'] or len(session['players']) >= 2):
+            return  # Leave the shared group or inline message untouched
+        
         if user_id == session['host_id']:
             self.edit_message(chat_id, message_id, "❌ You can't join your own game!", {
                 'inline_keyboard': [[{'text': '🎮 Back to Games', 'callback_data': 'show_games'}]]
@@ -484,39 +1804,53 @@ class SimpleLocalBot:
             user_id: user_data.get('first_name', 'Player')
         }
         
-        host_notification = f"🎮 {user_data.get('first_name', 'Player')} joined your game! Starting now..."
-        self.send_message(session['host_id'], host_notification)
+        if not session.get('shared_board'):
+            host_notification = f"🎮 {user_data.get('first_name', 'Player')} joined your game! Starting now..."
+            self.send_message(session['host_id'], host_notification)
+        if session.get('invite_message'):
+            self.edit_message(*session['invite_message'], (
+                f"🎮 <b>{GAMES[session['game_type']]['name']}</b> 🎮\n\n"
+                f"{session['host_name']} vs {user_data.get('first_name', 'Player')} - game on!\n"
+                f"The game continues in your private chats with the bot."
+            ))
         
         self.start_multiplayer_game(chat_id, message_id, user_id, session_id)
 
     def show_scoreboard(self, chat_id, message_id, user_id):
         """Show comprehensive scoreboard"""
-        self.register_user({'id': user_id, 'first_name': 'Player'})
+        self.touch_user(user_id)
         
+        scoreboard_text = scoreboard_cache.get(user_id)
+        if scoreboard_text is None:
+            scoreboard_text = scoreboard_cache[user_id] = self.render_scoreboard(user_id)
+        
+        keyboard = {
+            'inline_keyboard': [
+                [
+                    {'text': '📅 Daily Leaders', 'callback_data': 'leaderboard_daily'},
+                    {'text': '🗓️ Weekly Leaders', 'callback_data': 'leaderboard_weekly'}
+                ],
+                [{'text': '🎮 Play Games', 'callback_data': 'show_games'}]
+            ]
+        }
+        
+        self.edit_message(chat_id, message_id, scoreboard_text, keyboard)
+
+    def render_scoreboard(self, user_id):
+        """Render scoreboard text from the aggregates kept by update_user_game_result"""
         user_stats = game_scores.get(user_id, {})
         total_wins = user_stats.get('total_wins', 0)
-        total_games = sum(game_data.get("games", 0) for game_data in user_stats.values() if isinstance(game_data, dict))
+        total_games = user_stats.get('total_games', 0)
         
         win_rate = (total_wins / total_games * 100) if total_games > 0 else 0
         
-        if total_wins == 0:
-            tier = "🎯 Ready to Play"
-        elif total_wins < 3:
-            tier = "🌟 Getting Started"
-        elif total_wins < 10:
-            tier = "⭐ Rising Star"
-        elif total_wins < 25:
-            tier = "🏆 Skilled Player"
-        else:
-            tier = "👑 Legend Status"
-        
         scoreboard_text = (
             f"🏆 <b>Personal Statistics</b> 🏆\n\n"
             f"👤 <b>Player Profile</b>\n"
             f"Total Wins: {total_wins}\n"
             f"Games Played: {total_games}\n"
             f"Win Rate: {win_rate:.1f}%\n"
-            f"Tier: {tier}\n\n"
+            f"Tier: {user_stats.get('tier', get_player_tier(total_wins))}\n\n"
             f"🎮 <b>Game Breakdown</b>\n"
         )
         
@@ -524,17 +1858,47 @@ class SimpleLocalBot:
             game_stats = user_stats.get(game_key, {'wins': 0, 'games': 0})
             wins = game_stats.get('wins', 0)
             games = game_stats.get('games', 0)
-            game_win_rate = (wins / games * 100) if games > 0 else 0
+            game_win_rate = game_stats.get('win_rate', 0)
             
             scoreboard_text += f"{game_info['name']}: {wins}W/{games}G ({game_win_rate:.0f}%)\n"
         
+        return scoreboard_text
+
+    def show_leaderboard(self, chat_id, message_id, user_id, period):
+        """Show daily/weekly leaderboard for every game"""
+        if period not in rolling_leaderboards:
+            period = 'daily'
+        
+        leaderboard = rolling_leaderboards[period]
+        period_name = LEADERBOARD_PERIODS[period]['name']
+        medals = ['🥇', '🥈', '🥉']
+        
+        leaderboard_text = f"{period_name} <b>Leaderboard</b> 🏆\n\n"
+        
+        for game_key, game_info in GAMES.items():
+            leaderboard_text += f"<b>{game_info['name']}</b>\n"
+            top_players = leaderboard.top(game_key)
+            if not top_players:
+                leaderboard_text += "No wins yet - be the first!\n"
+            for position, (player_id, wins) in enumerate(top_players):
+                player_name = user_data_cache.get(player_id, {}).get('first_name', 'Player')
+                leaderboard_text += f"{medals[position]} {player_name} - {wins}W\n"
+            
+            rank, wins = leaderboard.rank(user_id, game_key)
+            if rank and rank > len(top_players):
+                leaderboard_text += f"You: #{rank} - {wins}W\n"
+            leaderboard_text += "\n"
+        
+        other_period = 'weekly' if period == 'daily' else 'daily'
         keyboard = {
             'inline_keyboard': [
+                [{'text': f"{LEADERBOARD_PERIODS[other_period]['name']} Leaderboard", 'callback_data': f'leaderboard_{other_period}'}],
+                [{'text': '🏆 View Scoreboard', 'callback_data': 'show_scoreboard'}],
                 [{'text': '🎮 Play Games', 'callback_data': 'show_games'}]
             ]
         }
         
-        self.edit_message(chat_id, message_id, scoreboard_text, keyboard)
+        self.edit_message(chat_id, message_id, leaderboard_text.strip(), keyboard)
 
     def start_multiplayer_game(self, chat_id, message_id, user_id, session_id):
         """Start a multiplayer game"""
@@ -585,6 +1949,7 @@ class SimpleLocalBot:
         if session_id not in multiplayer_sessions:
             return
         
+        self.publish_spectator_view(session_id)
         session = multiplayer_sessions[session_id]
         game_state = session['game_state']
         player1_id, player2_id = session['players']
@@ -592,6 +1957,11 @@ class SimpleLocalBot:
         current_player_id = session['players'][game_state['current_turn']]
         other_player_id = session['players'][1 - game_state['current_turn']]
         
+        if session.get('shared_board'):
+            self.update_shared_board(session_id)
+            self.start_turn_timer(session_id, current_player_id)
+            return
+        
         board_text = format_board(game_state['board'])
         
         current_player_text = (
@@ -626,12 +1996,12 @@ class SimpleLocalBot:
                     })
             keyboard_buttons.append(row_buttons)
         
-        keyboard_buttons.append([{'text': '🎮 Quit Game', 'callback_data': 'show_games'}])
+        keyboard_buttons.append([{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}])
         
         current_player_keyboard = {'inline_keyboard': keyboard_buttons}
         other_player_keyboard = {
             'inline_keyboard': [
-                [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
+                [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
             ]
         }
         
@@ -640,6 +2010,8 @@ class SimpleLocalBot:
             self.send_message(other_player_id, other_player_text, other_player_keyboard)
         except Exception as e:
             logger.error(f"Error updating Tic-Tac-Toe display: {e}")
+        
+        self.start_turn_timer(session_id, current_player_id)
 
     def handle_tictactoe_move(self, session_id, user_id, position):
         """Handle Tic-Tac-Toe move with INSTANT response and winner checking"""
@@ -674,6 +2046,7 @@ class SimpleLocalBot:
         
         player_symbol = game_state['player_symbols'][user_id]
         game_state['board'][row][col] = player_symbol
+        session.get('missed_turns', {}).pop(user_id, None)
         logger.info(f"Move made: {player_symbol} at {row},{col}")
         
         winner = check_winner(game_state['board'])
@@ -695,6 +2068,11 @@ class SimpleLocalBot:
         game_state = session['game_state']
         player1_id, player2_id = session['players']
         
+        if session.get('shared_board'):
+            symbol_owners = {symbol: pid for pid, symbol in game_state['player_symbols'].items()}
+            self.end_shared_board_game(session_id, symbol_owners.get(winner))
+            return
+        
         board_text = format_board(game_state['board'])
         
         if winner == 'tie':
@@ -705,8 +2083,7 @@ class SimpleLocalBot:
                 f"Great game! Both players showed skill."
             )
             
-            for player_id in session['players']:
-                self.update_user_game_result(player_id, 'tictactoe', False)
+            self.record_match_result(session_id, None)
         else:
             winner_id = None
             for pid, symbol in game_state['player_symbols'].items():
@@ -730,35 +2107,22 @@ class SimpleLocalBot:
                 f"Your opponent won with {winner}. Better luck next time!"
             )
             
-            self.update_user_game_result(winner_id, 'tictactoe', True)
-            self.update_user_game_result(loser_id, 'tictactoe', False)
+            self.record_match_result(session_id, winner_id)
             
-            keyboard = {
-                'inline_keyboard': [
-                    [{'text': '🎮 Play Other Games', 'callback_data': 'show_games'}],
-                    [{'text': '🏆 View Scoreboard', 'callback_data': 'show_scoreboard'}]
-                ]
-            }
+            keyboard = self.game_over_keyboard(session_id)
             
             self.send_message(winner_id, winner_text, keyboard)
             self.send_message(loser_id, loser_text, keyboard)
             
-            del multiplayer_sessions[session_id]
-            
-            self.check_prize_eligibility(winner_id)
+            self.finish_match(session_id, winner_id)
             return
         
-        keyboard = {
-            'inline_keyboard': [
-                [{'text': '🎮 Play Other Games', 'callback_data': 'show_games'}],
-                [{'text': '🏆 View Scoreboard', 'callback_data': 'show_scoreboard'}]
-            ]
-        }
+        keyboard = self.game_over_keyboard(session_id)
         
         for player_id in session['players']:
             self.send_message(player_id, result_text, keyboard)
         
-        del multiplayer_sessions[session_id]
+        self.finish_match(session_id, None)
 
     def start_rps_game(self, session_id):
         """Initialize Rock Paper Scissors game"""
@@ -774,7 +2138,8 @@ class SimpleLocalBot:
             'scores': {player1_id: 0, player2_id: 0},
             'choices': {},
             'session_id': session_id,
-            'waiting_for': [player1_id, player2_id]
+            'waiting_for': [player1_id, player2_id],
+            'variant': session.get('rps_variant', RPS_DEFAULT_VARIANT)
         }
 
     def update_rps_display(self, session_id):
@@ -782,6 +2147,7 @@ class SimpleLocalBot:
         if session_id not in multiplayer_sessions:
             return
         
+        self.publish_spectator_view(session_id)
         session = multiplayer_sessions[session_id]
         game_state = session['game_state']
         player1_id, player2_id = session['players']
@@ -795,14 +2161,8 @@ class SimpleLocalBot:
         player1_score = game_state['scores'][player1_id]
         player2_score = game_state['scores'][player2_id]
         
-        instructions_text = (
-            "📋 <b>Game Rules:</b>\n"
-            "🪨 Rock beats Scissors & Judo\n"
-            "📄 Paper beats Rock & Gun\n"
-            "✂️ Scissors beats Paper & Judo\n"
-            "🔫 Gun beats Rock & Scissors\n"
-            "🥋 Judo beats Paper & Gun\n\n"
-        )
+        rules = RPS_RULES[game_state['variant']]
+        instructions_text = rules['rules_text']
         
         for player_id in [player1_id, player2_id]:
             opponent_id = player2_id if player_id == player1_id else player1_id
@@ -811,11 +2171,7 @@ class SimpleLocalBot:
             
             if player_id in game_state['choices']:
                 # Player has made choice, waiting for opponent
-                choice_emojis = {
-                    'rock': '🪨', 'paper': '📄', 'scissors': '✂️', 
-                    'gun': '🔫', 'judo': '🥋'
-                }
-                player_choice_emoji = choice_emojis.get(game_state['choices'][player_id], '❓')
+                player_choice_emoji = rules['emojis'].get(game_state['choices'][player_id], '❓')
                 
                 waiting_text = (
                     f"🪨 <b>Rock Paper Scissors - Round {current_round}</b> 📄\n\n"
@@ -828,7 +2184,7 @@ class SimpleLocalBot:
                 
                 keyboard = {
                     'inline_keyboard': [
-                        [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
+                        [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
                     ]
                 }
             else:
@@ -841,22 +2197,12 @@ class SimpleLocalBot:
                     f"🎮 <b>Make your choice:</b>"
                 )
                 
-                keyboard = {
-                    'inline_keyboard': [
-                        [
-                            {'text': '🪨 Rock', 'callback_data': f'rps_rock_{session_id}'},
-                            {'text': '📄 Paper', 'callback_data': f'rps_paper_{session_id}'}
-                        ],
-                        [
-                            {'text': '✂️ Scissors', 'callback_data': f'rps_scissors_{session_id}'},
-                            {'text': '🔫 Gun', 'callback_data': f'rps_gun_{session_id}'}
-                        ],
-                        [
-                            {'text': '🥋 Judo', 'callback_data': f'rps_judo_{session_id}'}
-                        ],
-                        [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
-                    ]
-                }
+                keyboard_buttons = [
+                    [{'text': f"{rules['emojis'][weapon]} {weapon.title()}", 'callback_data': f'rps_{weapon}_{session_id}'} for weapon in row]
+                    for row in rules['button_rows']
+                ]
+                keyboard_buttons.append([{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}])
+                keyboard = {'inline_keyboard': keyboard_buttons}
             
             try:
                 if player_id in game_state['choices']:
@@ -885,6 +2231,10 @@ class SimpleLocalBot:
             logger.warning(f"User {user_id} already made choice")
             return
         
+        if choice not in RPS_RULES[game_state['variant']]['position']:
+            logger.warning(f"Choice {choice} is not part of the {game_state['variant']} rules")
+            return
+        
         # Check if game is already being processed (prevent double processing)
         if game_state.get('processing', False):
             logger.warning(f"Game {session_id} already being processed")
@@ -914,12 +2264,8 @@ class SimpleLocalBot:
         choice1 = game_state['choices'][player1_id]
         choice2 = game_state['choices'][player2_id]
         
-        result = determine_rps_winner(choice1, choice2)
-        
-        choice_emojis = {
-            'rock': '🪨', 'paper': '📄', 'scissors': '✂️', 
-            'gun': '🔫', 'judo': '🥋'
-        }
+        result = determine_rps_winner(choice1, choice2, game_state['variant'])
+        choice_emojis = RPS_RULES[game_state['variant']]['emojis']
         
         choice1_emoji = choice_emojis[choice1]
         choice2_emoji = choice_emojis[choice2]
@@ -951,7 +2297,7 @@ class SimpleLocalBot:
                 
                 keyboard = {
                     'inline_keyboard': [
-                        [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
+                        [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
                     ]
                 }
                 
@@ -967,13 +2313,11 @@ class SimpleLocalBot:
         # Check if game should end
         if max(game_state['scores'].values()) >= 2:
             # Small delay then end game
-            import threading
-            threading.Timer(2.0, lambda: self.end_rps_game(session_id)).start()
+            self.start_game_timer(session_id, 2.0, self.end_rps_game)
         else:
             # Increment round for next round and start it
             game_state['round'] += 1
-            import threading  
-            threading.Timer(2.0, lambda: self.update_rps_display(session_id)).start()
+            self.start_game_timer(session_id, 2.0, self.update_rps_display)
 
 
 
@@ -997,102 +2341,103 @@ class SimpleLocalBot:
             loser_id = player1_id
         
         # Update stats
-        self.update_user_game_result(winner_id, 'rps', True)
-        self.update_user_game_result(loser_id, 'rps', False)
+        self.record_match_result(session_id, winner_id)
         
         # Send personalized results
         winner_text = (
             f"🪨 <b>Rock Paper Scissors - GAME OVER</b> 📄\n\n"
             f"🎉 <b>YOU WON!</b> 🎉\n\n"
             f"Final Score: You {game_state['scores'][winner_id]} - {game_state['scores'][loser_id]} Opponent\n\n"
-            f"Excellent strategy! You mastered the Gun & Judo powers!"
+            f"Excellent strategy! You mastered the {RPS_RULES[game_state['variant']]['name']} rules!"
         )
         
         loser_text = (
             f"🪨 <b>Rock Paper Scissors - GAME OVER</b> 📄\n\n"
             f"😔 <b>YOU LOST!</b> 😔\n\n"
             f"Final Score: You {game_state['scores'][loser_id]} - {game_state['scores'][winner_id]} Opponent\n\n"
-            f"Good game! Practice with Gun & Judo for better results!"
+            f"Good game! Practice the {RPS_RULES[game_state['variant']]['name']} rules for better results!"
         )
         
-        keyboard = {
-            'inline_keyboard': [
-                [{'text': '🎮 Play Other Games', 'callback_data': 'show_games'}],
-                [{'text': '🏆 View Scoreboard', 'callback_data': 'show_scoreboard'}]
-            ]
-        }
+        keyboard = self.game_over_keyboard(session_id)
         
         self.send_message(winner_id, winner_text, keyboard)
         self.send_message(loser_id, loser_text, keyboard)
         
-        del multiplayer_sessions[session_id]
-        self.check_prize_eligibility(winner_id)
+        self.finish_match(session_id, winner_id)
 
     def start_reaction_game(self, session_id):
-        """Initialize Reaction Game"""
+        """Initialize Reaction Game for any number of players"""
         if session_id not in multiplayer_sessions:
             return
         
         session = multiplayer_sessions[session_id]
-        player1_id, player2_id = session['players']
         
         session['game_state'] = {
             'round': 1,
             'max_rounds': 5,
-            'scores': {player1_id: 0, player2_id: 0},
+            'scores': {player_id: 0 for player_id in session['players']},
+            'slots': {player_id: slot for slot, player_id in enumerate(session['players'])},  # index into tap_times
             'current_phase': 'waiting_ready',
             'ready_players': set(),
             'round_start_time': None,
             'round_active': False,
+            'tap_times': None,
             'session_id': session_id,
             'green_count': 0,
             'max_green_rounds': 3
         }
 
+    def render_reaction_standings(self, session):
+        """Shared standings block, rendered once per update for every participant"""
+        game_state = session['game_state']
+        names = session.get('player_names', {})
+        ranked = sorted(session['players'], key=lambda pid: -game_state['scores'][pid])
+        lines = [f"{position}. {names.get(pid, 'Player')} - {game_state['scores'][pid]} pts"
+                 for position, pid in enumerate(ranked[:REACTION_STANDINGS_SHOWN], 1)]
+        if len(ranked) > REACTION_STANDINGS_SHOWN:
+            lines.append(f"... and {len(ranked) - REACTION_STANDINGS_SHOWN} more")
+        return "🏆 <b>Standings:</b>\n" + "\n".join(lines)
+
     def update_reaction_display(self, session_id):
-        """Update Reaction Game display for both players"""
+        """Update Reaction Game display for all players"""
         if session_id not in multiplayer_sessions:
             return
         
+        self.publish_spectator_view(session_id)
         session = multiplayer_sessions[session_id]
         game_state = session['game_state']
-        player1_id, player2_id = session['players']
+        
+        if game_state['current_phase'] != 'waiting_ready':
+            return
         
         current_round = game_state['round']
+        ready_text = (
+            f"⚡ <b>Reaction Game - Round {current_round}/5</b> ⚡\n\n"
+            f"📋 <b>Rules:</b>\n"
+            f"• Wait for GREEN circle (🟢)\n"
+            f"• Tap as fast as possible when you see it\n"
+            f"• DON'T tap on red (🔴) or yellow (🟡)\n"
+            f"• Score points based on reaction time!\n\n"
+            f"{self.render_reaction_standings(session)}\n\n"
+            f"🎯 <b>Get ready for Round {current_round}!</b>"
+        )
+        ready_keyboard = {
+            'inline_keyboard': [
+                [{'text': '✅ Ready! Waiting for the others...', 'callback_data': 'noop'}],
+                [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
+            ]
+        }
+        not_ready_keyboard = {
+            'inline_keyboard': [
+                [{'text': '🚀 I\'m Ready!', 'callback_data': f'reaction_ready_{session_id}'}],
+                [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
+            ]
+        }
         
-        for player_id in [player1_id, player2_id]:
-            opponent_id = player2_id if player_id == player1_id else player1_id
-            player_score = game_state['scores'][player_id]
-            opponent_score = game_state['scores'][opponent_id]
-            
-            if game_state['current_phase'] == 'waiting_ready':
-                ready_text = (
-                    f"⚡ <b>Reaction Game - Round {current_round}/5</b> ⚡\n\n"
-                    f"📋 <b>Rules:</b>\n"
-                    f"• Wait for GREEN circle (🟢)\n"
-                    f"• Tap as fast as possible when you see it\n"
-                    f"• DON'T tap on red (🔴) or yellow (🟡)\n"
-                    f"• Score points based on reaction time!\n\n"
-                    f"Score: You {player_score} - {opponent_score} Opponent\n\n"
-                    f"🎯 <b>Get ready for Round {current_round}!</b>"
-                )
-                
-                if player_id in game_state['ready_players']:
-                    keyboard = {
-                        'inline_keyboard': [
-                            [{'text': '✅ Ready! Waiting for opponent...', 'callback_data': 'noop'}],
-                            [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
-                        ]
-                    }
-                else:
-                    keyboard = {
-                        'inline_keyboard': [
-                            [{'text': '🚀 I\'m Ready!', 'callback_data': f'reaction_ready_{session_id}'}],
-                            [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
-                        ]
-                    }
-                
-                self.send_message(player_id, ready_text, keyboard)
+        self.send_batch(
+            (player_id, ready_text, ready_keyboard if player_id in game_state['ready_players'] else not_ready_keyboard)
+            for player_id in session['players']
+        )
 
     def handle_reaction_ready(self, session_id, user_id):
         """Handle player ready for reaction round"""
@@ -1101,58 +2446,60 @@ class SimpleLocalBot:
         
         session = multiplayer_sessions[session_id]
         game_state = session['game_state']
-        player1_id, player2_id = session['players']
         
-        if user_id not in session['players']:
+        if user_id not in session['players'] or game_state['current_phase'] != 'waiting_ready':
+            return
+        if user_id in game_state['ready_players']:
             return
         
         game_state['ready_players'].add(user_id)
+        not_ready = [pid for pid in session['players'] if pid not in game_state['ready_players']]
         
-        # Check if both players are ready
-        if len(game_state['ready_players']) == 2:
-            # Both players ready - send countdown message
-            countdown_text = (
-                f"🚀 <b>Both players are ready!</b> 🚀\n\n"
-                f"Get ready to start Round {game_state['round']}!\n\n"
-                f"⏰ <b>Starting in 10 seconds...</b>"
-            )
-            
-            keyboard = {
-                'inline_keyboard': [
-                    [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
-                ]
-            }
-            
-            # Send countdown to both players
-            for player_id in session['players']:
-                self.send_message(player_id, countdown_text, keyboard)
-            
-            # Start countdown timer
-            import threading
-            threading.Timer(10.0, lambda: self.start_reaction_round(session_id)).start()
-        else:
-            # Only one player ready - send waiting message
-            ready_player = user_id
-            waiting_player = player2_id if user_id == player1_id else player1_id
-            
-            # Send confirmation to ready player
-            self.send_message(ready_player, "✅ You are ready! Waiting for opponent...")
-            
-            # Send notification to waiting player
+        if not not_ready:
+            self.start_reaction_countdown(session_id)
+            return
+        
+        self.send_message(user_id, f"✅ You are ready! Waiting for {len(not_ready)} more player{'s' if len(not_ready) != 1 else ''}...")
+        
+        if len(not_ready) == 1:
+            # Nudge the last straggler only, so a big lobby doesn't get a message per ready tap
             waiting_text = (
                 f"⏳ <b>Waiting for you to get ready!</b>\n\n"
-                f"Your opponent is ready for Round {game_state['round']}.\n"
+                f"Everyone else is ready for Round {game_state['round']}.\n"
                 f"Click Ready when you're prepared!"
             )
             
             keyboard = {
                 'inline_keyboard': [
                     [{'text': '✅ Ready!', 'callback_data': f'reaction_ready_{session_id}'}],
-                    [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
+                    [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
                 ]
             }
             
-            self.send_message(waiting_player, waiting_text, keyboard)
+            self.send_message(not_ready[0], waiting_text, keyboard)
+
+    def start_reaction_countdown(self, session_id):
+        """Everyone is ready: announce the countdown and schedule the round"""
+        session = multiplayer_sessions[session_id]
+        game_state = session['game_state']
+        game_state['current_phase'] = 'countdown'
+        
+        countdown_text = (
+            f"🚀 <b>All players are ready!</b> 🚀\n\n"
+            f"Get ready to start Round {game_state['round']}!\n\n"
+            f"⏰ <b>Starting in 10 seconds...</b>"
+        )
+        
+        keyboard = {
+            'inline_keyboard': [
+                [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
+            ]
+        }
+        
+        self.send_batch((player_id, countdown_text, keyboard) for player_id in session['players'])
+        
+        # Start countdown timer
+        self.start_game_timer(session_id, 10.0, self.start_reaction_round)
 
     def start_reaction_round(self, session_id):
         """Start reaction round with random delay"""
@@ -1167,26 +2514,35 @@ class SimpleLocalBot:
             return
         game_state['round_starting'] = True
         
-        # Show "Get Ready" message to both players
-        for player_id in session['players']:
-            ready_text = (
-                f"⚡ <b>Round {game_state['round']}/5</b> ⚡\n\n"
-                f"🔴 <b>GET READY...</b>\n\n"
-                f"Wait for the GREEN circle!"
-            )
-            
-            keyboard = {
-                'inline_keyboard': [
-                    [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
-                ]
-            }
-            
-            self.send_message(player_id, ready_text, keyboard)
+        # Post the round message now; the reveal later only swaps its button
+        ready_text = (
+            f"⚡ <b>Round {game_state['round']}/5</b> ⚡\n\n"
+            f"🔴 <b>GET READY...</b>\n\n"
+            f"Tap the button below only when it turns GREEN (🟢)!"
+        )
+        
+        keyboard = {
+            'inline_keyboard': [
+                [{'text': '⚪ Wait for it...', 'callback_data': 'noop'}],
+                [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
+            ]
+        }
+        
+        round_messages = game_state['round_messages'] = {}  # player_id -> message_id of this round's message
+        
+        def post(player_id):
+            sent_at = time.perf_counter_ns()
+            response = self.send_message(player_id, ready_text, keyboard)
+            if response:
+                request_rtt.observe(player_id, time.perf_counter_ns() - sent_at)
+                round_messages[player_id] = response['result']['message_id']
+        
+        for future in [reveal_pool.submit(post, player_id) for player_id in session['players']]:
+            future.result()
         
         # Random delay between 2.5-3.5 seconds, then show green or fake-out
-        import threading
         delay = random.uniform(2.5, 3.5)
-        threading.Timer(delay, lambda: self.show_reaction_target(session_id)).start()
+        self.start_game_timer(session_id, delay, self.show_reaction_target)
 
     def show_reaction_target(self, session_id):
         """Show reaction target (green or fake-out)"""
@@ -1207,25 +2563,28 @@ class SimpleLocalBot:
         
         if is_green and random.random() < 0.7:  # 70% chance for green if we haven't hit max
             # GREEN - Real reaction test
-            game_state['round_active'] = True
-            game_state['round_start_time'] = time.time()
+            game_state['current_phase'] = 'target'
             game_state['green_count'] += 1
-            game_state['round_taps'] = {}  # Track both players' taps
+            # One perf_counter_ns tap stamp per player slot, 0 until they tap
+            game_state['tap_times'] = array('q', bytes(8 * len(game_state['slots'])))
+            game_state['reveal_times'] = array('q', bytes(8 * len(game_state['slots'])))  # when each player's reveal request went out
             
             target_text = (
                 f"⚡ <b>Round {game_state['round']}/5</b> ⚡\n\n"
                 f"🟢 <b>TAP NOW!</b> 🟢\n\n"
-                f"Both players can score points!"
+                f"Everyone can score points!"
             )
             
             keyboard = {
                 'inline_keyboard': [
-                    [{'text': '🟢 TAP!', 'callback_data': f'reaction_tap_{session_id}'}],
-                    [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
+                    [{'text': '🟢 TAP NOW! 🟢', 'callback_data': f'reaction_tap_{session_id}'}],
+                    [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
                 ]
             }
         else:
             # FAKE-OUT - Red or Yellow
+            is_green = False
+            game_state['current_phase'] = 'fake_out'
             fake_color = random.choice(['🔴', '🟡'])
             color_name = "RED" if fake_color == '🔴' else "YELLOW"
             
@@ -1238,128 +2597,80 @@ class SimpleLocalBot:
             # Clickable button for fake-outs - players get penalized if they click
             keyboard = {
                 'inline_keyboard': [
-                    [{'text': f'{fake_color} TAP', 'callback_data': f'reaction_wrong_{session_id}'}],
-                    [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
+                    [{'text': f'{fake_color} {color_name} - DON\'T TAP {fake_color}', 'callback_data': f'reaction_wrong_{session_id}'}],
+                    [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
                 ]
             }
         
-        for player_id in session['players']:
-            self.send_message(player_id, target_text, keyboard)
+        if is_green:
+            game_state['round_start_time'] = time.perf_counter_ns()
+            game_state['round_active'] = True
+        self.reveal_reaction_target(session_id, target_text, keyboard, is_green)
         
         if not is_green:
             # Auto-continue fake-out rounds after 3 seconds with success message (only if no wrong taps)
-            import threading
-            threading.Timer(3.0, lambda: self.handle_fake_out_auto_continue(session_id)).start()
+            self.start_game_timer(session_id, 3.0, self.handle_fake_out_auto_continue)
         else:
-            # For green rounds, auto-end after 4.0 seconds to give both players time
-            import threading
-            threading.Timer(4.0, lambda: self.check_reaction_timeout(session_id)).start()
+            # For green rounds, auto-end after 4.0 seconds unless everyone taps sooner
+            self.start_game_timer(session_id, 4.0, self.check_reaction_timeout)
 
-    def handle_reaction_tap(self, session_id, user_id):
-        """Handle reaction tap"""
-        logger.info(f"DETAILED DEBUG - handle_reaction_tap called for user {user_id} in session {session_id}")
-        
-        if session_id not in multiplayer_sessions:
-            logger.error(f"FAILURE: Session {session_id} not found for user {user_id}")
-            return
-        
+    def reveal_reaction_target(self, session_id, text, keyboard, is_green):
+        """Reveal the target to every player at once, recording when each reveal was sent and completed"""
         session = multiplayer_sessions[session_id]
         game_state = session['game_state']
-        logger.info(f"DEBUG - Session found, players: {session['players']}")
-        
-        if not game_state.get('round_active', False):
-            logger.error(f"FAILURE: Round not active for session {session_id}, user {user_id}. round_active={game_state.get('round_active')}")
+        round_messages = game_state.get('round_messages', {})
+        slots = game_state['slots']
+        # Held locally: the round can end (and drop its arrays) while the last sends are still returning
+        reveal_times = game_state['reveal_times'] if is_green else None
+        players = list(session['players'])
+        round_number = game_state['round']
+        completed = array('q', bytes(8 * len(players)))
+        dispatched = time.perf_counter_ns()
+        
+        def send(index, player_id):
+            sent_at = time.perf_counter_ns()
+            if reveal_times is not None:
+                # Telegram may push the reveal to the client before our request returns, so taps
+                # are timed from just before the request; completion is only an upper bound
+                reveal_times[slots[player_id]] = sent_at
+            # Swapping the pre-posted message's buttons is a tiny request; a full message is the fallback
+            message_id = round_messages.get(player_id)
+            if (message_id and self.edit_message_markup(player_id, message_id, keyboard)) or self.send_message(player_id, text, keyboard):
+                completed[index] = time.perf_counter_ns()
+                request_rtt.observe(player_id, completed[index] - sent_at)
+        
+        for future in [reveal_pool.submit(send, index, player_id) for index, player_id in enumerate(players)]:
+            future.result()
+        
+        landed = [stamp for stamp in completed if stamp]
+        if len(landed) < 2:
             return
-        
-        if user_id not in session['players']:
-            logger.error(f"FAILURE: User {user_id} not in session {session_id} players {session['players']}")
+        skew_ms = (max(landed) - min(landed)) / 1e6
+        with reveal_skews_lock:
+            reveal_skews.append(skew_ms)
+        logger.info(
+            f"Reaction reveal {session_id} round {round_number}: {len(landed)}/{len(players)} delivered, "
+            f"skew {skew_ms:.1f}ms, slowest {(max(landed) - dispatched) / 1e6:.1f}ms after dispatch"
+        )
+
+    def handle_reaction_tap(self, session_id, user_id, tap_time):
+        """Record a tap's arrival timestamp; scoring happens once for everyone when the round ends"""
+        session = multiplayer_sessions.get(session_id)
+        if not session:
             return
         
-        # Check if player already tapped this round
-        current_round_taps = game_state.get('round_taps', {})
-        logger.info(f"DEBUG - Current round_taps: {current_round_taps}")
-        if user_id in current_round_taps:
-            logger.error(f"FAILURE: User {user_id} already tapped this round. round_taps={current_round_taps}")
+        game_state = session['game_state']
+        slot = game_state['slots'].get(user_id)
+        if not game_state.get('round_active', False) or user_id not in session['players'] or slot is None:
             return
         
-        # Calculate reaction time with network latency compensation
-        start_time = game_state.get('round_start_time', 0)
-        tap_time = time.time()
-        raw_reaction_time = tap_time - start_time
-        
-        # Check if this is the first or second tap to determine relative timing
-        current_round_taps = game_state.get('round_taps', {})
-        if len(current_round_taps) == 0:
-            # First player to tap - use raw time
-            reaction_time = raw_reaction_time
-            game_state['first_tap_time'] = tap_time
-        else:
-            # Second player to tap - calculate relative to first tap
-            first_tap_time = game_state.get('first_tap_time', tap_time)
-            time_difference = tap_time - first_tap_time
-            
-            # If second player tapped within 0.5 seconds of first, they likely tapped faster
-            # Adjust their time to be more fair
-            if time_difference < 0.5:
-                # Give them a bonus for quick follow-up (likely they tapped simultaneously)
-                reaction_time = raw_reaction_time - (0.5 - time_difference)
-            else:
-                reaction_time = raw_reaction_time
-        
-        # Ensure minimum reaction time of 0.1 seconds
-        reaction_time = max(0.1, reaction_time)
-        
-        logger.info(f"DEBUG - Player {user_id} timing: start={start_time}, tap={tap_time}, raw={raw_reaction_time:.3f}, adjusted={reaction_time:.3f}")
-        
-        # Award points based on precise reaction time - same calculation for all players
-        # Using continuous formula to ensure exact timing fairness
-        if reaction_time <= 0.5:
-            points = 100
-        elif reaction_time <= 1.0:
-            # Linear interpolation from 100 to 75 points
-            points = int(100 - (reaction_time - 0.5) * 50)
-        elif reaction_time <= 2.0:
-            # Linear interpolation from 75 to 30 points
-            points = int(75 - (reaction_time - 1.0) * 45)
-        elif reaction_time <= 3.0:
-            # Linear interpolation from 30 to 10 points
-            points = int(30 - (reaction_time - 2.0) * 20)
-        else:
-            points = 10
-        
-        # Ensure minimum 10 points for any tap
-        points = max(10, points)
-        
-        logger.info(f"DEBUG - Calculated points: {points} for reaction time {reaction_time}")
-        
-        # Ensure scores dict exists for this user
-        if user_id not in game_state['scores']:
-            game_state['scores'][user_id] = 0
-            logger.info(f"DEBUG - Initialized score for user {user_id}")
-        
-        old_score = game_state['scores'][user_id]
-        game_state['scores'][user_id] += points
-        new_score = game_state['scores'][user_id]
-        logger.info(f"DEBUG - Score update: {old_score} -> {new_score} (+{points})")
-        
-        # Store this player's tap with precise timestamp
-        if 'round_taps' not in game_state:
-            game_state['round_taps'] = {}
-        game_state['round_taps'][user_id] = {
-            'reaction_time': reaction_time,
-            'points': points,
-            'tap_timestamp': tap_time  # Store exact timestamp for comparison
-        }
-        logger.info(f"DEBUG - Stored tap data for user {user_id}: {game_state['round_taps'][user_id]}")
-        
-        logger.info(f"SUCCESS - User {user_id} tapped - time: {reaction_time:.3f}s, points: {points}, total score: {game_state['scores'][user_id]}")
+        tap_times = game_state['tap_times']
+        if tap_times[slot]:
+            return  # Already tapped this round
+        tap_times[slot] = tap_time
         
-        # Send immediate feedback to the player who tapped
-        self.send_message(user_id, f"⚡ TAPPED! Your time: {reaction_time:.3f}s (+{points} pts)")
-        
-        # Allow both players to score - don't end round immediately
-        # The timeout will handle the round end to ensure both players can tap
-        pass
+        if all(tap_times[game_state['slots'][pid]] for pid in session['players']):
+            self.handle_reaction_round_end(session_id)
 
     def handle_reaction_wrong(self, session_id, user_id):
         """Handle wrong tap (on red/yellow)"""
@@ -1368,7 +2679,9 @@ class SimpleLocalBot:
         
         session = multiplayer_sessions[session_id]
         game_state = session['game_state']
-        player1_id, player2_id = session['players']
+        
+        if user_id not in session['players'] or game_state['current_phase'] != 'fake_out':
+            return
         
         # Check if this player already got penalized this round to prevent double penalty
         if 'wrong_taps' not in game_state:
@@ -1388,8 +2701,7 @@ class SimpleLocalBot:
         if not game_state.get('fake_out_triggered', False):
             game_state['fake_out_triggered'] = True
             # Continue to next round after penalty
-            import threading
-            threading.Timer(2.0, lambda: self.handle_fake_out_success(session_id)).start()
+            self.start_game_timer(session_id, 2.0, self.handle_fake_out_success)
 
     def handle_fake_out_success(self, session_id):
         """Handle fake-out round results"""
@@ -1398,60 +2710,28 @@ class SimpleLocalBot:
         
         session = multiplayer_sessions[session_id]
         game_state = session['game_state']
-        player1_id, player2_id = session['players']
         
         # Check who tapped wrong this round
         wrong_taps = game_state.get('wrong_taps', set())
         
-        # Show personalized results to each player
+        # Shared part rendered once; each player only gets their own line on top
+        if wrong_taps:
+            summary = f"❌ {len(wrong_taps)} player{'s' if len(wrong_taps) != 1 else ''} tapped the fake-out (-20 pts)"
+        else:
+            summary = "✅ Nobody fell for the fake-out!"
+        shared_text = f"{summary}\n\n{self.render_reaction_standings(session)}"
+        
+        keyboard = {
+            'inline_keyboard': [
+                [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
+            ]
+        }
+        
+        messages = []
         for player_id in session['players']:
-            opponent_id = player2_id if player_id == player1_id else player1_id
-            player_score = game_state['scores'][player_id]
-            opponent_score = game_state['scores'][opponent_id]
-            
-            player_tapped_wrong = player_id in wrong_taps
-            opponent_tapped_wrong = opponent_id in wrong_taps
-            
-            if player_tapped_wrong and opponent_tapped_wrong:
-                # Both tapped wrong
-                success_text = (
-                    f"⚡ <b>Round {game_state['round']} Results</b> ⚡\n\n"
-                    f"❌ <b>Both players tapped wrong!</b> ❌\n\n"
-                    f"Both got -20 points penalty!\n\n"
-                    f"Score: You {player_score} - {opponent_score} Opponent"
-                )
-            elif player_tapped_wrong:
-                # You tapped wrong, opponent didn't
-                success_text = (
-                    f"⚡ <b>Round {game_state['round']} Results</b> ⚡\n\n"
-                    f"❌ <b>You tapped wrong!</b> (-20 pts)\n"
-                    f"✅ <b>Opponent avoided it!</b> (0 pts)\n\n"
-                    f"Score: You {player_score} - {opponent_score} Opponent"
-                )
-            elif opponent_tapped_wrong:
-                # Opponent tapped wrong, you didn't
-                success_text = (
-                    f"⚡ <b>Round {game_state['round']} Results</b> ⚡\n\n"
-                    f"✅ <b>You avoided the fake-out!</b> (0 pts)\n"
-                    f"❌ <b>Opponent tapped wrong!</b> (-20 pts)\n\n"
-                    f"Score: You {player_score} - {opponent_score} Opponent"
-                )
-            else:
-                # Neither tapped wrong
-                success_text = (
-                    f"⚡ <b>Round {game_state['round']} Results</b> ⚡\n\n"
-                    f"✅ <b>Good job! You avoided the fake-out!</b> ✅\n\n"
-                    f"Both players correctly didn't tap!\n\n"
-                    f"Score: You {player_score} - {opponent_score} Opponent"
-                )
-            
-            keyboard = {
-                'inline_keyboard': [
-                    [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
-                ]
-            }
-            
-            self.send_message(player_id, success_text, keyboard)
+            personal = "❌ <b>You tapped wrong!</b> (-20 pts)" if player_id in wrong_taps else "✅ <b>You avoided the fake-out!</b> (0 pts)"
+            messages.append((player_id, f"⚡ <b>Round {game_state['round']} Results</b> ⚡\n\n{personal}\n{shared_text}", keyboard))
+        self.send_batch(messages)
         
         # Clear wrong taps and fake out trigger for next round
         game_state['wrong_taps'] = set()
@@ -1459,15 +2739,13 @@ class SimpleLocalBot:
         
         # Move to next round after fake-out results (only for fake-out rounds)
         if game_state['round'] >= 5:
-            import threading
-            threading.Timer(2.0, lambda: self.end_reaction_game(session_id)).start()
+            self.start_game_timer(session_id, 2.0, self.end_reaction_game)
         else:
             game_state['round'] += 1
             game_state['ready_players'] = set()
             game_state['target_showing'] = False
             game_state['current_phase'] = 'waiting_ready'
-            import threading
-            threading.Timer(2.0, lambda: self.update_reaction_display(session_id)).start()
+            self.start_game_timer(session_id, 2.0, self.update_reaction_display)
         
     def handle_fake_out_auto_continue(self, session_id):
         """Auto-continue fake-out round if no one tapped wrong"""
@@ -1490,20 +2768,19 @@ class SimpleLocalBot:
         game_state = session['game_state']
         
         if game_state.get('round_active', False):
-            # End round due to timeout - this ensures both players' taps are recorded
+            # End round due to timeout - this ensures every tap that arrived is scored
             self.handle_reaction_round_end(session_id)
 
     def handle_reaction_round_end(self, session_id):
-        """End reaction round and show results"""
+        """Rank every tap of the round in one pass and send each player one result message"""
         if session_id not in multiplayer_sessions:
             return
         
         session = multiplayer_sessions[session_id]
         game_state = session['game_state']
-        player1_id, player2_id = session['players']
         
         # Prevent duplicate execution
-        if game_state.get('round_ending', False):
+        if game_state.get('round_ending', False) or not game_state.get('round_active', False):
             return
         game_state['round_ending'] = True
         
@@ -1511,83 +2788,69 @@ class SimpleLocalBot:
         game_state['ready_players'] = set()
         game_state['target_showing'] = False
         
-        # Get round results
-        round_taps = game_state.get('round_taps', {})
+        tap_times = game_state['tap_times']
+        reveal_times = game_state['reveal_times']
+        slots = game_state['slots']
+        names = session.get('player_names', {})
         
-        # Show personalized round results
+        # Time each tap from when that player's reveal went out; slower-than-median request RTTs get the difference back
+        compensations = request_rtt.round_compensations(session['players'])
+        spans = {}
         for player_id in session['players']:
-            opponent_id = player2_id if player_id == player1_id else player1_id
-            player_score = game_state['scores'][player_id]
-            opponent_score = game_state['scores'][opponent_id]
-            
-            if player_id in round_taps and opponent_id in round_taps:
-                # Both players tapped
-                player_time = round_taps[player_id]['reaction_time']
-                player_points = round_taps[player_id]['points']
-                opponent_time = round_taps[opponent_id]['reaction_time']
-                opponent_points = round_taps[opponent_id]['points']
-                
-                result_text = (
-                    f"⚡ <b>Round {game_state['round']} Results</b> ⚡\n\n"
-                    f"⏱️ <b>Your time:</b> {player_time:.3f}s (+{player_points} pts)\n"
-                    f"⏱️ <b>Opponent:</b> {opponent_time:.3f}s (+{opponent_points} pts)\n\n"
-                    f"Score: You {player_score} - {opponent_score} Opponent"
-                )
-            elif player_id in round_taps:
-                # Only you tapped
-                player_time = round_taps[player_id]['reaction_time']
-                player_points = round_taps[player_id]['points']
-                
-                result_text = (
-                    f"⚡ <b>Round {game_state['round']} Results</b> ⚡\n\n"
-                    f"⏱️ <b>Your time:</b> {player_time:.3f}s (+{player_points} pts)\n"
-                    f"😴 <b>Opponent:</b> Too slow! (0 pts)\n\n"
-                    f"Score: You {player_score} - {opponent_score} Opponent"
-                )
-            elif opponent_id in round_taps:
-                # Only opponent tapped
-                opponent_time = round_taps[opponent_id]['reaction_time']
-                opponent_points = round_taps[opponent_id]['points']
-                
-                result_text = (
-                    f"⚡ <b>Round {game_state['round']} Results</b> ⚡\n\n"
-                    f"😴 <b>You:</b> Too slow! (0 pts)\n"
-                    f"⏱️ <b>Opponent:</b> {opponent_time:.3f}s (+{opponent_points} pts)\n\n"
-                    f"Score: You {player_score} - {opponent_score} Opponent"
-                )
+            slot = slots[player_id]
+            if tap_times[slot]:
+                spans[player_id] = max(0, tap_times[slot] - (reveal_times[slot] or game_state['round_start_time']))
+        ranking = sorted((spans[player_id] - compensations[player_id], player_id) for player_id in spans)
+        
+        results = {}
+        for position, (elapsed_ns, player_id) in enumerate(ranking, 1):
+            reaction_time = max(0.1, elapsed_ns / 1e9)
+            points = reaction_points(reaction_time)
+            game_state['scores'][player_id] += points
+            results[player_id] = (position, reaction_time, points)
+        
+        logger.info(f"Reaction round {game_state['round']} in {session_id}: {len(ranking)}/{len(session['players'])} tapped")
+        
+        # Render the shared part once for everyone
+        podium = "\n".join(
+            f"{position}. {names.get(player_id, 'Player')} - {reaction_time:.3f}s (+{points} pts)"
+            for player_id, (position, reaction_time, points) in sorted(results.items(), key=lambda item: item[1][0])[:REACTION_STANDINGS_SHOWN]
+        ) or "😴 Nobody tapped in time!"
+        shared_text = f"⏱️ <b>Fastest:</b>\n{podium}\n\n{self.render_reaction_standings(session)}"
+        
+        keyboard = {
+            'inline_keyboard': [
+                [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
+            ]
+        }
+        
+        messages = []
+        for player_id in session['players']:
+            if player_id in results:
+                position, reaction_time, points = results[player_id]
+                personal = f"⏱️ <b>Your time:</b> {reaction_time:.3f}s (+{points} pts, #{position} of {len(session['players'])})"
+                if compensations[player_id]:
+                    personal += f"\n📶 Includes a {compensations[player_id] / 1e6:.0f}ms connection allowance"
             else:
-                # Neither player tapped
-                result_text = (
-                    f"⚡ <b>Round {game_state['round']} Results</b> ⚡\n\n"
-                    f"😴 <b>Both players too slow!</b>\n"
-                    f"No points awarded this round.\n\n"
-                    f"Score: You {player_score} - {opponent_score} Opponent"
-                )
-            
-            keyboard = {
-                'inline_keyboard': [
-                    [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
-                ]
-            }
-            
-            self.send_message(player_id, result_text, keyboard)
+                personal = "😴 <b>You:</b> Too slow! (0 pts)"
+            messages.append((player_id, f"⚡ <b>Round {game_state['round']} Results</b> ⚡\n\n{personal}\n\n{shared_text}", keyboard))
+        self.send_batch(messages)
         
         # Clear round state
-        game_state['round_taps'] = {}
+        game_state['tap_times'] = None
+        game_state['reveal_times'] = None
         game_state['round_ending'] = False
         
         # Check if game should end (NO DUPLICATE ROUND PROGRESSION HERE)
         if game_state['round'] >= 5:
             # Small delay then end game
-            import threading
-            threading.Timer(2.0, lambda: self.end_reaction_game(session_id)).start()
+            self.start_game_timer(session_id, 2.0, self.end_reaction_game)
         else:
             # Move to next round - reset ready players and increment round
             game_state['round'] += 1
             game_state['ready_players'] = set()
             game_state['current_phase'] = 'waiting_ready'
-            import threading
-            threading.Timer(2.0, lambda: self.update_reaction_display(session_id)).start()
+            self.start_game_timer(session_id, 2.0, self.update_reaction_display)
 
     def end_reaction_game(self, session_id):
         """End Reaction Game and show final results"""
@@ -1596,73 +2859,42 @@ class SimpleLocalBot:
         
         session = multiplayer_sessions[session_id]
         game_state = session['game_state']
-        player1_id, player2_id = session['players']
-        
-        player1_score = game_state['scores'][player1_id]
-        player2_score = game_state['scores'][player2_id]
         
-        if player1_score > player2_score:
-            winner_id = player1_id
-            loser_id = player2_id
-        elif player2_score > player1_score:
-            winner_id = player2_id
-            loser_id = player1_id
-        else:
+        ranked = sorted(session['players'], key=lambda pid: -game_state['scores'][pid])
+        top_score = game_state['scores'][ranked[0]]
+        if len(ranked) > 1 and game_state['scores'][ranked[1]] == top_score:
             winner_id = None  # Tie
+        else:
+            winner_id = ranked[0]
         
         # Update stats
-        if winner_id:
-            loser_id = player2_id if winner_id == player1_id else player1_id
-            self.update_user_game_result(winner_id, 'reaction', True)
-            self.update_user_game_result(loser_id, 'reaction', False)
-        else:
-            # Tie - no wins awarded
-            self.update_user_game_result(player1_id, 'reaction', False)
-            self.update_user_game_result(player2_id, 'reaction', False)
+        self.record_match_result(session_id, winner_id)
         
-        # Send personalized results
-        for player_id in session['players']:
-            opponent_id = player2_id if player_id == player1_id else player1_id
-            player_score = game_state['scores'][player_id]
-            opponent_score = game_state['scores'][opponent_id]
-            
+        standings_text = self.render_reaction_standings(session)
+        keyboard = self.game_over_keyboard(session_id)
+        
+        messages = []
+        for position, player_id in enumerate(ranked, 1):
             if winner_id == player_id:
-                final_text = (
-                    f"⚡ <b>Reaction Game - FINAL RESULTS</b> ⚡\n\n"
-                    f"🎉 <b>YOU WON!</b> 🎉\n\n"
-                    f"Final Score: You {player_score} - {opponent_score} Opponent\n\n"
-                    f"Lightning reflexes! You're a reaction master!"
-                )
-            elif winner_id and winner_id != player_id:
-                final_text = (
-                    f"⚡ <b>Reaction Game - FINAL RESULTS</b> ⚡\n\n"
-                    f"😔 <b>YOU LOST!</b> 😔\n\n"
-                    f"Final Score: You {player_score} - {opponent_score} Opponent\n\n"
-                    f"Good effort! Practice makes perfect reflexes!"
-                )
+                headline = "🎉 <b>YOU WON!</b> 🎉\n\nLightning reflexes! You're a reaction master!"
+            elif winner_id:
+                headline = f"😔 <b>YOU LOST!</b> 😔\n\nYou finished #{position} of {len(ranked)}. Practice makes perfect reflexes!"
+            elif game_state['scores'][player_id] == top_score:
+                headline = "🤝 <b>IT'S A TIE!</b> 🤝\n\nPerfectly matched reflexes!"
             else:
-                final_text = (
-                    f"⚡ <b>Reaction Game - FINAL RESULTS</b> ⚡\n\n"
-                    f"🤝 <b>IT'S A TIE!</b> 🤝\n\n"
-                    f"Final Score: You {player_score} - {opponent_score} Opponent\n\n"
-                    f"Perfectly matched reflexes!"
-                )
+                headline = f"😔 <b>You finished #{position} of {len(ranked)}.</b>\n\nPractice makes perfect reflexes!"
             
-            keyboard = {
-                'inline_keyboard': [
-                    [{'text': '🎮 Play Other Games', 'callback_data': 'show_games'}],
-                    [{'text': '🏆 View Scoreboard', 'callback_data': 'show_scoreboard'}]
-                ]
-            }
-            
-            self.send_message(player_id, final_text, keyboard)
-        
-        # Clean up session safely to prevent KeyError
-        if session_id in multiplayer_sessions:
-            del multiplayer_sessions[session_id]
+            final_text = (
+                f"⚡ <b>Reaction Game - FINAL RESULTS</b> ⚡\n\n"
+                f"{headline}\n\n"
+                f"{standings_text}"
+            )
+            messages.append((player_id, final_text, keyboard))
+        # Series and tournament follow-ups must land after the final results
+        for future in self.send_batch(messages):
+            future.result()
         
-        if winner_id:
-            self.check_prize_eligibility(winner_id)
+        self.finish_match(session_id, winner_id)
 
     def start_memory_game(self, session_id):
         """Initialize Memory Match game"""
@@ -1687,11 +2919,20 @@ class SimpleLocalBot:
         if session_id not in multiplayer_sessions:
             return
         
+        self.publish_spectator_view(session_id)
         session = multiplayer_sessions[session_id]
         game_state = session['game_state']
         player1_id, player2_id = session['players']
         current_player = game_state['current_player']
         
+        # A new turn starts whenever nothing is selected yet
+        if not game_state.get('turn_locked', False) and not game_state['selected_tiles']:
+            self.start_turn_timer(session_id, current_player)
+        
+        if session.get('shared_board'):
+            self.update_shared_board(session_id)
+            return
+        
         # Generate board display
         board_text = ""
         for i, row in enumerate(game_state['board']):
@@ -1751,13 +2992,13 @@ class SimpleLocalBot:
                             })
                     keyboard_buttons.append(button_row)
                 
-                keyboard_buttons.append([{'text': '🎮 Quit Game', 'callback_data': 'show_games'}])
+                keyboard_buttons.append([{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}])
                 keyboard = {'inline_keyboard': keyboard_buttons}
             else:
                 memory_text += f"⏳ <b>Waiting for opponent's move...</b>"
                 keyboard = {
                     'inline_keyboard': [
-                        [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
+                        [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
                     ]
                 }
             
@@ -1787,6 +3028,7 @@ class SimpleLocalBot:
         # Reveal tile
         tile['revealed'] = True
         game_state['selected_tiles'].append(position)
+        session.get('missed_turns', {}).pop(user_id, None)
         
         # Check if this is the second tile selection
         if len(game_state['selected_tiles']) == 2:
@@ -1807,12 +3049,10 @@ class SimpleLocalBot:
                 game_state['matched_pairs'] += 1
                 
                 # Show match result and continue with same player
-                import threading
-                threading.Timer(1.5, lambda: self.handle_memory_match_result(session_id, True)).start()
+                self.start_game_timer(session_id, 1.5, self.handle_memory_match_result, True)
             else:
                 # No match - hide tiles and switch player
-                import threading
-                threading.Timer(1.5, lambda: self.handle_memory_match_result(session_id, False)).start()
+                self.start_game_timer(session_id, 1.5, self.handle_memory_match_result, False)
         
         # Update display immediately
         self.update_memory_display(session_id)
@@ -1864,14 +3104,12 @@ class SimpleLocalBot:
         else:
             winner_id = None  # Tie
         
+        if session.get('shared_board'):
+            self.end_shared_board_game(session_id, winner_id)
+            return
+        
         # Update stats
-        if winner_id:
-            loser_id = player2_id if winner_id == player1_id else player1_id
-            self.update_user_game_result(winner_id, 'memory', True)
-            self.update_user_game_result(loser_id, 'memory', False)
-        else:
-            self.update_user_game_result(player1_id, 'memory', False)
-            self.update_user_game_result(player2_id, 'memory', False)
+        self.record_match_result(session_id, winner_id)
         
         # Send personalized results
         for player_id in session['players']:
@@ -1901,18 +3139,11 @@ class SimpleLocalBot:
                     f"Perfectly matched memory skills!"
                 )
             
-            keyboard = {
-                'inline_keyboard': [
-                    [{'text': '🎮 Play Other Games', 'callback_data': 'show_games'}],
-                    [{'text': '🏆 View Scoreboard', 'callback_data': 'show_scoreboard'}]
-                ]
-            }
+            keyboard = self.game_over_keyboard(session_id)
             
             self.send_message(player_id, final_text, keyboard)
         
-        del multiplayer_sessions[session_id]
-        if winner_id:
-            self.check_prize_eligibility(winner_id)
+        self.finish_match(session_id, winner_id)
 
     def start_qa_game(self, session_id):
         """Initialize Q&A Duel game"""
@@ -1939,6 +3170,7 @@ class SimpleLocalBot:
         if session_id not in multiplayer_sessions:
             return
         
+        self.publish_spectator_view(session_id)
         session = multiplayer_sessions[session_id]
         game_state = session['game_state']
         player1_id, player2_id = session['players']
@@ -1948,6 +3180,8 @@ class SimpleLocalBot:
         current_phase = game_state['phase']
         current_round = game_state['round']
         
+        self.start_turn_timer(session_id, current_answerer if current_phase == 'guess' else current_asker)
+        
         for player_id in [player1_id, player2_id]:
             opponent_id = player2_id if player_id == player1_id else player1_id
             player_score = game_state['scores'][player_id]
@@ -1984,7 +3218,7 @@ class SimpleLocalBot:
             
             keyboard = {
                 'inline_keyboard': [
-                    [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
+                    [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
                 ]
             }
             
@@ -2012,6 +3246,18 @@ class SimpleLocalBot:
         current_asker = game_state['current_asker']
         current_answerer = game_state['current_answerer']
         
+        expects_input = (
+            (current_phase in ('question', 'answer') and user_id == current_asker)
+            or (current_phase == 'guess' and user_id == current_answerer)
+        )
+        if expects_input and qa_content_filter.is_blocked(text):
+            # Never echo blocked text to the opponent
+            self.send_message(user_id, "🚫 That contains blocked words and wasn't sent. Please rephrase:")
+            return True
+        
+        if expects_input:
+            session.get('missed_turns', {}).pop(user_id, None)
+        
         if current_phase == 'question' and user_id == current_asker:
             # Store the question
             game_state['current_question'] = text
@@ -2022,13 +3268,16 @@ class SimpleLocalBot:
         elif current_phase == 'answer' and user_id == current_asker:
             # Store the correct answer
             game_state['current_answer'] = text
+            game_state['answer_matcher'] = AnswerMatcher(text)
             game_state['phase'] = 'guess'
             self.update_qa_display(session_id)
             return True
         
         elif current_phase == 'guess' and user_id == current_answerer:
+            self.cancel_turn_timer(session_id)
+            
             # Check the guess
-            correct = check_answer_similarity(game_state['current_answer'], text)
+            correct = game_state['answer_matcher'].matches(text)
             
             if correct:
                 game_state['scores'][current_answerer] += 1
@@ -2054,32 +3303,38 @@ class SimpleLocalBot:
                 
                 keyboard = {
                     'inline_keyboard': [
-                        [{'text': '🎮 Quit Game', 'callback_data': 'show_games'}]
+                        [{'text': '🎮 Quit Game', 'callback_data': f'quit_{session_id}'}]
                     ]
                 }
                 
                 self.send_message(player_id, round_result, keyboard)
             
-            # Check if game should end
-            if game_state['round'] >= 6:
-                import threading
-                threading.Timer(2.0, lambda: self.end_qa_game(session_id)).start()
-            else:
-                # Next round - switch roles
-                game_state['round'] += 1
-                game_state['current_asker'] = current_answerer
-                game_state['current_answerer'] = current_asker
-                game_state['phase'] = 'question'
-                game_state['current_question'] = ''
-                game_state['current_answer'] = ''
-                
-                import threading
-                threading.Timer(2.0, lambda: self.update_qa_display(session_id)).start()
-            
+            self.advance_qa_round(session_id)
             return True
         
         return False
 
+    def advance_qa_round(self, session_id):
+        """Move Q&A Duel to the next round (switching roles) or end it"""
+        session = multiplayer_sessions[session_id]
+        game_state = session['game_state']
+        
+        # Check if game should end
+        if game_state['round'] >= 6:
+            self.start_game_timer(session_id, 2.0, self.end_qa_game)
+        else:
+            # Next round - switch roles
+            game_state['round'] += 1
+            game_state['current_asker'], game_state['current_answerer'] = (
+                game_state['current_answerer'], game_state['current_asker']
+            )
+            game_state['phase'] = 'question'
+            game_state['current_question'] = ''
+            game_state['current_answer'] = ''
+            game_state['answer_matcher'] = None
+            
+            self.start_game_timer(session_id, 2.0, self.update_qa_display)
+
     def end_qa_game(self, session_id):
         """End Q&A Duel game and show results"""
         if session_id not in multiplayer_sessions:
@@ -2100,13 +3355,7 @@ class SimpleLocalBot:
             winner_id = None  # Tie
         
         # Update stats
-        if winner_id:
-            loser_id = player2_id if winner_id == player1_id else player1_id
-            self.update_user_game_result(winner_id, 'qa', True)
-            self.update_user_game_result(loser_id, 'qa', False)
-        else:
-            self.update_user_game_result(player1_id, 'qa', False)
-            self.update_user_game_result(player2_id, 'qa', False)
+        self.record_match_result(session_id, winner_id)
         
         # Send personalized results
         for player_id in session['players']:
@@ -2136,19 +3385,622 @@ class SimpleLocalBot:
                     f"Evenly matched intellects!"
                 )
             
-            keyboard = {
+            keyboard = self.game_over_keyboard(session_id)
+            
+            self.send_message(player_id, final_text, keyboard)
+        
+        self.finish_match(session_id, winner_id)
+
+    def show_solo_qa_menu(self, chat_id, message_id):
+        """Let the player pick a question category for solo practice"""
+        try:
+            categories = question_bank.categories()
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading question bank: {e}")
+            self.edit_message(chat_id, message_id, "❌ Question bank is not available right now.", {
+                'inline_keyboard': [[{'text': '🎮 Back to Games', 'callback_data': 'show_games'}]]
+            })
+            return
+        
+        menu_text = (
+            "📚 <b>Solo Q&A Practice</b> 📚\n\n"
+            "Answer questions from the question bank - no opponent needed!\n\n"
+            "Choose a category:"
+        )
+        
+        category_buttons = [
+            {'text': f'📂 {category.title()}', 'callback_data': f'soloqa_cat_{category}'}
+            for category in categories
+        ]
+        keyboard_buttons = [category_buttons[i:i + 2] for i in range(0, len(category_buttons), 2)]
+        keyboard_buttons.append([{'text': '🎲 Any Category', 'callback_data': 'soloqa_cat_any'}])
+        keyboard_buttons.append([{'text': '🎮 Back to Games', 'callback_data': 'show_games'}])
+        
+        self.edit_message(chat_id, message_id, menu_text, {'inline_keyboard': keyboard_buttons})
+
+    def show_solo_qa_difficulty(self, chat_id, message_id, category):
+        """Let the player pick a difficulty for solo practice"""
+        difficulty_text = (
+            f"📚 <b>Solo Q&A Practice</b> 📚\n\n"
+            f"Category: {html.escape(category.title())}\n\n"
+            f"Choose a difficulty:"
+        )
+        
+        keyboard_buttons = [[
+            {'text': difficulty.title(), 'callback_data': f'soloqa_start_{category}_{difficulty}'}
+            for difficulty in QUESTION_DIFFICULTIES
+        ]]
+        keyboard_buttons.append([{'text': '🎲 Any Difficulty', 'callback_data': f'soloqa_start_{category}_any'}])
+        keyboard_buttons.append([{'text': '🔙 Categories', 'callback_data': 'solo_qa'}])
+        
+        self.edit_message(chat_id, message_id, difficulty_text, {'inline_keyboard': keyboard_buttons})
+
+    def start_solo_qa(self, chat_id, message_id, user_id, category, difficulty):
+        """Start solo Q&A practice for a category and difficulty"""
+        if question_bank.pool_size(category, difficulty) == 0:
+            self.edit_message(chat_id, message_id, "❌ No questions for that choice yet.", {
+                'inline_keyboard': [[{'text': '🔙 Categories', 'callback_data': 'solo_qa'}]]
+            })
+            return
+        
+        previous = solo_qa_sessions.get(user_id, {})
+        solo_qa_sessions[user_id] = {
+            'category': category,
+            'difficulty': difficulty,
+            'unseen': previous.get('unseen', {}),
+            'asked': 0,
+            'correct': 0,
+            'current': None,
+            'answer_matcher': None
+        }
+        
+        self.ask_solo_question(chat_id, user_id)
+
+    def ask_solo_question(self, chat_id, user_id):
+        """Draw an unseen question from the bank and ask it"""
+        solo = solo_qa_sessions.get(user_id)
+        if not solo:
+            return
+        
+        question = question_bank.draw_unseen(solo['unseen'], solo['category'], solo['difficulty'])
+        if question is None:
+            return
+        
+        solo['current'] = question
+        solo['answer_matcher'] = AnswerMatcher(question['answer'])
+        solo['asked'] += 1
+        
+        question_text = (
+            f"📚 <b>Solo Practice - Question {solo['asked']}</b> 📚\n\n"
+            f"📂 {html.escape(question['category'].title())} | {html.escape(question['difficulty'].title())}\n"
+            f"Score: {solo['correct']}/{solo['asked'] - 1}\n\n"
+            f"❓ <b>{html.escape(question['question'])}</b>\n\n"
+            f"🎯 Type your answer in chat:"
+        )
+        
+        keyboard = {
+            'inline_keyboard': [
+                [{'text': '⏭️ Skip', 'callback_data': 'soloqa_skip'}],
+                [{'text': '🎮 Quit Practice', 'callback_data': 'soloqa_quit'}]
+            ]
+        }
+        
+        self.send_message(chat_id, question_text, keyboard)
+
+    def handle_solo_qa_answer(self, chat_id, user_id, text):
+        """Check a solo practice answer; returns False if the user isn't practising"""
+        solo = solo_qa_sessions.get(user_id)
+        if not solo or solo['current'] is None:
+            return False
+        
+        question = solo['current']
+        solo['current'] = None
+        
+        if solo['answer_matcher'].matches(text):
+            solo['correct'] += 1
+            result_text = "🎉 <b>CORRECT!</b> 🎉"
+        else:
+            result_text = f"❌ <b>WRONG!</b>\n\nCorrect answer was: {html.escape(question['answer'])}"
+        
+        self.send_solo_qa_result(chat_id, solo, result_text)
+        return True
+
+    def skip_solo_question(self, chat_id, user_id):
+        """Reveal the answer and offer the next question"""
+        solo = solo_qa_sessions.get(user_id)
+        if not solo or solo['current'] is None:
+            return
+        
+        question = solo['current']
+        solo['current'] = None
+        self.send_solo_qa_result(chat_id, solo, f"⏭️ <b>Skipped!</b>\n\nThe answer was: {html.escape(question['answer'])}")
+
+    def send_solo_qa_result(self, chat_id, solo, result_text):
+        result_text += f"\n\nScore: {solo['correct']}/{solo['asked']}"
+        
+        keyboard = {
+            'inline_keyboard': [
+                [{'text': '➡️ Next Question', 'callback_data': 'soloqa_next'}],
+                [{'text': '🎮 Quit Practice', 'callback_data': 'soloqa_quit'}]
+            ]
+        }
+        
+        self.send_message(chat_id, result_text, keyboard)
+
+    def render_spectator_view(self, session_id, result=None):
+        """Neutral view of a running game, identical for every spectator"""
+        session = multiplayer_sessions[session_id]
+        game_state = session['game_state']
+        game_type = session['game_type']
+        names = session.get('player_names', {})
+        if session.get('party'):
+            ranked = sorted(session['players'], key=lambda pid: -game_state['scores'][pid])
+            lines = ["👀 <b>Spectating Reaction Party</b>", f"{len(ranked)} players\n"]
+            lines.append(f"Round {min(game_state['round'], game_state['max_rounds'])}/{game_state['max_rounds']}")
+            lines.extend(f"{position}. {names.get(pid, 'Player')} - {game_state['scores'][pid]} pts"
+                         for position, pid in enumerate(ranked[:REACTION_STANDINGS_SHOWN], 1))
+            if result:
+                lines.append(f"\n{result}")
+            lines.append(f"\n👥 {len(session.get('spectators', {}))} watching")
+            return "\n".join(lines)
+        player1_id, player2_id = session['players']
+        name1 = names.get(player1_id, 'Player')
+        name2 = names.get(player2_id, 'Player')
+        game_name = GAMES.get(game_type, {}).get('name', 'Game')
+        
+        lines = [f"👀 <b>Spectating {game_name}</b>", f"{name1} vs {name2}\n"]
+        
+        if game_type == 'tictactoe':
+            symbols = game_state['player_symbols']
+            lines.append(format_board(game_state['board']) + "\n")
+            lines.append(f"{symbols[player1_id]} {name1}   {symbols[player2_id]} {name2}")
+            if not result:
+                lines.append(f"Turn: {names.get(session['players'][game_state['current_turn']], 'Player')}")
+        else:
+            if game_type == 'memory':
+                lines.append("\n".join(
+                    " ".join(tile['symbol'] if tile['matched'] or tile['revealed'] else "⬛" for tile in row)
+                    for row in game_state['board']
+                ) + "\n")
+                lines.append(f"Pairs found: {game_state['matched_pairs']}/{game_state['total_pairs']}")
+                if not result:
+                    lines.append(f"Turn: {names.get(game_state['current_player'], 'Player')}")
+            elif 'round' in game_state:
+                lines.append(f"Round {min(game_state['round'], game_state['max_rounds'])}/{game_state['max_rounds']}")
+            if game_type == 'qa' and not result and game_state['phase'] != 'question' and game_state['current_question']:
+                lines.append(f"❓ {game_state['current_question']}")
+            lines.append(f"Score: {name1} {game_state['scores'][player1_id]} - {game_state['scores'][player2_id]} {name2}")
+        
+        series = session.get('series')
+        if series:
+            lines.append(f"Best of {series['best_of']}: {name1} {series['wins'].get(player1_id, 0)} - {series['wins'].get(player2_id, 0)} {name2}")
+        if result:
+            lines.append(f"\n{result}")
+        lines.append(f"\n👥 {len(session.get('spectators', {}))} watching")
+        return "\n".join(lines)
+
+    def publish_spectator_view(self, session_id, result=None):
+        """Render the spectator view once per state change and hand it to the fan-out worker"""
+        session = multiplayer_sessions.get(session_id)
+        if session:
+            session['last_activity'] = time.time()  # Every display update passes through here
+        if not session or not session.get('spectators') or not session.get('game_state'):
+            return
+        
+        text = self.render_spectator_view(session_id, result)
+        if text == session.get('spectator_view'):
+            return  # The Bot API rejects edits that don't change the message
+        session['spectator_view'] = text
+        delivery_stats['spectator_renders'] += 1
+        
+        keyboard = {'inline_keyboard': [[{'text': '👋 Stop Watching', 'callback_data': f'unwatch_{session_id}'}]]}
+        spectator_feed.publish(session_id, text, keyboard, list(session['spectators'].items()))
+
+    def deliver_spectator_view(self, chat_id, message_id, text, keyboard):
+        delivery_stats['spectator_edits'] += 1
+        self.edit_message(chat_id, message_id, text, keyboard)
+
+    def handle_watch_request(self, chat_id, message_id, user_id, session_id):
+        """Turn the user's message into a live spectator view of a running game"""
+        session = multiplayer_sessions.get(session_id)
+        if not session or session['status'] != 'active' or not session.get('game_state'):
+            self.edit_message(chat_id, message_id, "❌ This game is no longer running.", {
+                'inline_keyboard': [[{'text': '🔍 Find Active Games', 'callback_data': 'find_games'}]]
+            })
+            return
+        
+        spectators = session.setdefault('spectators', {})
+        if user_id in session['players'] or (user_id not in spectators and len(spectators) >= SPECTATOR_MAX_PER_SESSION):
+            self.edit_message(chat_id, message_id, "❌ You can't watch this game.", {
+                'inline_keyboard': [[{'text': '🔍 Find Active Games', 'callback_data': 'find_games'}]]
+            })
+            return
+        
+        # The spectator's current message becomes their feed; later updates edit it in place
+        spectators[user_id] = message_id
+        text = self.render_spectator_view(session_id)
+        session['spectator_view'] = text
+        self.edit_message(chat_id, message_id, text, {
+            'inline_keyboard': [[{'text': '👋 Stop Watching', 'callback_data': f'unwatch_{session_id}'}]]
+        })
+
+    def handle_stop_watching(self, chat_id, message_id, user_id, session_id):
+        session = multiplayer_sessions.get(session_id) or finished_sessions.get(session_id)
+        if session:
+            session.get('spectators', {}).pop(user_id, None)
+        self.show_game_menu(chat_id, message_id, user_id)
+
+    def release_session(self, session_id):
+        """Drop a session and cancel its pending turn timer or match deadline"""
+        session = multiplayer_sessions.pop(session_id, None)
+        if session and session.get('turn_timer'):
+            turn_scheduler.cancel(session['turn_timer'])
+        if session and session.get('match_deadline'):
+            turn_scheduler.cancel(session['match_deadline'])
+
+    def game_over_keyboard(self, session_id):
+        """Keyboard for final results, offering a rematch in the same session"""
+        tournament_id = tournament_by_session.get(session_id)
+        if tournament_id:
+            return {'inline_keyboard': [[{'text': '🏟️ Tournament Standings', 'callback_data': f'tourney_view_{tournament_id}'}]]}
+        
+        series = multiplayer_sessions.get(session_id, {}).get('series')
+        if series and not series['decided']:
+            return {'inline_keyboard': [[{'text': '🎮 Quit Series', 'callback_data': f'quit_{session_id}'}]]}
+        
+        if multiplayer_sessions.get(session_id, {}).get('party'):
+            return {
                 'inline_keyboard': [
+                    [{'text': '⚡ New Reaction Party', 'callback_data': 'party_new'}],
                     [{'text': '🎮 Play Other Games', 'callback_data': 'show_games'}],
                     [{'text': '🏆 View Scoreboard', 'callback_data': 'show_scoreboard'}]
                 ]
             }
-            
-            self.send_message(player_id, final_text, keyboard)
         
-        del multiplayer_sessions[session_id]
+        if multiplayer_sessions.get(session_id, {}).get('shared_board'):
+            return {
+                'inline_keyboard': [
+                    [{'text': '🔁 Rematch', 'callback_data': f'rematch_{session_id}'}],
+                    [{'text': '🎮 New Group Game', 'callback_data': 'group_menu'}]
+                ]
+            }
+        
+        return {
+            'inline_keyboard': [
+                [{'text': '🔁 Rematch', 'callback_data': f'rematch_{session_id}'}],
+                [{'text': '🎮 Play Other Games', 'callback_data': 'show_games'}],
+                [{'text': '🏆 View Scoreboard', 'callback_data': 'show_scoreboard'}]
+            ]
+        }
+
+    def record_match_result(self, session_id, winner_id):
+        """Record one finished game (winner_id None for a tie); series defer stats to the end"""
+        session = multiplayer_sessions[session_id]
+        series = session.get('series')
+        
+        if winner_id:
+            self.publish_spectator_view(session_id, f"🏁 <b>{session.get('player_names', {}).get(winner_id, 'Player')} wins!</b>")
+        else:
+            self.publish_spectator_view(session_id, "🤝 <b>It's a tie!</b>")
+        
+        if series:
+            series['games_played'] += 1
+            if winner_id:
+                series['wins'][winner_id] = series['wins'].get(winner_id, 0) + 1
+            wins_needed = series['best_of'] // 2 + 1
+            # Ties don't count towards the series, but cap it so it can't run forever
+            series['decided'] = (
+                max(series['wins'].values(), default=0) >= wins_needed
+                or series['games_played'] >= series['best_of'] * 2
+            )
+            return
+        
+        for player_id in session['players']:
+            self.update_user_game_result(player_id, session['game_type'], player_id == winner_id)
+
+    def finish_match(self, session_id, winner_id):
+        """After a game's results are shown: continue the series, or park for a rematch"""
+        session = multiplayer_sessions.get(session_id)
+        if not session:
+            return
+        
+        if session_id in tournament_by_session:
+            if winner_id is None:
+                # Bracket matches need a winner: replay ties in place, like the next game of a series
+                self.cancel_turn_timer(session_id)
+                for player_id in session['players']:
+                    self.send_message(player_id, f"🤝 Tournament games can't end in a tie - replaying in {SERIES_NEXT_GAME_DELAY} seconds...")
+                turn_scheduler.schedule(SERIES_NEXT_GAME_DELAY, lambda: self.run_in_background(self.start_next_series_game, session_id))
+                return
+            self.record_tournament_result(session_id, winner_id)
+            self.check_prize_eligibility(winner_id)
+            return
+        
+        if session.get('party'):
+            # Parties are re-formed through the lobby rather than rematched in place
+            self.release_session(session_id)
+            if winner_id:
+                self.check_prize_eligibility(winner_id)
+            return
+        
+        series = session.get('series')
+        if series:
+            if not series['decided']:
+                self.cancel_turn_timer(session_id)
+                self.send_series_status(session_id, f"Next game starts in {SERIES_NEXT_GAME_DELAY} seconds...")
+                turn_scheduler.schedule(SERIES_NEXT_GAME_DELAY, lambda: self.run_in_background(self.start_next_series_game, session_id))
+                return
+            winner_id = self.finish_series(session_id)
+        
+        self.park_session_for_rematch(session_id)
         if winner_id:
             self.check_prize_eligibility(winner_id)
 
+    def finish_series(self, session_id):
+        """Record the whole series as one result per player and announce it"""
+        session = multiplayer_sessions[session_id]
+        series = session['series']
+        player1_id, player2_id = session['players']
+        wins1 = series['wins'].get(player1_id, 0)
+        wins2 = series['wins'].get(player2_id, 0)
+        
+        if wins1 == wins2:
+            series_winner = None
+        else:
+            series_winner = player1_id if wins1 > wins2 else player2_id
+        
+        for player_id in session['players']:
+            self.update_user_game_result(player_id, session['game_type'], player_id == series_winner)
+        
+        if series_winner is None:
+            self.send_series_status(session_id, "🤝 <b>The series is a draw!</b>")
+        else:
+            for player_id in session['players']:
+                headline = "🏅 <b>YOU WON THE SERIES!</b> 🏅" if player_id == series_winner else "😔 <b>You lost the series.</b>"
+                self.send_series_status(session_id, headline, only_player=player_id)
+        return series_winner
+
+    def send_series_status(self, session_id, footer, only_player=None):
+        session = multiplayer_sessions[session_id]
+        series = session['series']
+        keyboard = self.game_over_keyboard(session_id)
+        
+        for player_id in session['players']:
+            if only_player is not None and player_id != only_player:
+                continue
+            opponent_id = [pid for pid in session['players'] if pid != player_id][0]
+            series_text = (
+                f"🏅 <b>Best of {series['best_of']} Series</b> 🏅\n\n"
+                f"Series Score: You {series['wins'].get(player_id, 0)} - {series['wins'].get(opponent_id, 0)} Opponent\n"
+                f"Games played: {series['games_played']}\n\n"
+                f"{footer}"
+            )
+            self.send_message(player_id, series_text, keyboard)
+
+    def start_next_series_game(self, session_id):
+        """Start the next game of a series in the same session, alternating who goes first"""
+        session = multiplayer_sessions.get(session_id)
+        if not session or session['status'] != 'active':
+            return
+        
+        session['players'].reverse()
+        session['missed_turns'] = {}
+        session['last_activity'] = time.time()
+        self.start_multiplayer_game(None, None, session['players'][0], session_id)
+
+    def park_session_for_rematch(self, session_id):
+        """Move a finished session aside so both players can restart it in place"""
+        session = multiplayer_sessions.get(session_id)
+        if not session:
+            return
+        
+        self.release_session(session_id)
+        session['status'] = 'finished'
+        session['game_state'] = None
+        session['turn_timer'] = None
+        session['missed_turns'] = {}
+        session['rematch_votes'] = set()
+        finished_sessions[session_id] = session
+        
+        handle = turn_scheduler.schedule(REMATCH_WINDOW_SECONDS, lambda: self.expire_finished_session(session_id, handle))
+        session['expiry_timer'] = handle
+
+    def expire_finished_session(self, session_id, handle):
+        session = finished_sessions.get(session_id)
+        if session and session.get('expiry_timer') == handle:
+            del finished_sessions[session_id]
+
+    def handle_rematch_request(self, chat_id, message_id, user_id, session_id):
+        """Record a rematch vote; once both players agree, restart the same session"""
+        session = finished_sessions.get(session_id)
+        if not session or user_id not in session['players']:
+            if chat_id is None or chat_id < 0 or (session and session.get('shared_board')):
+                return  # Group or inline board: onlookers and stale taps leave the shared message alone
+            self.edit_message(chat_id, message_id, "❌ This rematch is no longer available.", {
+                'inline_keyboard': [[{'text': '🎮 Back to Games', 'callback_data': 'show_games'}]]
+            })
+            return
+        
+        session['rematch_votes'].add(user_id)
+        opponent_id = [pid for pid in session['players'] if pid != user_id][0]
+        
+        if opponent_id not in session['rematch_votes']:
+            player_name = session.get('player_names', {}).get(user_id, 'Your opponent')
+            if session.get('shared_board'):
+                self.edit_message(chat_id, message_id, f"🔁 <b>{player_name} wants a rematch!</b>\n\n⏳ Waiting for the opponent to accept...", {
+                    'inline_keyboard': [
+                        [{'text': '🔁 Accept Rematch', 'callback_data': f'rematch_{session_id}'}],
+                        [{'text': '🎮 New Group Game', 'callback_data': 'group_menu'}]
+                    ]
+                })
+                return
+            self.edit_message(chat_id, message_id, "🔁 <b>Rematch requested!</b>\n\n⏳ Waiting for your opponent to accept...", None)
+            self.send_message(opponent_id, f"🔁 <b>{player_name} wants a rematch!</b>", {
+                'inline_keyboard': [
+                    [{'text': '🔁 Accept Rematch', 'callback_data': f'rematch_{session_id}'}],
+                    [{'text': '🎮 Play Other Games', 'callback_data': 'show_games'}]
+                ]
+            })
+            return
+        
+        # Both agreed - reuse the session with swapped turn order, no lobby or broadcast
+        del finished_sessions[session_id]
+        turn_scheduler.cancel(session['expiry_timer'])
+        session['players'].reverse()
+        session['status'] = 'active'
+        session['last_activity'] = time.time()
+        session['rematch_votes'] = set()
+        if session.get('series'):
+            session['series'].update(wins={}, games_played=0, decided=False)
+        multiplayer_sessions[session_id] = session
+        session_stats['rematches'] += 1
+        
+        logger.info(f"Rematch started in session {session_id}")
+        self.start_multiplayer_game(chat_id, message_id, user_id, session_id)
+
+    def start_game_timer(self, session_id, delay, callback, *args):
+        """Call callback(session_id, *args) after delay, unless the session has moved on to another game by then"""
+        # Rematches and series games reuse the session id, so the game_state object is the generation check
+        game_state = multiplayer_sessions[session_id]['game_state']
+        
+        def fire():
+            session = multiplayer_sessions.get(session_id)
+            if session and session.get('game_state') is game_state:
+                callback(session_id, *args)
+        
+        threading.Timer(delay, fire).start()
+
+    def start_turn_timer(self, session_id, player_id):
+        """(Re)start the turn deadline for the player who has to act"""
+        session = multiplayer_sessions.get(session_id)
+        timeout = TURN_TIMEOUT_SECONDS.get(session['game_type']) if session else None
+        if not timeout:
+            return
+        
+        self.cancel_turn_timer(session_id)
+        handle = turn_scheduler.schedule(timeout, lambda: self.handle_turn_timeout(session_id, player_id, handle))
+        session['turn_timer'] = handle
+
+    def cancel_turn_timer(self, session_id):
+        session = multiplayer_sessions.get(session_id)
+        if session and session.get('turn_timer'):
+            turn_scheduler.cancel(session['turn_timer'])
+            session['turn_timer'] = None
+
+    def handle_turn_timeout(self, session_id, player_id, handle):
+        """Skip the idle player's turn, or forfeit the game after repeated misses"""
+        session = multiplayer_sessions.get(session_id)
+        if not session or session.get('turn_timer') != handle:
+            return
+        session['turn_timer'] = None
+        
+        missed_turns = session.setdefault('missed_turns', {})
+        missed_turns[player_id] = missed_turns.get(player_id, 0) + 1
+        logger.info(f"Turn timeout: session={session_id}, player={player_id}, missed={missed_turns[player_id]}")
+        
+        if missed_turns[player_id] >= TURN_TIMEOUT_FORFEIT_AFTER:
+            self.forfeit_session(session_id, player_id, 'timeout')
+            return
+        
+        opponent_id = [pid for pid in session['players'] if pid != player_id][0]
+        remaining = TURN_TIMEOUT_FORFEIT_AFTER - missed_turns[player_id]
+        if not session.get('shared_board'):
+            self.send_message(player_id, f"⏰ <b>Time's up!</b> Your turn was skipped.\n\nMiss {remaining} more and you forfeit the game!")
+            self.send_message(opponent_id, "⏰ <b>Your opponent ran out of time!</b> Their turn was skipped.")
+        
+        game_type = session['game_type']
+        game_state = session['game_state']
+        
+        if game_type == 'tictactoe':
+            game_state['current_turn'] = 1 - game_state['current_turn']
+            self.update_tictactoe_display(session_id)
+        elif game_type == 'memory':
+            if game_state.get('turn_locked', False):
+                return  # Match result is already being shown; it starts the next turn
+            for pos in game_state['selected_tiles']:
+                game_state['board'][pos // 4][pos % 4]['revealed'] = False
+            game_state['selected_tiles'] = []
+            game_state['current_player'] = opponent_id
+            self.update_memory_display(session_id)
+        elif game_type == 'qa':
+            if game_state['phase'] == 'guess':
+                for pid in session['players']:
+                    self.send_message(pid, f"The answer was: {game_state['current_answer']}")
+            self.advance_qa_round(session_id)
+
+    def forfeit_session(self, session_id, loser_id, reason):
+        """End a game early: the opponent wins, both are notified, resources are freed"""
+        session = multiplayer_sessions.get(session_id)
+        if not session:
+            return
+        
+        self.publish_spectator_view(session_id, f"🏳️ <b>{session.get('player_names', {}).get(loser_id, 'Player')} forfeited.</b>")
+        if session.get('shared_board') and session.get('status') == 'active':
+            names = session['player_names']
+            winner_name = [name for pid, name in names.items() if pid != loser_id][0]
+            reason_text = "ran out of time" if reason == 'timeout' else "quit"
+            self.update_shared_board(session_id, f"🏳️ <b>{names[loser_id]} {reason_text} - {winner_name} wins!</b>", {
+                'inline_keyboard': [[{'text': '🎮 New Group Game', 'callback_data': 'group_menu'}]]
+            })
+        self.release_session(session_id)
+        
+        opponents = [pid for pid in session['players'] if pid != loser_id]
+        if session.get('status') != 'active' or not opponents:
+            return
+        
+        session_stats[f'forfeits_{reason}'] += 1
+        game_type = session['game_type']
+        game_name = GAMES.get(game_type, {}).get('name', 'Game')
+        winner_id = opponents[0]
+        
+        self.update_user_game_result(winner_id, game_type, True)
+        self.update_user_game_result(loser_id, game_type, False)
+        
+        if session.get('shared_board'):
+            self.check_prize_eligibility(winner_id)
+            return  # The shared board already shows the result
+        
+        if reason == 'timeout':
+            loser_text = f"⏰ <b>{game_name} - FORFEITED</b>\n\nYou ran out of time too many times. Your opponent wins!"
+            winner_text = f"🎉 <b>{game_name} - YOU WON!</b> 🎉\n\nYour opponent ran out of time and forfeited."
+        elif reason == 'deadline':
+            loser_text = f"⏰ <b>{game_name} - TIME LIMIT</b>\n\nThe match ran past its time limit and your opponent advances."
+            winner_text = f"🎉 <b>{game_name} - YOU WON!</b> 🎉\n\nThe match ran past its time limit and you advance."
+        else:
+            loser_text = f"🏳️ <b>{game_name} - FORFEITED</b>\n\nYou quit the game. Your opponent wins!"
+            winner_text = f"🎉 <b>{game_name} - YOU WON!</b> 🎉\n\nYour opponent quit the game."
+        
+        keyboard = {
+            'inline_keyboard': [
+                [{'text': '🎮 Play Other Games', 'callback_data': 'show_games'}],
+                [{'text': '🏆 View Scoreboard', 'callback_data': 'show_scoreboard'}]
+            ]
+        }
+        
+        self.send_message(loser_id, loser_text, keyboard)
+        self.send_message(winner_id, winner_text, keyboard)
+        if session_id in tournament_by_session:
+            self.record_tournament_result(session_id, winner_id)
+        self.check_prize_eligibility(winner_id)
+
+    def handle_quit_game(self, chat_id, message_id, user_id, session_id):
+        """Quit a running game: forfeit it and free the session right away"""
+        session = multiplayer_sessions.get(session_id)
+        if session and session.get('shared_board') and user_id not in session['players']:
+            return  # Onlookers in the group can't quit someone else's game
+        if not session or user_id not in session['players']:
+            if chat_id is None or chat_id < 0:
+                return  # Stale button on a group or inline message
+            # Game already over - just show the menu
+            self.show_game_menu(chat_id, None, user_id)
+            return
+        
+        logger.info(f"User {user_id} quit session {session_id}")
+        if session.get('party'):
+            self.leave_reaction_party(session_id, user_id)
+            return
+        self.forfeit_session(session_id, user_id, 'quit')
+
     def handle_game_cancellation(self, chat_id, message_id, user_id, session_id):
         """Handle game cancellation by host"""
         if session_id not in multiplayer_sessions:
@@ -2160,7 +4012,10 @@ class SimpleLocalBot:
         session = multiplayer_sessions[session_id]
         
         # Only host can cancel the game
+        public_message = session.get('shared_board') or session.get('invite_message')
         if user_id != session['host_id']:
+            if public_message:
+                return
             self.edit_message(chat_id, message_id, "❌ Only the game host can cancel this game.", {
                 'inline_keyboard': [[{'text': '🎮 Back to Games', 'callback_data': 'show_games'}]]
             })
@@ -2168,7 +4023,7 @@ class SimpleLocalBot:
         
         # Remove the session
         game_name = GAMES.get(session['game_type'], {}).get('name', 'Game')
-        del multiplayer_sessions[session_id]
+        self.release_session(session_id)
         
         cancellation_text = (
             f"❌ <b>Game Cancelled</b> ❌\n\n"
@@ -2176,14 +4031,642 @@ class SimpleLocalBot:
             f"You can create a new game anytime!"
         )
         
+        if public_message:
+            keyboard = {'inline_keyboard': [[{'text': '🎮 New Group Game', 'callback_data': 'group_menu'}]]}
+        else:
+            keyboard = {
+                'inline_keyboard': [
+                    [{'text': '🎮 Create New Game', 'callback_data': 'show_games'}],
+                    [{'text': '🔍 Find Active Games', 'callback_data': 'find_games'}]
+                ]
+            }
+        
+        self.edit_message(chat_id, message_id, cancellation_text, keyboard)
+
+    def show_tournament_menu(self, chat_id, message_id):
+        """List tournaments open for sign-up and offer to host a new one"""
+        self.expire_idle_tournaments()
+        open_tournaments = [t for t in tournaments.values() if t.status == 'open']
+        
+        menu_text = "🏟️ <b>Tournaments</b> 🏟️\n\n"
+        keyboard_buttons = []
+        
+        if open_tournaments:
+            menu_text += "Open for sign-up:\n"
+            for tournament in open_tournaments[:5]:
+                game_name = GAMES.get(tournament.game_type, {}).get('name', 'Game')
+                menu_text += f"• {game_name} - {TOURNAMENT_FORMATS[tournament.bracket]} ({len(tournament.players)} players)\n"
+                keyboard_buttons.append([{
+                    'text': f'🎟️ {game_name} Tournament',
+                    'callback_data': f'tourney_view_{tournament.tournament_id}'
+                }])
+        else:
+            menu_text += "No tournaments are open for sign-up right now.\n"
+        
+        menu_text += "\nOr host your own - pick a game:"
+        for game_type, game in GAMES.items():
+            keyboard_buttons.append([{'text': game['name'], 'callback_data': f'tourney_game_{game_type}'}])
+        keyboard_buttons.append([{'text': '🎮 Back to Games', 'callback_data': 'show_games'}])
+        
+        self.edit_message(chat_id, message_id, menu_text, {'inline_keyboard': keyboard_buttons})
+
+    def expire_idle_tournaments(self):
+        """Drop sign-ups nobody has joined for a while, the way idle invitations are dropped"""
+        now = time.time()
+        for tournament_id, tournament in list(tournaments.items()):
+            if tournament.status != 'open' or now - tournament.last_activity <= TOURNAMENT_LOBBY_IDLE_SECONDS:
+                continue
+            tournaments.pop(tournament_id, None)
+            logger.info(f"Tournament {tournament_id} expired before starting")
+            self.send_batch(
+                (player_id, "⌛ The tournament you joined expired before it started.", None)
+                for player_id in tournament.players
+            )
+
+    def show_tournament_formats(self, chat_id, message_id, game_type):
+        game_name = GAMES.get(game_type, {}).get('name', 'Game')
+        keyboard_buttons = [
+            [{'text': label, 'callback_data': f'tourney_new_{bracket}_{game_type}'}]
+            for bracket, label in TOURNAMENT_FORMATS.items()
+        ]
+        keyboard_buttons.append([{'text': '⬅️ Back', 'callback_data': 'tourney_menu'}])
+        
+        self.edit_message(chat_id, message_id, f"🏟️ <b>{game_name} Tournament</b>\n\nChoose the format:", {
+            'inline_keyboard': keyboard_buttons
+        })
+
+    def create_tournament(self, chat_id, message_id, user_id, user_data, bracket, game_type):
+        """Open a tournament for sign-up with the host as first seed"""
+        if bracket not in TOURNAMENT_FORMATS or game_type not in GAMES:
+            return
+        
+        self.register_user(user_data)
+        tournament = Tournament(generate_session_id(), game_type, bracket, user_id)
+        tournament.add_player(user_id, user_data.get('first_name', 'Player'))
+        tournaments[tournament.tournament_id] = tournament
+        
+        logger.info(f"Tournament {tournament.tournament_id} created: {bracket} {game_type} by {user_id}")
+        self.show_tournament_lobby(chat_id, message_id, user_id, tournament.tournament_id)
+
+    def show_tournament_lobby(self, chat_id, message_id, user_id, tournament_id):
+        """Sign-up screen while open, standings once the tournament runs"""
+        tournament = tournaments.get(tournament_id)
+        if not tournament:
+            self.edit_message(chat_id, message_id, "❌ This tournament is over or no longer exists.", {
+                'inline_keyboard': [[{'text': '🏟️ Tournaments', 'callback_data': 'tourney_menu'}]]
+            })
+            return
+        
+        if tournament.status != 'open':
+            self.edit_message(chat_id, message_id, self.render_tournament_standings(tournament), {
+                'inline_keyboard': [[{'text': '🔄 Refresh', 'callback_data': f'tourney_view_{tournament_id}'}]]
+            })
+            return
+        
+        game_name = GAMES.get(tournament.game_type, {}).get('name', 'Game')
+        lobby_text = (
+            f"🏟️ <b>{game_name} Tournament</b> 🏟️\n\n"
+            f"Format: {TOURNAMENT_FORMATS[tournament.bracket]}\n"
+            f"Host: {tournament.names[tournament.host_id]}\n"
+            f"Players ({len(tournament.players)}/{TOURNAMENT_MAX_PLAYERS}): "
+            f"{', '.join(tournament.names[uid] for uid in tournament.players[:20])}"
+            f"{' ...' if len(tournament.players) > 20 else ''}\n\n"
+            f"At least {TOURNAMENT_MIN_PLAYERS} players are needed to start.\n"
+            f"Tournament ID: <code>{tournament_id}</code>"
+        )
+        
+        keyboard_buttons = []
+        if user_id not in tournament.seeds:
+            keyboard_buttons.append([{'text': '🎟️ Join Tournament', 'callback_data': f'tourney_join_{tournament_id}'}])
+        if user_id == tournament.host_id:
+            if len(tournament.players) >= TOURNAMENT_MIN_PLAYERS:
+                keyboard_buttons.append([{'text': '▶️ Start Tournament', 'callback_data': f'tourney_start_{tournament_id}'}])
+            keyboard_buttons.append([{'text': '❌ Cancel Tournament', 'callback_data': f'tourney_cancel_{tournament_id}'}])
+        keyboard_buttons.append([{'text': '🔄 Refresh', 'callback_data': f'tourney_view_{tournament_id}'}])
+        keyboard_buttons.append([{'text': '🎮 Back to Games', 'callback_data': 'show_games'}])
+        
+        self.edit_message(chat_id, message_id, lobby_text, {'inline_keyboard': keyboard_buttons})
+
+    def join_tournament(self, chat_id, message_id, user_id, user_data, tournament_id):
+        tournament = tournaments.get(tournament_id)
+        if tournament and tournament.status == 'open' and len(tournament.players) < TOURNAMENT_MAX_PLAYERS:
+            self.register_user(user_data)
+            if tournament.add_player(user_id, user_data.get('first_name', 'Player')):
+                self.send_message(tournament.host_id, f"🎟️ {user_data.get('first_name', 'Player')} joined your tournament! ({len(tournament.players)} players)")
+        self.show_tournament_lobby(chat_id, message_id, user_id, tournament_id)
+
+    def cancel_tournament(self, chat_id, message_id, user_id, tournament_id):
+        tournament = tournaments.get(tournament_id)
+        if not tournament or tournament.host_id != user_id or tournament.status != 'open':
+            return
+        
+        del tournaments[tournament_id]
+        for player_id in tournament.players:
+            if player_id != user_id:
+                self.send_message(player_id, "❌ The tournament you joined was cancelled by the host.")
+        self.show_tournament_menu(chat_id, message_id)
+
+    def start_tournament(self, chat_id, message_id, user_id, tournament_id):
+        """Close sign-up and kick off the first round"""
+        tournament = tournaments.get(tournament_id)
+        if not tournament or tournament.host_id != user_id or tournament.status != 'open':
+            return
+        if len(tournament.players) < TOURNAMENT_MIN_PLAYERS:
+            self.show_tournament_lobby(chat_id, message_id, user_id, tournament_id)
+            return
+        
+        tournament.start()
+        logger.info(f"Tournament {tournament_id} started with {len(tournament.players)} players")
+        self.edit_message(chat_id, message_id, "▶️ <b>Tournament started!</b>\n\nYour first game is on its way.", None)
+        self.run_in_background(self.start_tournament_round, tournament_id)
+
+    def start_tournament_round(self, tournament_id):
+        """Pair the next round and spawn one multiplayer session per match"""
+        tournament = tournaments.get(tournament_id)
+        if not tournament:
+            return
+        
+        with tournament.lock:
+            pairs, bye = tournament.pair_next_round()
+            sessions = []
+            for player1_id, player2_id in pairs:
+                session_id = generate_session_id()
+                multiplayer_sessions[session_id] = {
+                    'game_type': tournament.game_type,
+                    'host_id': player1_id,
+                    'host_name': tournament.names[player1_id],
+                    'players': [player1_id, player2_id],
+                    'player_names': {pid: tournament.names[pid] for pid in (player1_id, player2_id)},
+                    'status': 'active',
+                    'created_at': time.time(),
+                    'tournament_id': tournament_id
+                }
+                tournament_by_session[session_id] = tournament_id
+                tournament.open_matches[session_id] = (player1_id, player2_id)
+                sessions.append((session_id, player1_id))
+        
+        logger.info(f"Tournament {tournament_id} round {tournament.round}: {len(pairs)} matches, bye={bye}")
+        if bye is not None:
+            self.send_message(bye, f"🏟️ <b>Round {tournament.round}</b>\n\nYou have a bye this round and advance automatically.")
+        for session_id, host_id in sessions:
+            if session_id not in multiplayer_sessions:
+                continue  # Forfeited before its game could start
+            self.start_match_deadline(session_id)
+            self.start_multiplayer_game(None, None, host_id, session_id)
+        if not sessions:
+            self.finish_tournament_round(tournament_id)
+
+    def start_match_deadline(self, session_id):
+        """Bound a bracket match whose game has no turn timer, so one idle pair can't stall the round"""
+        session = multiplayer_sessions.get(session_id)
+        if not session or TURN_TIMEOUT_SECONDS.get(session['game_type']):
+            return
+        handle = turn_scheduler.schedule(TOURNAMENT_MATCH_SECONDS, lambda: self.expire_tournament_match(session_id, handle))
+        session['match_deadline'] = handle
+
+    def expire_tournament_match(self, session_id, handle):
+        """Decide an overdue bracket match: whoever the game is waiting on loses, else the lower score"""
+        session = multiplayer_sessions.get(session_id)
+        if not session or session_id not in tournament_by_session or session.get('match_deadline') != handle:
+            return
+        
+        game_state = session.get('game_state') or {}
+        if session['game_type'] == 'rps':
+            pending = [pid for pid in session['players'] if pid not in game_state.get('choices', {})]
+        elif game_state.get('current_phase') == 'waiting_ready':
+            pending = [pid for pid in session['players'] if pid not in game_state['ready_players']]
+        else:
+            pending = []
+        
+        scores = game_state.get('scores', {})
+        if len(pending) == 1:
+            loser_id = pending[0]
+        elif len(set(scores.get(pid, 0) for pid in session['players'])) > 1:
+            loser_id = min(session['players'], key=lambda pid: scores.get(pid, 0))
+        else:
+            loser_id = random.choice(session['players'])
+        
+        logger.info(f"Tournament match {session_id} hit its deadline; {loser_id} forfeits")
+        self.forfeit_session(session_id, loser_id, 'deadline')
+
+    def record_tournament_result(self, session_id, winner_id):
+        """Advance the bracket with a decided match; the last one of a round closes it"""
+        tournament_id = tournament_by_session.pop(session_id, None)
+        tournament = tournaments.get(tournament_id)
+        self.release_session(session_id)
+        if not tournament:
+            return
+        
+        with tournament.lock:
+            players = tournament.open_matches.pop(session_id, None)
+            if not players:
+                return
+            loser_id = players[1] if players[0] == winner_id else players[0]
+            tournament.record_result(winner_id, loser_id)
+            round_over = not tournament.open_matches
+        
+        if round_over:
+            self.finish_tournament_round(tournament_id)
+
+    def render_tournament_standings(self, tournament):
+        game_name = GAMES.get(tournament.game_type, {}).get('name', 'Game')
+        rounds = f"/{tournament.total_rounds}" if tournament.total_rounds else ""
+        lines = [f"🏟️ <b>{game_name} Tournament</b> - {TOURNAMENT_FORMATS[tournament.bracket]}", f"Round {tournament.round}{rounds}\n"]
+        
+        for position, player_id in enumerate(tournament.standings()[:TOURNAMENT_STANDINGS_SHOWN], 1):
+            if tournament.bracket == 'swiss':
+                record = f"{tournament.points[player_id]} pts"
+            else:
+                record = f"{tournament.losses[player_id]} loss{'es' if tournament.losses[player_id] != 1 else ''}"
+            lines.append(f"{position}. {tournament.names[player_id]} - {record}")
+        return "\n".join(lines)
+
+    def finish_tournament_round(self, tournament_id):
+        """Send one batched round summary per player, then schedule the next round or crown the winner"""
+        tournament = tournaments.get(tournament_id)
+        if not tournament:
+            return
+        
+        with tournament.lock:
+            finished = tournament.is_finished()
+            # Render the shared part once; each player only gets a personal headline on top
+            standings_text = self.render_tournament_standings(tournament)
+            results = {}
+            for winner_id, loser_id in tournament.round_results:
+                results[winner_id] = f"✅ You beat {tournament.names[loser_id]}."
+                results[loser_id] = f"❌ You lost to {tournament.names[winner_id]}."
+            alive = set(tournament.alive())
+            champion_id = tournament.standings()[0]
+            if finished:
+                tournament.status = 'finished'
+                tournaments.pop(tournament_id, None)
+        
+        if finished:
+            logger.info(f"Tournament {tournament_id} won by {champion_id}")
+            footer = f"🏆 <b>{tournament.names[champion_id]} wins the tournament!</b>"
+        else:
+            footer = f"Next round starts in {TOURNAMENT_ROUND_DELAY} seconds..."
+            # Pairing a round starts every match's game; keep that off the scheduler thread
+            turn_scheduler.schedule(TOURNAMENT_ROUND_DELAY, lambda: self.run_in_background(self.start_tournament_round, tournament_id))
+        
+        messages = []
+        for player_id in tournament.players:
+            personal = results.get(player_id, "")
+            if not finished and player_id not in alive:
+                if player_id not in results:
+                    continue  # Knocked out earlier and already told
+                personal += " You are out of the tournament."
+            messages.append((player_id, f"🏁 <b>Round {tournament.round} complete</b>\n{personal}\n\n{standings_text}\n\n{footer}", None))
+        self.send_batch(messages)
+
+    def show_royale_menu(self, chat_id, message_id):
+        """List open battle royales and offer to host one"""
+        self.expire_idle_royales()
+        open_royales = [(rid, royale) for rid, royale in royale_games.items() if royale['status'] == 'open']
+        
+        menu_text = (
+            "⚔️ <b>RPS Battle Royale</b> ⚔️\n\n"
+            "Everyone picks a weapon each round and plays everyone else.\n"
+            "Only the players whose weapon scored best survive - last one standing wins!\n\n"
+        )
+        keyboard_buttons = []
+        if open_royales:
+            menu_text += "Open for sign-up:\n"
+            for royale_id, royale in open_royales[:5]:
+                host_name = royale['names'][royale['host_id']]
+                menu_text += f"• Hosted by {host_name} ({len(royale['players'])} players)\n"
+                keyboard_buttons.append([{'text': f'⚔️ Join {host_name}\'s Battle', 'callback_data': f'royale_view_{royale_id}'}])
+        else:
+            menu_text += "No battles are open for sign-up right now.\n"
+        
+        keyboard_buttons.append([{'text': '➕ Host a Battle Royale', 'callback_data': 'royale_new'}])
+        keyboard_buttons.append([{'text': '🎮 Back to Games', 'callback_data': 'show_games'}])
+        self.edit_message(chat_id, message_id, menu_text, {'inline_keyboard': keyboard_buttons})
+
+    def expire_idle_royales(self):
+        """Drop sign-ups nobody has touched for a while, the way idle invitations are dropped"""
+        now = time.time()
+        for royale_id, royale in list(royale_games.items()):
+            if royale['status'] != 'open' or now - royale['last_activity'] <= ROYALE_LOBBY_IDLE_SECONDS:
+                continue
+            royale_games.pop(royale_id, None)
+            logger.info(f"Battle royale {royale_id} expired before starting")
+            self.send_batch(
+                (player_id, "⌛ The battle royale you joined expired before it started.", None)
+                for player_id in royale['players']
+            )
+
+    def create_royale(self, chat_id, message_id, user_id, user_data):
+        self.register_user(user_data)
+        royale_id = generate_session_id()
+        royale_games[royale_id] = {
+            'host_id': user_id,
+            'players': [user_id],
+            'names': {user_id: user_data.get('first_name', 'Player')},
+            'alive': [],
+            'choices': {},  # user_id -> weapon index for the current round
+            'variant': RPS_DEFAULT_VARIANT,
+            'round': 0,
+            'status': 'open',
+            'deadline': None,
+            'last_activity': time.time(),
+            'lock': threading.Lock()
+        }
+        logger.info(f"Battle royale {royale_id} created by {user_id}")
+        self.show_royale_lobby(chat_id, message_id, user_id, royale_id)
+
+    def show_royale_lobby(self, chat_id, message_id, user_id, royale_id):
+        royale = royale_games.get(royale_id)
+        if not royale or royale['status'] != 'open':
+            self.edit_message(chat_id, message_id, "❌ This battle has already started or no longer exists.", {
+                'inline_keyboard': [[{'text': '⚔️ Battle Royale', 'callback_data': 'royale_menu'}]]
+            })
+            return
+        
+        names = royale['names']
+        lobby_text = (
+            f"⚔️ <b>RPS Battle Royale</b> ⚔️\n\n"
+            f"Host: {names[royale['host_id']]}\n"
+            f"Rules: {RPS_RULES[royale['variant']]['name']}\n"
+            f"Players ({len(royale['players'])}/{ROYALE_MAX_PLAYERS}): "
+            f"{', '.join(names[uid] for uid in royale['players'][:20])}"
+            f"{' ...' if len(royale['players']) > 20 else ''}\n\n"
+            f"At least {ROYALE_MIN_PLAYERS} players are needed to start."
+        )
+        
+        keyboard_buttons = []
+        if user_id not in names:
+            keyboard_buttons.append([{'text': '⚔️ Join Battle', 'callback_data': f'royale_join_{royale_id}'}])
+        if user_id == royale['host_id']:
+            keyboard_buttons.append([
+                {'text': f"📜 {rules['name']}", 'callback_data': f'royalevar_{variant}_{royale_id}'}
+                for variant, rules in RPS_RULES.items() if variant != royale['variant']
+            ])
+            if len(royale['players']) >= ROYALE_MIN_PLAYERS:
+                keyboard_buttons.append([{'text': '▶️ Start Battle', 'callback_data': f'royale_start_{royale_id}'}])
+            keyboard_buttons.append([{'text': '❌ Cancel Battle', 'callback_data': f'royale_cancel_{royale_id}'}])
+        keyboard_buttons.append([{'text': '🔄 Refresh', 'callback_data': f'royale_view_{royale_id}'}])
+        keyboard_buttons.append([{'text': '🎮 Back to Games', 'callback_data': 'show_games'}])
+        
+        self.edit_message(chat_id, message_id, lobby_text, {'inline_keyboard': keyboard_buttons})
+
+    def select_royale_variant(self, chat_id, message_id, user_id, variant, royale_id):
+        royale = royale_games.get(royale_id)
+        if royale and royale['host_id'] == user_id and royale['status'] == 'open' and variant in RPS_RULES:
+            royale['variant'] = variant
+            royale['last_activity'] = time.time()
+        self.show_royale_lobby(chat_id, message_id, user_id, royale_id)
+
+    def join_royale(self, chat_id, message_id, user_id, user_data, royale_id):
+        royale = royale_games.get(royale_id)
+        if royale and royale['status'] == 'open' and user_id not in royale['names'] and len(royale['players']) < ROYALE_MAX_PLAYERS:
+            self.register_user(user_data)
+            royale['players'].append(user_id)
+            royale['names'][user_id] = user_data.get('first_name', 'Player')
+            royale['last_activity'] = time.time()
+        self.show_royale_lobby(chat_id, message_id, user_id, royale_id)
+
+    def cancel_royale(self, chat_id, message_id, user_id, royale_id):
+        royale = royale_games.get(royale_id)
+        if not royale or royale['host_id'] != user_id or royale['status'] != 'open':
+            return
+        
+        del royale_games[royale_id]
+        for player_id in royale['players']:
+            if player_id != user_id:
+                self.send_message(player_id, "❌ The battle royale you joined was cancelled by the host.")
+        self.show_royale_menu(chat_id, message_id)
+
+    def start_royale(self, chat_id, message_id, user_id, royale_id):
+        royale = royale_games.get(royale_id)
+        if not royale or royale['host_id'] != user_id or royale['status'] != 'open':
+            return
+        if len(royale['players']) < ROYALE_MIN_PLAYERS:
+            self.show_royale_lobby(chat_id, message_id, user_id, royale_id)
+            return
+        
+        royale['status'] = 'running'
+        royale['alive'] = list(royale['players'])
+        logger.info(f"Battle royale {royale_id} started with {len(royale['alive'])} players")
+        self.edit_message(chat_id, message_id, "▶️ <b>Battle started!</b>\n\nPick your weapon in the next message.", None)
+        self.run_in_background(self.start_royale_round, royale_id, "")
+
+    def start_royale_round(self, royale_id, summary):
+        """Send every surviving player the round's weapon picker, with last round's summary on top"""
+        royale = royale_games.get(royale_id)
+        if not royale:
+            return
+        
+        with royale['lock']:
+            royale['round'] += 1
+            royale['choices'] = {}
+            royale['deadline'] = None  # Set once every picker has been sent
+            round_number = royale['round']
+            alive = list(royale['alive'])
+        
+        round_text = (
+            f"{summary}"
+            f"⚔️ <b>Battle Royale - Round {round_number}</b> ⚔️\n\n"
+            f"{len(alive)} players left. Pick your weapon within {ROYALE_ROUND_SECONDS} seconds!"
+        )
+        rules = RPS_RULES[royale['variant']]
         keyboard = {
             'inline_keyboard': [
-                [{'text': '🎮 Create New Game', 'callback_data': 'show_games'}],
-                [{'text': '🔍 Find Active Games', 'callback_data': 'find_games'}]
+                [{'text': f"{rules['emojis'][weapon]} {weapon.title()}", 'callback_data': f'rpsr_{weapon}_{round_number}_{royale_id}'} for weapon in row]
+                for row in rules['button_rows']
             ]
         }
+        for player_id in alive:
+            self.send_message(player_id, round_text, keyboard)
+        
+        # The clock starts after the fan-out, so the last players sent to get the full time too
+        with royale['lock']:
+            handle = turn_scheduler.schedule(ROYALE_ROUND_SECONDS, lambda: self.run_in_background(self.resolve_royale, royale_id, handle))
+            royale['deadline'] = handle
+            everyone_picked = len(royale['choices']) == len(royale['alive'])
+        if everyone_picked:
+            self.resolve_royale(royale_id, handle)
+
+    def run_in_background(self, target, *args):
+        """Game starts and fan-outs can be hundreds of sends; keep them off the scheduler and update threads"""
+        threading.Thread(target=target, args=args, name=f'{target.__name__}-bg', daemon=True).start()
+
+    def handle_royale_choice(self, chat_id, message_id, user_id, royale_id, round_number, weapon):
+        royale = royale_games.get(royale_id)
+        if not royale or weapon not in RPS_RULES[royale['variant']]['position']:
+            return
+        rules = RPS_RULES[royale['variant']]
+        
+        with royale['lock']:
+            if royale['round'] != round_number or royale['status'] != 'running':
+                return  # Button from an earlier round's picker
+            if user_id not in royale['alive'] or user_id in royale['choices']:
+                return
+            royale['choices'][user_id] = rules['position'][weapon]
+            waiting = len(royale['alive']) - len(royale['choices'])
+            deadline = royale['deadline']
+        
+        self.edit_message(chat_id, message_id, (
+            f"⚔️ <b>Battle Royale - Round {royale['round']}</b> ⚔️\n\n"
+            f"You picked {rules['emojis'][weapon]} {weapon.title()}.\n"
+            f"Waiting for {waiting} more player{'s' if waiting != 1 else ''}..."
+        ))
+        if not waiting and deadline is not None:
+            # Without a deadline the pickers are still going out; start_royale_round resolves then
+            self.run_in_background(self.resolve_royale, royale_id, deadline)
+
+    def resolve_royale(self, royale_id, handle):
+        """Resolve the round once everyone picked or the deadline hit; players who didn't pick are out"""
+        royale = royale_games.get(royale_id)
+        if not royale:
+            return
         
-        self.edit_message(chat_id, message_id, cancellation_text, keyboard)
+        with royale['lock']:
+            if royale['deadline'] != handle:
+                return  # Already resolved
+            royale['deadline'] = None
+            turn_scheduler.cancel(handle)
+            
+            rules = RPS_RULES[royale['variant']]
+            choices = royale['choices']
+            idle = [uid for uid in royale['alive'] if uid not in choices]
+            if not choices:
+                survivors, counts = [], [0] * len(rules['weapons'])
+            else:
+                survivors, counts = resolve_royale_round(choices, rules['outcomes'])
+            out = [uid for uid in royale['alive'] if uid not in survivors]
+            royale['alive'] = survivors
+        
+        logger.info(f"Battle royale {royale_id} round {royale['round']}: {len(survivors)} survive, {len(out)} out ({len(idle)} idle)")
+        weapon_line = "  ".join(f"{rules['emojis'][weapon]} {counts[i]}" for i, weapon in enumerate(rules['weapons']) if counts[i])
+        summary = f"🏁 <b>Round {royale['round']} results</b>\n{weapon_line or 'Nobody picked a weapon.'}\n"
+        
+        for player_id in out:
+            reason = "You didn't pick a weapon in time." if player_id in idle else "Your weapon was beaten."
+            self.send_message(player_id, f"{summary}\n💀 <b>You're out!</b> {reason}\n{len(survivors)} players remain.")
+        
+        if len(survivors) <= 1:
+            self.finish_royale(royale_id, survivors[0] if survivors else None, summary)
+        elif not out:
+            self.start_royale_round(royale_id, f"{summary}🤝 Stalemate - nobody is out. Go again!\n\n")
+        else:
+            self.start_royale_round(royale_id, f"{summary}✅ You survived! {len(out)} players were knocked out.\n\n")
+
+    def finish_royale(self, royale_id, winner_id, summary):
+        royale = royale_games.pop(royale_id, None)
+        if not royale:
+            return
+        royale['status'] = 'finished'
+        
+        if winner_id is None:
+            logger.info(f"Battle royale {royale_id} ended without a winner")
+            return
+        
+        # One result per participant, however many rounds they lasted
+        for player_id in royale['players']:
+            self.update_user_game_result(player_id, 'rps', player_id == winner_id)
+        
+        logger.info(f"Battle royale {royale_id} won by {winner_id} after {royale['round']} rounds")
+        self.send_message(winner_id, f"{summary}\n🏆 <b>YOU WON THE BATTLE ROYALE!</b> 🏆\n\nLast one standing out of {len(royale['players'])} players!", {
+            'inline_keyboard': [[{'text': '🎮 Play Other Games', 'callback_data': 'show_games'}]]
+        })
+        self.check_prize_eligibility(winner_id)
+
+    def create_reaction_party(self, chat_id, message_id, user_id, user_data):
+        self.register_user(user_data)
+        session_id = generate_session_id()
+        player_name = user_data.get('first_name', 'Player')
+        multiplayer_sessions[session_id] = {
+            'game_type': 'reaction',
+            'party': True,
+            'host_id': user_id,
+            'host_name': player_name,
+            'players': [user_id],
+            'player_names': {user_id: player_name},
+            'status': 'waiting',
+            'created_at': time.time()
+        }
+        logger.info(f"Reaction party {session_id} created by {user_id}")
+        self.show_reaction_party_lobby(chat_id, message_id, user_id, session_id)
+
+    def show_reaction_party_lobby(self, chat_id, message_id, user_id, session_id):
+        session = multiplayer_sessions.get(session_id)
+        if not session or not session.get('party') or session['status'] != 'waiting':
+            self.edit_message(chat_id, message_id, "❌ This party has already started or no longer exists.", {
+                'inline_keyboard': [[{'text': '🔍 Find Active Games', 'callback_data': 'find_games'}]]
+            })
+            return
+        
+        names = session['player_names']
+        lobby_text = (
+            f"⚡ <b>Reaction Party</b> ⚡\n\n"
+            f"Host: {session['host_name']}\n"
+            f"Players ({len(session['players'])}/{REACTION_PARTY_MAX_PLAYERS}): "
+            f"{', '.join(names[uid] for uid in session['players'][:20])}"
+            f"{' ...' if len(session['players']) > 20 else ''}\n\n"
+            f"Everyone races the same green light - the fastest taps score the most.\n"
+            f"At least {REACTION_PARTY_MIN_PLAYERS} players are needed to start."
+        )
+        
+        keyboard_buttons = []
+        if user_id not in names:
+            keyboard_buttons.append([{'text': '⚡ Join Party', 'callback_data': f'party_join_{session_id}'}])
+        if user_id == session['host_id']:
+            if len(session['players']) >= REACTION_PARTY_MIN_PLAYERS:
+                keyboard_buttons.append([{'text': '▶️ Start Party', 'callback_data': f'party_start_{session_id}'}])
+            keyboard_buttons.append([{'text': '❌ Cancel Party', 'callback_data': f'cancel_{session_id}'}])
+        elif user_id in names:
+            keyboard_buttons.append([{'text': '👋 Leave Party', 'callback_data': f'quit_{session_id}'}])
+        keyboard_buttons.append([{'text': '🔄 Refresh', 'callback_data': f'party_view_{session_id}'}])
+        keyboard_buttons.append([{'text': '🎮 Back to Games', 'callback_data': 'show_games'}])
+        
+        self.edit_message(chat_id, message_id, lobby_text, {'inline_keyboard': keyboard_buttons})
+
+    def join_reaction_party(self, chat_id, message_id, user_id, user_data, session_id):
+        session = multiplayer_sessions.get(session_id)
+        if (session and session.get('party') and session['status'] == 'waiting'
+                and user_id not in session['player_names'] and len(session['players']) < REACTION_PARTY_MAX_PLAYERS):
+            self.register_user(user_data)
+            session['players'].append(user_id)
+            session['player_names'][user_id] = user_data.get('first_name', 'Player')
+        self.show_reaction_party_lobby(chat_id, message_id, user_id, session_id)
+
+    def start_reaction_party(self, chat_id, message_id, user_id, session_id):
+        session = multiplayer_sessions.get(session_id)
+        if not session or not session.get('party') or session['host_id'] != user_id or session['status'] != 'waiting':
+            return
+        if len(session['players']) < REACTION_PARTY_MIN_PLAYERS:
+            self.show_reaction_party_lobby(chat_id, message_id, user_id, session_id)
+            return
+        
+        session['status'] = 'active'
+        logger.info(f"Reaction party {session_id} started with {len(session['players'])} players")
+        self.edit_message(chat_id, message_id, "▶️ <b>Party started!</b>\n\nGet ready in the next message.", None)
+        self.start_multiplayer_game(chat_id, message_id, user_id, session_id)
+
+    def leave_reaction_party(self, session_id, user_id):
+        """Drop one player from a party; the rest play on while at least two remain"""
+        session = multiplayer_sessions[session_id]
+        if session['status'] == 'waiting':
+            if user_id == session['host_id']:
+                return  # The host cancels instead
+            session['players'].remove(user_id)
+            del session['player_names'][user_id]
+            self.send_message(user_id, "👋 You left the Reaction Party.")
+            return
+        
+        game_state = session['game_state']
+        session['players'].remove(user_id)
+        game_state['ready_players'].discard(user_id)
+        self.update_user_game_result(user_id, 'reaction', False)
+        self.send_message(user_id, "🏳️ <b>You left the Reaction Party.</b>", self.game_over_keyboard(session_id))
+        
+        if len(session['players']) < 2:
+            self.end_reaction_game(session_id)
+        elif game_state['current_phase'] == 'waiting_ready' and game_state['ready_players'] >= set(session['players']):
+            self.start_reaction_countdown(session_id)
+        elif game_state.get('round_active') and all(game_state['tap_times'][game_state['slots'][pid]] for pid in session['players']):
+            self.handle_reaction_round_end(session_id)
 
     def check_prize_eligibility(self, user_id):
         """Check if user is eligible for prize"""
@@ -2210,7 +4693,7 @@ class SimpleLocalBot:
 
     def handle_view_prize(self, chat_id, message_id, user_id):
         """View already claimed prize - shows fake first, then option for real"""
-        self.register_user({'id': user_id, 'first_name': 'Player'})
+        self.touch_user(user_id)
         
         if not game_scores[user_id].get('prize_claimed', False):
             # Haven't claimed yet
@@ -2236,11 +4719,16 @@ class SimpleLocalBot:
         keyboard = {'inline_keyboard': keyboard_buttons}
         self.edit_message(chat_id, message_id, fake_prize_text, keyboard)
 
-    def handle_callback_query(self, callback_query):
+    def handle_callback_query(self, callback_query, received_ns):
         query_id = callback_query['id']
         user_data = callback_query['from']
-        chat_id = callback_query['message']['chat']['id']
-        message_id = callback_query['message']['message_id']
+        if 'message' in callback_query:
+            chat_id = callback_query['message']['chat']['id']
+            message_id = callback_query['message']['message_id']
+        else:
+            # Button on an inline-mode message: edit_message targets it by inline_message_id
+            chat_id = None
+            message_id = callback_query['inline_message_id']
         data = callback_query['data']
         user_id = user_data['id']
         
@@ -2252,14 +4740,104 @@ class SimpleLocalBot:
                 self.show_game_menu(chat_id, message_id, user_id)
             elif data == 'show_scoreboard':
                 self.show_scoreboard(chat_id, message_id, user_id)
+            elif data.startswith('leaderboard_'):
+                period = data.split('_', 1)[1]
+                self.show_leaderboard(chat_id, message_id, user_id, period)
             elif data.startswith('invite_'):
                 game_type = data.split('_', 1)[1]
                 self.create_multiplayer_invitation(chat_id, message_id, user_id, user_data, game_type)
+            elif data == 'toggle_digest':
+                self.toggle_digest_mode(chat_id, message_id, user_id)
+            elif data == 'solo_qa':
+                self.show_solo_qa_menu(chat_id, message_id)
+            elif data.startswith('soloqa_cat_'):
+                self.show_solo_qa_difficulty(chat_id, message_id, data.split('_', 2)[2])
+            elif data.startswith('soloqa_start_'):
+                # Category names may contain '_'; difficulties never do
+                parts = data.split('_', 2)[2].rsplit('_', 1)
+                if len(parts) == 2:
+                    self.start_solo_qa(chat_id, message_id, user_id, parts[0], parts[1])
+            elif data == 'soloqa_next':
+                self.ask_solo_question(chat_id, user_id)
+            elif data == 'soloqa_skip':
+                self.skip_solo_question(chat_id, user_id)
+            elif data == 'soloqa_quit':
+                solo_qa_sessions.pop(user_id, None)
+                self.show_game_menu(chat_id, message_id, user_id)
+            elif data == 'group_menu':
+                self.show_group_game_picker(chat_id, message_id)
+            elif data.startswith('group_new_'):
+                self.create_shared_game(chat_id, message_id, user_id, user_data, data.split('_', 2)[2])
+            elif data == 'royale_menu':
+                self.show_royale_menu(chat_id, message_id)
+            elif data == 'royale_new':
+                self.create_royale(chat_id, message_id, user_id, user_data)
+            elif data.startswith('royale_view_'):
+                self.show_royale_lobby(chat_id, message_id, user_id, data.split('_', 2)[2])
+            elif data.startswith('royale_join_'):
+                self.join_royale(chat_id, message_id, user_id, user_data, data.split('_', 2)[2])
+            elif data.startswith('royale_start_'):
+                self.start_royale(chat_id, message_id, user_id, data.split('_', 2)[2])
+            elif data == 'party_new':
+                self.create_reaction_party(chat_id, message_id, user_id, user_data)
+            elif data.startswith('party_view_'):
+                self.show_reaction_party_lobby(chat_id, message_id, user_id, data.split('_', 2)[2])
+            elif data.startswith('party_join_'):
+                self.join_reaction_party(chat_id, message_id, user_id, user_data, data.split('_', 2)[2])
+            elif data.startswith('party_start_'):
+                self.start_reaction_party(chat_id, message_id, user_id, data.split('_', 2)[2])
+            elif data.startswith('royale_cancel_'):
+                self.cancel_royale(chat_id, message_id, user_id, data.split('_', 2)[2])
+            elif data.startswith('rpsvar_'):
+                parts = data.split('_', 2)
+                if len(parts) == 3:
+                    self.handle_rps_variant_selection(chat_id, message_id, user_id, parts[1], parts[2])
+            elif data.startswith('royalevar_'):
+                parts = data.split('_', 2)
+                if len(parts) == 3:
+                    self.select_royale_variant(chat_id, message_id, user_id, parts[1], parts[2])
+            elif data.startswith('rpsr_'):
+                parts = data.split('_', 3)
+                if len(parts) == 4:
+                    self.handle_royale_choice(chat_id, message_id, user_id, parts[3], int(parts[2]), parts[1])
+            elif data == 'tourney_menu':
+                self.show_tournament_menu(chat_id, message_id)
+            elif data.startswith('tourney_game_'):
+                self.show_tournament_formats(chat_id, message_id, data.split('_', 2)[2])
+            elif data.startswith('tourney_new_'):
+                parts = data.split('_', 3)
+                if len(parts) == 4:
+                    self.create_tournament(chat_id, message_id, user_id, user_data, parts[2], parts[3])
+            elif data.startswith('tourney_view_'):
+                self.show_tournament_lobby(chat_id, message_id, user_id, data.split('_', 2)[2])
+            elif data.startswith('tourney_join_'):
+                self.join_tournament(chat_id, message_id, user_id, user_data, data.split('_', 2)[2])
+            elif data.startswith('tourney_start_'):
+                self.start_tournament(chat_id, message_id, user_id, data.split('_', 2)[2])
+            elif data.startswith('tourney_cancel_'):
+                self.cancel_tournament(chat_id, message_id, user_id, data.split('_', 2)[2])
             elif data == 'find_games':
                 self.show_active_games(chat_id, message_id)
             elif data.startswith('join_'):
                 session_id = data.split('_', 1)[1]
                 self.handle_invite_acceptance(chat_id, message_id, user_id, user_data, session_id)
+            elif data.startswith('series_'):
+                parts = data.split('_', 2)
+                # Only the formats the invitation offers, 1 being a single game
+                if len(parts) == 3 and parts[1] in [str(best_of) for best_of in (1,) + SERIES_OPTIONS]:
+                    self.handle_series_selection(chat_id, message_id, user_id, int(parts[1]), parts[2])
+            elif data.startswith('watch_'):
+                session_id = data.split('_', 1)[1]
+                self.handle_watch_request(chat_id, message_id, user_id, session_id)
+            elif data.startswith('unwatch_'):
+                session_id = data.split('_', 1)[1]
+                self.handle_stop_watching(chat_id, message_id, user_id, session_id)
+            elif data.startswith('rematch_'):
+                session_id = data.split('_', 1)[1]
+                self.handle_rematch_request(chat_id, message_id, user_id, session_id)
+            elif data.startswith('quit_'):
+                session_id = data.split('_', 1)[1]
+                self.handle_quit_game(chat_id, message_id, user_id, session_id)
             elif data.startswith('cancel_'):
                 session_id = data.split('_', 1)[1]
                 self.handle_game_cancellation(chat_id, message_id, user_id, session_id)
@@ -2284,8 +4862,7 @@ class SimpleLocalBot:
                     choice = parts[1]
                     session_id = "_".join(parts[2:])
                     
-                    choice_emojis = {'rock': '🪨', 'paper': '📄', 'scissors': '✂️', 'gun': '🔫', 'judo': '🥋'}
-                    emoji = choice_emojis.get(choice, '✅')
+                    emoji = RPS_EMOJIS.get(choice, '✅')
                     self.answer_callback_query(callback_query['id'], f"{emoji} {choice.title()} selected!")
                     self.handle_rps_choice(session_id, user_id, choice)
             elif data.startswith('reaction_ready_'):
@@ -2296,7 +4873,7 @@ class SimpleLocalBot:
                 session_id = data.split('_', 2)[2]
                 logger.info(f"Processing reaction tap for user {user_id} in session {session_id}")
                 self.answer_callback_query(callback_query['id'], "⚡ TAPPED!")
-                self.handle_reaction_tap(session_id, user_id)
+                self.handle_reaction_tap(session_id, user_id, received_ns)
             elif data.startswith('reaction_wrong_'):
                 session_id = data.split('_', 2)[2]
                 self.answer_callback_query(callback_query['id'], "❌ Wrong color!")
@@ -2317,7 +4894,8 @@ class SimpleLocalBot:
         except Exception as e:
             logger.error(f"Error handling callback query {data}: {e}")
 
-    def process_update(self, update):
+    def process_update(self, update, received_ns):
+        """Dispatch one update; received_ns is when its getUpdates batch arrived"""
         if 'message' in update:
             message = update['message']
             chat_id = message['chat']['id']
@@ -2328,11 +4906,15 @@ class SimpleLocalBot:
                 if text.startswith('/start'):
                     self.handle_start(chat_id, user_data)
                 elif text.startswith('/play'):
-                    self.handle_play_command(chat_id, user_data)
+                    self.handle_play_command(chat_id, user_data, message['chat'])
+                elif message['chat'].get('type') != 'private':
+                    return  # Ignore group chatter; group games are driven by buttons
                 else:
-                    # Check if this is Q&A Duel input
+                    # A live Q&A Duel waiting on this user comes before solo practice
                     if self.handle_qa_text_input(chat_id, user_data['id'], text):
                         return  # Text was handled by Q&A game
+                    if self.handle_solo_qa_answer(chat_id, user_data['id'], text):
+                        return
                     
                     response_text = (
                         "🤖 I am not sure what you mean.\n\n"
@@ -2341,7 +4923,10 @@ class SimpleLocalBot:
                     self.send_message(chat_id, response_text)
         
         elif 'callback_query' in update:
-            self.handle_callback_query(update['callback_query'])
+            self.handle_callback_query(update['callback_query'], received_ns)
+        
+        elif 'inline_query' in update:
+            self.handle_inline_query(update['inline_query'])
 
     def get_updates(self, offset=None):
         try:
@@ -2361,6 +4946,9 @@ class SimpleLocalBot:
         while True:
             try:
                 result = self.get_updates(offset)
+                # Stamped once per batch: updates are handled one by one, and a tap's
+                # timing must not include the API calls made for the updates before it
+                received_ns = time.perf_counter_ns()
                 
                 if not result.get('ok'):
                     logger.error(f"Error getting updates: {result}")
@@ -2369,7 +4957,7 @@ class SimpleLocalBot:
                 
                 for update in result.get('result', []):
                     try:
-                        self.process_update(update)
+                        self.process_update(update, received_ns)
                         offset = update['update_id'] + 1
                     except Exception as e:
                         logger.error(f"Error processing update: {e}")
@@ -2383,10 +4971,36 @@ async def health_check(request):
     """Health check endpoint for Railway deployment."""
     return web.Response(text="Railway Bot is running!", status=200)
 
+async def metrics(request):
+    """Delivery metrics endpoint"""
+    return web.json_response({
+        'delivery': delivery_stats,
+        'sessions': dict(session_stats, active=len(multiplayer_sessions)),
+        'reaction_request_rtt': request_rtt.snapshot(),
+        'reaction_reveal_skew': reveal_skew_summary(),
+        'active_users': len(active_users)
+    })
+
+def reveal_skew_summary():
+    """Spread between the first and last player's target reveal over recent rounds"""
+    with reveal_skews_lock:
+        recent = list(reveal_skews)
+    if not recent:
+        return {'rounds': 0}
+    skews = sorted(recent)
+    return {
+        'rounds': len(skews),
+        'last_ms': round(recent[-1], 1),
+        'median_ms': round(skews[len(skews) // 2], 1),
+        'p90_ms': round(skews[int(len(skews) * 0.9)], 1),
+        'max_ms': round(skews[-1], 1)
+    }
+
 async def start_health_server():
     """Start health server on port 8080"""
     app = web.Application()
     app.router.add_get('/health', health_check)
+    app.router.add_get('/metrics', metrics)
     app.router.add_get('/', health_check)
     
     runner = web.AppRunner(app)